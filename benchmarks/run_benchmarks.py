@@ -0,0 +1,222 @@
+"""Scaling benchmarks for the estimators and loaders.
+
+Usage:
+    python benchmarks/run_benchmarks.py --out benchmarks/results/latest.json
+    python benchmarks/run_benchmarks.py --quick --compare benchmarks/results/baseline.json --threshold 0.25
+
+Each case is timed over a grid of sizes (series, years, controls, events, bootstrap reps);
+results are persisted as JSON and, in compare mode, cases slower than ``1 + threshold``
+times the stored baseline are flagged and the exit code is 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+for p in (ROOT / "src", Path(__file__).resolve().parent):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from synthetic import synthetic_data_tree, synthetic_panel  # noqa: E402
+
+from slr_bucket.econometrics.event_study import (  # noqa: E402
+    block_bootstrap_jump,
+    event_study_regression,
+    jump_estimator,
+    pooled_event_study,
+)
+from slr_bucket.instrument import Recorder  # noqa: E402
+from slr_bucket.io import build_data_catalog  # noqa: E402
+from slr_bucket.outcomes import stack_outcomes  # noqa: E402
+
+BINS = [(-60, -41), (-40, -21), (-20, -1), (0, 0), (1, 20), (21, 40), (41, 60)]
+
+FULL_GRID = {
+    "series": [1, 4, 16],
+    "years": [1, 3, 10],
+    "controls": [0, 3, 8],
+    "events": [1, 3],
+    "reps": [20, 100],
+}
+QUICK_GRID = {"series": [1, 4], "years": [1, 3], "controls": [3], "events": [1], "reps": [20]}
+
+
+def case_jump_estimator(p: dict[str, Any]) -> Callable[[], Any]:
+    panel, events = synthetic_panel(1, p["years"], p["controls"], p["events"])
+    ctrls = [c for c in panel.columns if c.startswith("ctrl_")]
+    return lambda: [jump_estimator(panel, "y_abs_bps", e, 20, controls=ctrls) for e in events]
+
+
+def case_block_bootstrap_jump(p: dict[str, Any]) -> Callable[[], Any]:
+    panel, events = synthetic_panel(1, p["years"], p["controls"], 1)
+    ctrls = [c for c in panel.columns if c.startswith("ctrl_")]
+    return lambda: block_bootstrap_jump(panel, "y_abs_bps", events[0], 20, controls=ctrls, reps=p["reps"])
+
+
+def case_event_study_regression(p: dict[str, Any]) -> Callable[[], Any]:
+    panel, events = synthetic_panel(1, p["years"], p["controls"], p["events"])
+    ctrls = [c for c in panel.columns if c.startswith("ctrl_")]
+    return lambda: [event_study_regression(panel, "y_abs_bps", e, BINS, controls=ctrls) for e in events]
+
+
+def case_pooled_event_study(p: dict[str, Any]) -> Callable[[], Any]:
+    panel, events = synthetic_panel(p["series"], p["years"], p["controls"], p["events"])
+    ctrls = [c for c in panel.columns if c.startswith("ctrl_")]
+    return lambda: [
+        pooled_event_study(panel, "y_abs_bps", e, BINS, group_col="treasury_based", fe_col="series", controls=ctrls)
+        for e in events
+    ]
+
+
+_TMP_DIRS: list[Path] = []
+
+
+def _tree(p: dict[str, Any]) -> Path:
+    tmp = Path(tempfile.mkdtemp(prefix="slr_bench_"))
+    _TMP_DIRS.append(tmp)
+    return synthetic_data_tree(tmp, n_series=p["series"], years=p["years"])
+
+
+def case_stack_outcomes(p: dict[str, Any]) -> Callable[[], Any]:
+    data_dir = _tree(p)
+    return lambda: stack_outcomes(data_dir / "series")
+
+
+def case_build_data_catalog(p: dict[str, Any]) -> Callable[[], Any]:
+    data_dir = _tree(p)
+    return lambda: build_data_catalog(data_dir)
+
+
+# case -> grid axes it scales over (others are held at their first value)
+CASES: dict[str, tuple[Callable[[dict[str, Any]], Callable[[], Any]], tuple[str, ...]]] = {
+    "jump_estimator": (case_jump_estimator, ("years", "controls", "events")),
+    "block_bootstrap_jump": (case_block_bootstrap_jump, ("years", "reps")),
+    "event_study_regression": (case_event_study_regression, ("years", "controls", "events")),
+    "pooled_event_study": (case_pooled_event_study, ("series", "years", "controls")),
+    "stack_outcomes": (case_stack_outcomes, ("series", "years")),
+    "build_data_catalog": (case_build_data_catalog, ("series", "years")),
+}
+
+
+def _points(grid: dict[str, list], axes: tuple[str, ...]) -> list[dict[str, Any]]:
+    """One-axis-at-a-time sweep around the smallest configuration (a curve per axis)."""
+    base = {k: v[0] for k, v in grid.items()}
+    pts = [dict(base)]
+    for axis in axes:
+        for v in grid[axis][1:]:
+            pts.append({**base, axis: v})
+    return pts
+
+
+def _key(case: str, params: dict[str, Any]) -> str:
+    return case + "|" + ",".join(f"{k}={params[k]}" for k in sorted(params))
+
+
+def run(grid: dict[str, list], cases: list[str], repeat: int, trace_memory: bool) -> list[dict[str, Any]]:
+    results = []
+    for case in cases:
+        factory, axes = CASES[case]
+        for params in _points(grid, axes):
+            fn = factory(params)
+            fn()  # warm-up (imports, caches)
+            rec = Recorder()
+            rec.configure(enabled=True, trace_memory=trace_memory)
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                with rec.stage(case):
+                    fn()
+                times.append(time.perf_counter() - t0)
+            rec.configure(enabled=False)
+            r = rec.records[case]
+            results.append({
+                "key": _key(case, params),
+                "case": case,
+                "params": params,
+                "best_s": min(times),
+                "median_s": sorted(times)[len(times) // 2],
+                "cpu_s": r.cpu_s / repeat,
+                "peak_mem_mb": r.peak_mem_mb,
+            })
+            print(f"{case:<24} {params} best={min(times):.4f}s", file=sys.stderr)
+    return results
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    base = {r["key"]: r for r in baseline.get("results", [])}
+    flagged = []
+    for r in results:
+        b = base.get(r["key"])
+        if b is None or not b.get("best_s"):
+            continue
+        ratio = r["best_s"] / b["best_s"]
+        r["baseline_best_s"] = b["best_s"]
+        r["ratio"] = ratio
+        if ratio > 1.0 + threshold:
+            flagged.append({"key": r["key"], "ratio": round(ratio, 3), "best_s": r["best_s"], "baseline_best_s": b["best_s"]})
+    return flagged
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, default=ROOT / "benchmarks" / "results" / "latest.json")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown before flagging.")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated subset of cases.")
+    parser.add_argument("--quick", action="store_true", help="Small grid for smoke runs.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--trace-memory", action="store_true", help="Record tracemalloc peak memory per case.")
+    for axis in FULL_GRID:
+        parser.add_argument(f"--{axis}", default=None, help=f"Comma-separated values for the {axis} axis.")
+    args = parser.parse_args(argv)
+
+    grid = {k: list(v) for k, v in (QUICK_GRID if args.quick else FULL_GRID).items()}
+    for axis in FULL_GRID:
+        raw = getattr(args, axis)
+        if raw:
+            parse = float if axis == "years" else int
+            grid[axis] = [parse(x) for x in raw.split(",")]
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        parser.error(f"unknown cases {unknown}; choose from {sorted(CASES)}")
+
+    warnings.simplefilter("ignore")
+    try:
+        results = run(grid, cases, max(args.repeat, 1), args.trace_memory)
+    finally:
+        for d in _TMP_DIRS:
+            shutil.rmtree(d, ignore_errors=True)
+    payload: dict[str, Any] = {
+        "created_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "grid": grid,
+        "results": results,
+    }
+    status = 0
+    if args.compare is not None:
+        flagged = compare(results, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+        payload["comparison"] = {"baseline": str(args.compare), "threshold": args.threshold, "flagged": flagged}
+        for f in flagged:
+            print(f"SLOWER {f['key']}: x{f['ratio']} ({f['baseline_best_s']:.4f}s -> {f['best_s']:.4f}s)", file=sys.stderr)
+        status = 1 if flagged else 0
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+    print(json.dumps({"out": str(args.out), "n_results": len(results), "status": status}))
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
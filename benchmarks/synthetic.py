@@ -0,0 +1,74 @@
+"""Synthetic panels and data trees for the benchmark suite (no network, no real data)."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+EVENT_POOL = ["2020-04-01", "2021-03-19", "2021-03-31", "2019-09-17", "2020-03-15", "2022-03-16"]
+
+
+def synthetic_panel(
+    n_series: int = 4,
+    years: float = 3.0,
+    n_controls: int = 3,
+    n_events: int = 3,
+    seed: int = 0,
+    start: str = "2019-01-01",
+) -> tuple[pd.DataFrame, list[str]]:
+    """Long panel (date, series, treasury_based, y_abs_bps, ctrl_*) with a jump at each event."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=int(252 * years))
+    events = [e for e in EVENT_POOL if dates[0] <= pd.Timestamp(e) <= dates[-1]][:n_events]
+    if len(events) < n_events:
+        # fall back to evenly spaced dates inside the sample
+        extra = dates[np.linspace(60, len(dates) - 60, n_events - len(events)).astype(int)]
+        events += [d.strftime("%Y-%m-%d") for d in extra]
+
+    n = len(dates)
+    controls = {f"ctrl_{k}": rng.normal(size=n).cumsum() * 0.1 for k in range(n_controls)}
+    frames = []
+    for s in range(n_series):
+        y = 20 + rng.normal(scale=2.0, size=n)
+        for e in events:
+            y += 3.0 * (dates >= pd.Timestamp(e))
+        frames.append(pd.DataFrame({
+            "date": dates,
+            "series": f"s{s:03d}",
+            "treasury_based": s % 2,
+            "y_abs_bps": y,
+            **controls,
+        }))
+    return pd.concat(frames, ignore_index=True), events
+
+
+def synthetic_data_tree(root: Path, n_series: int = 4, years: float = 3.0, seed: int = 0) -> Path:
+    """Write a ``data/series`` tree shaped like the real inputs of ``stack_outcomes``."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2010-01-01", periods=int(252 * years))
+    n = len(dates)
+    series_dir = root / "data" / "series"
+    series_dir.mkdir(parents=True, exist_ok=True)
+
+    def walk(k: int, scale: float) -> dict[str, np.ndarray]:
+        return {f"c{i}": scale * rng.normal(size=n).cumsum() for i in range(k)}
+
+    arb = walk(n_series, 1.0)
+    pd.DataFrame({"date": dates, **{f"arb_{2 + i}": 20 + v for i, v in enumerate(arb.values())}}).to_parquet(
+        series_dir / "tips_treasury_implied_rf_2010.parquet", index=False
+    )
+    sf = walk(n_series, 1.0)
+    pd.DataFrame({"Date": dates, **{f"Treasury_SF_{2 + i}Y": -50 + v for i, v in enumerate(sf.values())}}).to_csv(
+        series_dir / "treasury_sf_output.csv", index=False
+    )
+    cip = walk(n_series, 0.5)
+    pd.DataFrame({"Date": dates, **{f"CIP_C{i:02d}_ln": v for i, v in enumerate(cip.values())}}).to_csv(
+        series_dir / "cip_spreads_3m_bps.csv", index=False
+    )
+    for idx in ["SPX", "NDX", "INDU"]:
+        spread = 30 + rng.normal(size=n).cumsum()
+        pd.DataFrame({"Date": dates, f"spread_{idx}": spread, f"spread_{idx}_filtered": spread}).to_csv(
+            series_dir / f"equity_spot_spread_{idx}.csv", index=False
+        )
+    return root / "data"
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import argparse
+import ast
 import json
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+INJECTED_TAG = "injected-parameters"
 
-def main() -> int:
-    nb_arg = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("notebooks/summary_pipeline.ipynb")
+
+def _resolve_notebook(nb_arg: Path) -> Path:
     nb_path = nb_arg if nb_arg.is_absolute() else Path(nb_arg)
     if not nb_path.exists() and nb_path.suffix == "":
         alt = nb_path.with_suffix(".ipynb")
@@ -14,30 +23,194 @@ def main() -> int:
             nb_path = alt
     if not nb_path.exists():
         raise FileNotFoundError(f"Notebook not found: {nb_path}")
+    return nb_path
+
 
-    repo_root = Path(__file__).resolve().parents[1]
-    src = repo_root / "src"
+def _require_nbclient():
+    src = REPO_ROOT / "src"
     if str(src) not in sys.path:
         sys.path.insert(0, str(src))
-
     try:
         from nbclient import NotebookClient
+        from nbclient.exceptions import CellExecutionError
         from nbformat import read, write
     except Exception as exc:  # noqa: BLE001
         raise RuntimeError("nbclient/nbformat are required for notebook smoke test. Install them in environment.") from exc
+    return NotebookClient, CellExecutionError, read, write
 
-    with nb_path.open("r", encoding="utf-8") as f:
-        nb = read(f, as_version=4)
 
-    client = NotebookClient(nb, timeout=1200, kernel_name="python3")
-    client.execute(cwd=str(repo_root))
+def _assign_end(source: str, variable: str) -> int | None:
+    """Last line (1-based) of the top-level ``variable = ...`` statement in a cell, if any."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:  # IPython magics etc.
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == variable for t in node.targets):
+            return node.end_lineno
+    return None
+
 
-    out = Path("outputs") / "summary_pipeline" / "latest" / "data" / "executed_notebook.ipynb"
+def inject_parameters(nb: Any, params: dict[str, Any], variable: str = "CONFIG") -> str:
+    """Override ``variable`` keys with ``params`` right where the config is defined.
+
+    The ``variable.update(...)`` line goes directly after the ``variable = {...}`` statement,
+    so code later in the same cell (config hash, run directory) already sees the overrides.
+    Falls back to a new cell after a ``parameters``-tagged cell. Returns where it injected.
+    """
+    line = f"{variable}.update(json.loads({json.dumps(json.dumps(params, default=str))}))  # {INJECTED_TAG}"
+    for i, cell in enumerate(nb["cells"]):
+        if cell["cell_type"] != "code":
+            continue
+        source = "".join(cell["source"]) if isinstance(cell["source"], list) else cell["source"]
+        end = _assign_end(source, variable)
+        if end is None:
+            continue
+        lines = source.splitlines()
+        cell["source"] = "\n".join([*lines[:end], "import json", line, *lines[end:]])
+        return f"cell {i}, line {end + 1}"
+    for i, cell in enumerate(nb["cells"]):
+        if "parameters" in cell.get("metadata", {}).get("tags", []):
+            new = {"cell_type": "code", "execution_count": None, "id": INJECTED_TAG, "outputs": [],
+                   "metadata": {"tags": [INJECTED_TAG]}, "source": f"import json\n{line}"}
+            try:
+                from nbformat import from_dict
+
+                new = from_dict(new)
+            except ImportError:
+                pass
+            nb["cells"].insert(i + 1, new)
+            return f"new cell {i + 1}"
+    raise ValueError(f"No cell assigns '{variable}' and no cell is tagged 'parameters'")
+
+
+def execute_one(
+    nb_path: str,
+    label: str,
+    params: dict[str, Any],
+    out_path: str,
+    variable: str = "CONFIG",
+    timeout: int = 1200,
+    cwd: str | None = None,
+) -> dict[str, Any]:
+    """Run one parameterized copy of the notebook in its own kernel (process-pool friendly).
+
+    A failing cell ends this run only: the partially executed notebook is still written and
+    the error is returned in the record instead of being raised.
+    """
+    NotebookClient, CellExecutionError, read, write = _require_nbclient()
+    record: dict[str, Any] = {"label": label, "params": params, "output": out_path, "status": "ok", "error": None}
+    t0 = time.perf_counter()
+    with Path(nb_path).open("r", encoding="utf-8") as f:
+        nb = read(f, as_version=4)
+    try:
+        if params:
+            record["injected_at"] = inject_parameters(nb, params, variable)
+        client = NotebookClient(nb, timeout=timeout, kernel_name="python3")
+        client.execute(cwd=cwd or str(REPO_ROOT))
+    except CellExecutionError as exc:
+        record.update(status="failed", error=str(exc).splitlines()[0] if str(exc) else repr(exc))
+    except Exception as exc:  # noqa: BLE001 -- keep the other modes running
+        record.update(status="error", error=f"{type(exc).__name__}: {exc}", traceback=traceback.format_exc())
+    record["seconds"] = round(time.perf_counter() - t0, 3)
+    record["cells_executed"] = sum(1 for c in nb["cells"] if c["cell_type"] == "code" and c.get("execution_count"))
+
+    out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     with out.open("w", encoding="utf-8") as f:
         write(nb, f)
-    print(json.dumps({"executed": str(nb_path), "output": str(out)}))
-    return 0
+    return record
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Execute a notebook, optionally once per mode/config in parallel kernels.")
+    parser.add_argument("notebook", nargs="?", type=Path, default=Path("notebooks/summary_pipeline.ipynb"))
+    parser.add_argument("--mode", action="append", default=None,
+                        help="Run once per mode (sets <variable>['mode']). Repeat for several modes.")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=JSON",
+                        help="Override applied to every run, e.g. --param windows=[20,60].")
+    parser.add_argument("--configs", type=Path, default=None,
+                        help="JSON file: object mapping label -> overrides (or a list of overrides).")
+    parser.add_argument("--variable", default="CONFIG", help="Name of the config dict to override.")
+    parser.add_argument("--jobs", type=int, default=1, help="Maximum concurrent kernels.")
+    parser.add_argument("--timeout", type=int, default=1200, help="Per-cell timeout in seconds.")
+    parser.add_argument("--cwd", type=Path, default=None, help="Kernel working directory (default: repo root).")
+    parser.add_argument("--out-dir", type=Path, default=None,
+                        help="Where executed notebooks and summary.json go (default: outputs/summary_pipeline/notebook_runs/<utc stamp>).")
+    return parser.parse_args(argv)
+
+
+def _runs(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    common = {}
+    for item in args.param:
+        key, _, raw = item.partition("=")
+        try:
+            common[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            common[key] = raw
+    runs: dict[str, dict[str, Any]] = {}
+    if args.configs is not None:
+        payload = json.loads(args.configs.read_text(encoding="utf-8"))
+        items = payload.items() if isinstance(payload, dict) else ((f"config{i}", p) for i, p in enumerate(payload))
+        runs.update({str(label): {**common, **p} for label, p in items})
+    for mode in args.mode or []:
+        runs[mode] = {**common, "mode": mode}
+    if common and not runs:
+        runs["default"] = common
+    return runs
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    nb_path = _resolve_notebook(args.notebook)
+    runs = _runs(args)
+    cwd = str(args.cwd.resolve()) if args.cwd else None
+
+    if not runs:
+        # Single run, written where the smoke test has always put it.
+        out = Path("outputs") / "summary_pipeline" / "latest" / "data" / "executed_notebook.ipynb"
+        record = execute_one(str(nb_path), nb_path.stem, {}, str(out), args.variable, args.timeout, cwd)
+        if record["status"] != "ok":
+            raise RuntimeError(f"Notebook {nb_path} failed: {record['error']}")
+        print(json.dumps({"executed": str(nb_path), "output": str(out)}))
+        return 0
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    out_dir = args.out_dir or Path("outputs") / "summary_pipeline" / "notebook_runs" / stamp
+    t0 = time.perf_counter()
+    records = []
+    jobs = max(1, min(args.jobs, len(runs)))
+    tasks = {
+        label: (str(nb_path), label, params, str(out_dir / label / "executed_notebook.ipynb"), args.variable, args.timeout, cwd)
+        for label, params in runs.items()
+    }
+    if jobs == 1:
+        records = [execute_one(*task) for task in tasks.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            futures = {ex.submit(execute_one, *task): label for label, task in tasks.items()}
+            for fut in as_completed(futures):
+                try:
+                    records.append(fut.result())
+                except Exception as exc:  # noqa: BLE001 -- worker died; report and keep going
+                    records.append({"label": futures[fut], "params": runs[futures[fut]], "status": "error",
+                                    "error": f"{type(exc).__name__}: {exc}"})
+                print(json.dumps({k: records[-1].get(k) for k in ("label", "status", "seconds")}), flush=True)
+    records.sort(key=lambda r: list(runs).index(r["label"]))
+
+    summary = {
+        "notebook": str(nb_path),
+        "utc_timestamp": stamp,
+        "jobs": jobs,
+        "wall_seconds": round(time.perf_counter() - t0, 3),
+        "sum_seconds": round(sum(r.get("seconds", 0.0) for r in records), 3),
+        "failed": [r["label"] for r in records if r["status"] != "ok"],
+        "runs": records,
+    }
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2, default=str), encoding="utf-8")
+    print(json.dumps({"summary": str(out_dir / "summary.json"), "failed": summary["failed"], "wall_seconds": summary["wall_seconds"]}))
+    return 1 if summary["failed"] else 0
 
 
 if __name__ == "__main__":
@@ -1,5 +1,19 @@
 """SLR bucket analysis toolkit."""
 
+import importlib
+
 __all__ = [
     "config",
 ]
+
+_SUBMODULES = {
+    "alignment", "cli", "config", "controls", "econometrics", "incremental", "instrument", "io", "memo", "outcomes",
+    "pipeline", "plotting", "resample", "runner", "sharing", "spreads", "summary", "sweep", "units", "validation", "warehouse",
+}
+
+
+def __getattr__(name: str):
+    # Submodules (and their heavy dependencies) load on first use: slr_bucket.runner, ...
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Any, Callable
+
+
+class LazyModule:
+    """Stand-in for ``import name as alias`` that imports on first attribute access.
+
+    Resolved attributes are cached on the proxy, so hot loops pay the indirection once.
+    """
+
+    def __init__(self, name: str, on_load: Callable[[], None] | None = None) -> None:
+        self.__dict__["_name"] = name
+        self.__dict__["_on_load"] = on_load
+        self.__dict__["_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            if self._on_load is not None:
+                self._on_load()
+            module = importlib.import_module(self._name)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def use_headless_matplotlib() -> None:
+    """Select the Agg backend unless pyplot is already up (e.g. notebooks) or MPLBACKEND is set."""
+    if "matplotlib.pyplot" in sys.modules or os.environ.get("MPLBACKEND"):
+        return
+    import matplotlib
+
+    matplotlib.use("Agg")
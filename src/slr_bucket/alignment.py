@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from .io import JOIN_KEY_CONVENTIONS, as_daily_date, load_any_table, resolve_dataset_path
+
+logger = logging.getLogger(__name__)
+
+DIRECTIONS = ("backward", "forward", "nearest")
+
+
+def to_day_ints(values) -> np.ndarray:
+    """Dates as int64 days since the epoch (tz-naive input)."""
+    return np.asarray(pd.to_datetime(values), dtype="datetime64[D]").astype(np.int64)
+
+
+def asof_indexer(
+    left: np.ndarray,
+    right: np.ndarray,
+    direction: str = "backward",
+    max_staleness: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Match each ``left`` day to a position in sorted ``right`` days.
+
+    Returns ``(idx, gap)``: ``idx`` is ``-1`` where there is no candidate or the candidate is
+    more than ``max_staleness`` days away; ``gap`` is the absolute distance to the candidate
+    before the staleness limit (``-1`` when there is none).
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown as-of direction '{direction}'. Expected one of {DIRECTIONS}")
+    if len(right) > 1 and (np.diff(right) < 0).any():
+        raise ValueError("as-of join: right-hand dates must be sorted ascending")
+    n = len(right)
+    if n == 0:
+        none = np.full(len(left), -1, dtype=np.int64)
+        return none, none.copy()
+    back = np.searchsorted(right, left, side="right") - 1
+    fwd = np.searchsorted(right, left, side="left")
+    back_gap = np.where(back >= 0, left - right[np.maximum(back, 0)], -1)
+    fwd_gap = np.where(fwd < n, right[np.minimum(fwd, n - 1)] - left, -1)
+
+    if direction == "backward":
+        idx, gap = np.where(back_gap >= 0, back, -1), back_gap
+    elif direction == "forward":
+        idx, gap = np.where(fwd_gap >= 0, fwd, -1), fwd_gap
+    else:
+        use_fwd = (fwd_gap >= 0) & ((back_gap < 0) | (fwd_gap < back_gap))
+        idx = np.where(use_fwd, fwd, np.where(back_gap >= 0, back, -1))
+        gap = np.where(use_fwd, fwd_gap, back_gap)
+    if max_staleness is not None:
+        idx = np.where(gap > max_staleness, -1, idx)
+    return idx.astype(np.int64), gap.astype(np.int64)
+
+
+def align_asof(
+    calendar,
+    source: pd.DataFrame,
+    direction: str = "backward",
+    max_staleness_days: int | None = None,
+    lag_days: int = 0,
+    name: str = "",
+) -> tuple[pd.DataFrame, list[dict]]:
+    """Carry each value column of ``source`` (``date`` + values) onto ``calendar`` dates.
+
+    Every control is matched on its own non-missing observations, so a sparse column
+    does not inherit another column's NaNs. ``lag_days`` shifts source dates forward to
+    model publication delay.
+    """
+    left = to_day_ints(calendar)
+    src = source.dropna(subset=["date"]).sort_values("date", kind="stable")
+    days = to_day_ints(src["date"]) + int(lag_days)
+    out = pd.DataFrame({"date": pd.to_datetime(np.asarray(calendar))})
+    stats = []
+    for col in [c for c in src.columns if c != "date"]:
+        vals = pd.to_numeric(src[col], errors="coerce").to_numpy(dtype=float)
+        ok = ~np.isnan(vals)
+        idx, gap = asof_indexer(left, days[ok], direction, max_staleness_days)
+        hit = idx >= 0
+        aligned = np.full(len(left), np.nan)
+        aligned[hit] = vals[ok][idx[hit]]
+        out[col] = aligned
+        stats.append({
+            "control": col,
+            "source": name,
+            "direction": direction,
+            "max_staleness_days": max_staleness_days,
+            "rows": len(left),
+            "matched": int(hit.sum()),
+            "match_rate": float(hit.mean()) if len(left) else 0.0,
+            "exact": int((gap[hit] == 0).sum()),
+            "stale_dropped": int((~hit & (gap >= 0)).sum()),
+            "staleness_median_days": float(np.median(gap[hit])) if hit.any() else np.nan,
+            "staleness_max_days": int(gap[hit].max()) if hit.any() else np.nan,
+        })
+    return out, stats
+
+
+def _bank_exposure(raw: pd.DataFrame) -> pd.DataFrame:
+    cols = [c for c in ("agg_exempt_share", "agg_reserves_share", "agg_ust_share", "median_slr") if c in raw.columns]
+    return raw[["date", *cols]]
+
+
+def _dealer_utilization(raw: pd.DataFrame) -> pd.DataFrame:
+    # Same proxy as the notebook's layer 2: sum of primary-dealer positions across mnemonics.
+    wide = raw.pivot_table(index="date", columns="mnemonic", values="value", aggfunc="mean")
+    return wide.sum(axis=1, min_count=1).rename("pd_utilization").reset_index()
+
+
+@dataclass(frozen=True)
+class AsofSource:
+    """A non-daily control dataset and the rule used to place it on the daily calendar."""
+
+    dataset: str
+    build: Callable[[pd.DataFrame], pd.DataFrame]
+    frequency: str
+    direction: str = "backward"
+    max_staleness_days: int | None = None
+    lag_days: int = 0
+
+    @property
+    def date_col(self) -> str:
+        return JOIN_KEY_CONVENTIONS.get(self.frequency, ["date"])[0]
+
+    def load(self, data_dir: Path) -> pd.DataFrame:
+        event_dir = data_dir / "raw" / "event_inputs"
+        raw = load_any_table(resolve_dataset_path(self.dataset, expected_dir=event_dir, fallback_roots=[data_dir]))
+        if self.date_col not in raw.columns:
+            raise KeyError(f"{self.dataset} missing join key '{self.date_col}'")
+        raw = raw.assign(date=as_daily_date(raw[self.date_col]))
+        return self.build(raw.dropna(subset=["date"])).groupby("date", as_index=False).mean(numeric_only=True)
+
+
+# FR Y-9C is due 40 days after quarter-end (45 for Q4); report_date is the quarter-end, so
+# values only become usable after the filing lag. Staleness counts from the lagged date and
+# must span the ~97-day gap between consecutive filings.
+Y9C_FILING_LAG_DAYS = 45
+
+ASOF_SOURCES = {
+    "bank_exposure": AsofSource(
+        "bank_exposure_y9c_agg_quarterly", _bank_exposure, "quarterly",
+        max_staleness_days=110, lag_days=Y9C_FILING_LAG_DAYS,
+    ),
+    "primary_dealer": AsofSource("primary_dealer_stats_ofr_stfm_nypd_long", _dealer_utilization, "weekly", max_staleness_days=7),
+}
+
+
+def load_asof_controls(
+    data_dir: Path,
+    calendar,
+    sources: dict[str, AsofSource] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Align every available as-of source onto ``calendar``; returns ``(controls, alignment stats)``."""
+    sources = ASOF_SOURCES if sources is None else sources
+    out = pd.DataFrame({"date": pd.to_datetime(np.asarray(calendar))})
+    stats: list[dict] = []
+    for name, src in sources.items():
+        try:
+            frame = src.load(data_dir)
+        except FileNotFoundError:
+            logger.info("as-of source %s (%s) not found; skipped", name, src.dataset)
+            continue
+        aligned, rows = align_asof(
+            out["date"], frame, src.direction, src.max_staleness_days, src.lag_days, name=name
+        )
+        out = pd.concat([out, aligned.drop(columns="date")], axis=1)
+        stats.extend(rows)
+    return out, pd.DataFrame(stats)
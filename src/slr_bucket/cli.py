@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+from .config import PipelineConfig, load_config
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m slr_bucket", description="SLR bucket analysis pipeline.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the summary pipeline in-process (no notebook kernel).")
+    run.add_argument("--config", type=Path, default=None, help="JSON file with PipelineConfig fields.")
+    run.add_argument("--repo-root", type=Path, default=Path("."), help="Repository root containing data/ and outputs/.")
+    run.add_argument(
+        "--strategy", dest="strategies", action="append", default=None,
+        help="Strategy mode (TIPS, UST_SF, CIP, EQUITY_<IDX>). Repeat to stack; overrides config.strategies.",
+    )
+    run.add_argument("--jobs", type=int, default=1, help="Worker processes for per-series estimation.")
+    run.add_argument(
+        "--stages", default=None,
+        help="Comma-separated subset of: catalog,jumps,event_bins,pooled,figures "
+             "(outcomes, controls and merge always run).",
+    )
+    run.add_argument("--timings-json", type=Path, default=None, help="Also write run metadata/timings to this path.")
+    run.add_argument("--no-latest", action="store_true", help="Do not refresh outputs/.../latest.")
+    run.add_argument("--trace-memory", action="store_true", help="Record per-stage peak memory with tracemalloc.")
+    run.add_argument("--profile", action="store_true", help="Dump a cProfile file per stage under logs/profile.")
+    run.add_argument(
+        "--incremental", action="store_true",
+        help="Reuse the previous run's panel/estimates and refit only cells touched by appended dates.",
+    )
+    run.add_argument(
+        "--memoize", action="store_true",
+        help="Reuse estimator fits whose event-window inputs are unchanged (cached under cache_root/estimators).",
+    )
+
+    sweep = sub.add_parser("sweep", help="Run a PipelineConfig override grid on one shared panel.")
+    sweep.add_argument("--config", type=Path, default=None, help="JSON file with the base PipelineConfig.")
+    sweep.add_argument("--grid", type=Path, required=True, help="JSON object mapping field -> list of values.")
+    sweep.add_argument("--repo-root", type=Path, default=Path("."), help="Repository root containing data/ and outputs/.")
+    sweep.add_argument("--jobs", type=int, default=1, help="Worker processes for spec cells.")
+    sweep.add_argument("--out-dir", type=Path, default=None, help="Sweep directory (reused to resume).")
+    sweep.add_argument("--memoize", action="store_true", help="Share estimator fits across variants and sweep re-runs.")
+
+    results = sub.add_parser("results", help="Query the cross-run results warehouse.")
+    results.add_argument("--repo-root", type=Path, default=Path("."), help="Repository root containing outputs/.")
+    results.add_argument("--output-root", default=PipelineConfig.output_root, help="Pipeline output root (holds warehouse/).")
+    results.add_argument("--table", default="jumps", choices=["jumps", "bins", "pooled_jumps", "pooled_es"])
+    results.add_argument("--config-hash", action="append", default=None, help="Repeat to select several configs.")
+    results.add_argument("--latest", action="store_true", help="Only the most recent run of each config.")
+    for col in ("strategy", "series", "event", "spec"):
+        results.add_argument(f"--{col}", action="append", default=None)
+    results.add_argument("--window", type=int, action="append", default=None)
+    results.add_argument("--format", dest="fmt", default="csv", choices=["csv", "html", "latex"],
+                         help="html/latex render the jump table layout (jumps table only).")
+    results.add_argument("--out", type=Path, default=None, help="Write here instead of stdout.")
+
+    spreads = sub.add_parser("build-spreads", help="Build outcome series (equity spot-futures, CIP basis) from raw pulls.")
+    spreads.add_argument("--kind", dest="kinds", action="append", choices=["equity", "cip"], default=None,
+                         help="Series to build. Repeat to stack; default both.")
+    spreads.add_argument("--raw", type=Path, default=Path("data/raw/equity_spot_bloomberg.parquet"))
+    spreads.add_argument("--cip-raw", type=Path, default=Path("data/raw/cip_bloomberg.xlsx"))
+    spreads.add_argument("--out-dir", type=Path, default=Path("data/series"))
+    spreads.add_argument("--index", dest="indices", action="append", default=None, help="SPX, NDX or INDU. Repeat to stack.")
+    spreads.add_argument("--batch-rows", type=int, default=65_536, help="Rows per streamed record batch.")
+    spreads.add_argument("--tenor", default="3M", help="CIP forward tenor (Forward sheet suffix).")
+    spreads.add_argument("--cip-start", default=None, help="First CIP date kept (default: workbook start).")
+    spreads.add_argument("--cip-end", default=None,
+                         help="Last CIP date kept (default: the shipped CSV's last date; 'none' keeps the whole workbook).")
+    spreads.add_argument("--force", action="store_true", help="Rebuild the CIP cache even if newer than the workbook.")
+    return parser
+
+
+def _run_build_spreads(args: argparse.Namespace) -> int:
+    from .spreads import CIP_CSV_END, EQUITY_FUTURES, build_cip_basis, build_equity_spreads
+
+    kinds = args.kinds or ["equity", "cip"]
+    paths = {}
+    if "equity" in kinds:
+        built = build_equity_spreads(args.raw, args.out_dir, args.indices or tuple(EQUITY_FUTURES), batch_rows=args.batch_rows)
+        paths.update({idx: str(p) for idx, p in built.items()})
+    if "cip" in kinds:
+        end = CIP_CSV_END if args.cip_end is None else (None if args.cip_end.lower() == "none" else args.cip_end)
+        built = build_cip_basis(args.cip_raw, args.out_dir, args.tenor, start=args.cip_start, end=end, force=args.force)
+        paths[f"CIP_{args.tenor.upper()}"] = str(built)
+    sys.stdout.write(json.dumps(paths) + "\n")
+    return 0
+
+
+def _run_results(args: argparse.Namespace) -> int:
+    from .warehouse import query_results, render_jump_table
+
+    filters = {c: getattr(args, c) for c in ("strategy", "series", "event", "spec", "window") if getattr(args, c)}
+    try:
+        df = query_results(
+            args.repo_root.resolve() / args.output_root / "warehouse", args.table,
+            config_hash=args.config_hash, latest=args.latest, **filters,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    if args.fmt == "csv":
+        text = df.to_csv(index=False)
+    elif args.table != "jumps":
+        raise SystemExit("--format html/latex is only available for --table jumps")
+    else:
+        text = render_jump_table(df, fmt=args.fmt) if not df.empty else ""
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def _run_sweep(args: argparse.Namespace) -> int:
+    from .sweep import run_sweep
+
+    config = load_config(args.config) if args.config else PipelineConfig()
+    grid = json.loads(args.grid.read_text(encoding="utf-8"))
+    results = run_sweep(args.repo_root.resolve(), config, grid, jobs=max(args.jobs, 1), out_dir=args.out_dir, memoize=args.memoize)
+    summary = {"variants": int(results.index.nunique()), "rows": int(len(results))}
+    sys.stdout.write(json.dumps(summary) + "\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "sweep":
+        return _run_sweep(args)
+    if args.command == "results":
+        return _run_results(args)
+    if args.command == "build-spreads":
+        return _run_build_spreads(args)
+    from .runner import STAGES, run_pipeline
+
+    config = load_config(args.config) if args.config else PipelineConfig()
+    if args.strategies:
+        config = replace(config, strategies=[s.upper() for s in args.strategies])
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()] if args.stages else list(STAGES)
+
+    metadata = run_pipeline(
+        args.repo_root.resolve(), config, jobs=max(args.jobs, 1), stages=stages, update_latest=not args.no_latest,
+        trace_memory=args.trace_memory, profile=args.profile, incremental=args.incremental, memoize=args.memoize,
+    )
+    payload = json.dumps(
+        {k: metadata[k] for k in ["run_dir", "config_hash", "strategies", "jobs", "rows", "timings", "incremental", "memo"] if k in metadata},
+        default=str,
+    )
+    if args.timings_json:
+        args.timings_json.parent.mkdir(parents=True, exist_ok=True)
+        args.timings_json.write_text(json.dumps(metadata, indent=2, default=str), encoding="utf-8")
+    sys.stdout.write(payload + "\n")
+    return 0
@@ -2,12 +2,24 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 
+# Fields added after the original hash layout, with the value earlier hashes implied. They are
+# left out of to_hash() at that value, so adding an opt-in field does not orphan earlier runs'
+# hashes (sweep cells, caches, warehouse partitions), while a changed default still re-hashes.
+HASH_LEGACY = {
+    "sup_t_draws": 0,
+    "strategies": ["TIPS"],
+    "outcome_col": "y_abs_bps",
+    "sample_start": "2019-01-01",
+    "sample_end": "2021-12-31",
+}
+
+
 @dataclass
 class PipelineConfig:
     event_dates: list[str] = field(
@@ -24,12 +36,19 @@ class PipelineConfig:
     hac_lags: int = 5
     bootstrap_reps: int = 200
     bootstrap_block_size: int = 5
+    sup_t_draws: int = 0  # >0 adds simultaneous (sup-t) bands to event-bin paths
     random_seed: int = 42
     output_root: str = "outputs/summary_pipeline"
     cache_root: str = "outputs/cache"
+    # Treasury-based and not: the pooled stage needs both values of treasury_based
+    strategies: list[str] = field(default_factory=lambda: ["TIPS", "CIP"])
+    outcome_col: str = "y_abs_bps"
+    sample_start: str | None = "2019-01-01"
+    sample_end: str | None = "2021-12-31"
 
     def to_hash(self) -> str:
-        payload = json.dumps(asdict(self), sort_keys=True, default=str)
+        payload = {k: v for k, v in asdict(self).items() if k not in HASH_LEGACY or v != HASH_LEGACY[k]}
+        payload = json.dumps(payload, sort_keys=True, default=str)
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
 
     def resolve_run_dir(self, root: Path) -> Path:
@@ -40,3 +59,21 @@ class PipelineConfig:
 
 def as_serializable_dict(config: PipelineConfig) -> dict[str, Any]:
     return asdict(config)
+
+
+def config_from_dict(payload: dict[str, Any]) -> PipelineConfig:
+    known = {f.name for f in fields(PipelineConfig)}
+    unknown = sorted(set(payload) - known)
+    if unknown:
+        raise ValueError(f"Unknown PipelineConfig keys: {unknown}")
+    kwargs = dict(payload)
+    # JSON has no tuples; bins come back as [low, high] lists
+    if "event_bins" in kwargs:
+        kwargs["event_bins"] = [tuple(int(v) for v in b) for b in kwargs["event_bins"]]
+    return PipelineConfig(**kwargs)
+
+
+def load_config(path: Path) -> PipelineConfig:
+    with Path(path).open("r", encoding="utf-8") as f:
+        payload = json.load(f)
+    return config_from_dict(payload)
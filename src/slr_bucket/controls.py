@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .alignment import ASOF_SOURCES, load_asof_controls
+from .io import as_daily_date, load_any_table, resolve_dataset_path
+from .outcomes import _scale_to_bps
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cube recipe changes so cached cubes are rebuilt.
+CUBE_VERSION = 1
+FRED_DATASET = "controls_vix_creditspreads_fred"
+REPO_DATASETS = ("repo_rates_combined", "repo_rates_fred")
+ISSUANCE_DATASET = "treasury_issuance_by_tenor_fiscaldata"
+FUNDING_CONTROLS = ["sofr", "tgcr", "bgcr", "effr", "iorb", "spr_tgcr", "spr_effr"]
+FRED_UNITS = {"VIX": "index", "HY_OAS": "percent", "BAA10Y": "percent"}
+
+
+def _event_dir(data_dir: Path) -> Path:
+    return data_dir / "raw" / "event_inputs"
+
+
+def _resolve(data_dir: Path, name: str) -> Path:
+    return resolve_dataset_path(name, expected_dir=_event_dir(data_dir), fallback_roots=[data_dir])
+
+
+def cube_sources(data_dir: Path) -> dict[str, Path]:
+    """Source files the cube is built from (optional ones only when present)."""
+    out = {FRED_DATASET: _resolve(data_dir, FRED_DATASET)}
+    for name in (*REPO_DATASETS, ISSUANCE_DATASET, *(s.dataset for s in ASOF_SOURCES.values())):
+        try:
+            out[name] = _resolve(data_dir, name)
+        except FileNotFoundError:
+            continue
+    if not set(REPO_DATASETS) & set(out):
+        raise FileNotFoundError(f"No repo rate dataset found; expected one of {REPO_DATASETS}")
+    return out
+
+
+def file_fingerprint(path: Path) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+
+def _daily(df: pd.DataFrame, date_col: str = "date", how: str = "mean") -> pd.DataFrame:
+    df = df.assign(date=as_daily_date(df[date_col])).dropna(subset=["date"])
+    if date_col != "date":
+        df = df.drop(columns=date_col)
+    grouped = df.groupby("date", as_index=False)
+    return grouped.sum(numeric_only=True) if how == "sum" else grouped.mean(numeric_only=True)
+
+
+def _repo_rates(paths: dict[str, Path]) -> tuple[pd.DataFrame, dict[str, str]]:
+    # repo_rates_combined wins on overlapping columns; repo_rates_fred adds EFFR/IORB.
+    repo, origin = None, {}
+    for name in REPO_DATASETS:
+        if name not in paths:
+            continue
+        df = _daily(load_any_table(paths[name]))
+        df = df.rename(columns={c: c.lower() for c in df.columns if c.upper() in {"SOFR", "TGCR", "BGCR", "EFFR", "IORB"}})
+        if repo is None:
+            repo = df
+        else:
+            extra = [c for c in df.columns if c not in repo.columns]
+            repo = repo.merge(df[["date", *extra]], on="date", how="outer")
+        origin.update({c: name for c in df.columns if c != "date" and c not in origin})
+    return repo, origin
+
+
+def _issuance(path: Path) -> pd.DataFrame:
+    issu = load_any_table(path)
+    issu["tenor_bucket"] = pd.to_numeric(issu["tenor_bucket"], errors="coerce")
+    issu["issuance_amount"] = pd.to_numeric(issu["issuance_amount"], errors="coerce") / 1e9
+    wide = issu.assign(date=as_daily_date(issu["issue_date"])).pivot_table(
+        index="date", columns="tenor_bucket", values="issuance_amount", aggfunc="sum"
+    )
+    wide.columns = [f"issu_{b:g}_bil" for b in wide.columns]
+    # Notebook buckets: 14 falls back to 10+20 when the file has no 14y bucket.
+    for c in ("issu_7_bil", "issu_14_bil"):
+        if c not in wide.columns:
+            wide[c] = 0.0
+    if wide["issu_14_bil"].fillna(0.0).abs().sum() == 0.0:
+        wide["issu_14_bil"] = wide.get("issu_10_bil", 0.0) + wide.get("issu_20_bil", 0.0)
+    return wide.fillna(0.0).reset_index()
+
+
+def build_controls_cube(data_dir: Path, sources: dict[str, Path] | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """One row per date, float64 controls in normalized units, plus a provenance table.
+
+    Calendar is the union of FRED and repo dates. Funding rates and spreads are in bps,
+    issuance in USD bn (0 on non-issue days inside the issuance file's span), and
+    quarterly/weekly sources are carried forward by the as-of rules in ``ASOF_SOURCES``.
+    """
+    sources = sources or cube_sources(data_dir)
+    fred = _daily(load_any_table(sources[FRED_DATASET]))
+    repo, repo_origin = _repo_rates(sources)
+    cube = fred.merge(repo, on="date", how="outer").sort_values("date").reset_index(drop=True)
+    prov = [{"column": c, "source": FRED_DATASET, "unit": FRED_UNITS.get(c, "source"), "transform": "daily mean"}
+            for c in fred.columns if c != "date"]
+    prov += [{"column": c, "source": s, "unit": "source", "transform": "daily mean"} for c, s in repo_origin.items()]
+
+    if {"sofr", "tgcr"}.issubset(cube.columns) and "spr_tgcr" not in cube.columns:
+        cube["spr_tgcr"] = cube["tgcr"] - cube["sofr"]
+        prov.append({"column": "spr_tgcr", "source": repo_origin["tgcr"], "unit": "source", "transform": "tgcr - sofr"})
+    if {"sofr", "effr"}.issubset(cube.columns) and "spr_effr" not in cube.columns:
+        cube["spr_effr"] = cube["effr"] - cube["sofr"]
+        prov.append({"column": "spr_effr", "source": repo_origin["effr"], "unit": "source", "transform": "effr - sofr"})
+    for row in prov:
+        if row["column"] in FUNDING_CONTROLS:
+            cube[row["column"]] = _scale_to_bps(cube[row["column"]])
+            row.update(unit="bps", transform=row["transform"] + "; scaled to bps")
+
+    if ISSUANCE_DATASET in sources:
+        issu = _issuance(sources[ISSUANCE_DATASET])
+        cols = [c for c in issu.columns if c != "date"]
+        cube = cube.merge(issu, on="date", how="left")
+        span = cube["date"].between(issu["date"].min(), issu["date"].max())
+        cube.loc[span, cols] = cube.loc[span, cols].fillna(0.0)
+        prov += [{"column": c, "source": ISSUANCE_DATASET, "unit": "usd_bn", "transform": "sum by issue_date"} for c in cols]
+
+    aligned, stats = load_asof_controls(data_dir, cube["date"])
+    cube = pd.concat([cube, aligned.drop(columns="date")], axis=1)
+    for row in stats.to_dict("records"):
+        src = ASOF_SOURCES[row["source"]]
+        prov.append({
+            "column": row["control"], "source": src.dataset, "unit": "source",
+            "transform": f"as-of {src.direction}, max {src.max_staleness_days}d",
+        })
+
+    value_cols = [c for c in cube.columns if c != "date"]
+    cube[value_cols] = cube[value_cols].astype(np.float64)
+    provenance = pd.DataFrame(prov)
+    provenance["path"] = provenance["source"].map(lambda s: str(sources.get(s, "")))
+    cube.attrs["alignment"] = stats.to_dict("records")
+    return cube, provenance
+
+
+def load_controls_cube(data_dir: Path, cache_dir: Path | None = None, force: bool = False) -> pd.DataFrame:
+    """Return the controls cube, reusing ``cache_dir/controls_cube/<key>.parquet`` when sources are unchanged.
+
+    ``key`` hashes the content of every source file and ``CUBE_VERSION``. Provenance and
+    as-of alignment stats are kept in ``attrs`` (and in the sidecar ``<key>.json``).
+    """
+    sources = cube_sources(data_dir)
+    fingerprints = {name: file_fingerprint(p) for name, p in sorted(sources.items())}
+    key = hashlib.sha256(json.dumps({"v": CUBE_VERSION, **fingerprints}, sort_keys=True).encode()).hexdigest()[:12]
+    cube_path = cache_dir / "controls_cube" / f"{key}.parquet" if cache_dir is not None else None
+
+    if cube_path is not None and cube_path.exists() and not force:
+        meta = json.loads(cube_path.with_suffix(".json").read_text(encoding="utf-8"))
+        cube = pd.read_parquet(cube_path)
+        logger.info("controls cube %s loaded from cache", key)
+    else:
+        cube, provenance = build_controls_cube(data_dir, sources)
+        meta = {
+            "key": key, "version": CUBE_VERSION, "fingerprints": fingerprints,
+            "provenance": provenance.to_dict("records"), "alignment": cube.attrs["alignment"],
+        }
+        if cube_path is not None:
+            cube_path.parent.mkdir(parents=True, exist_ok=True)
+            cube.to_parquet(cube_path, index=False)
+            cube_path.with_suffix(".json").write_text(json.dumps(meta, indent=2, default=str), encoding="utf-8")
+            logger.info("controls cube %s built and cached (%d rows, %d columns)", key, len(cube), cube.shape[1] - 1)
+    cube.attrs.update(cube_key=key, provenance=meta["provenance"], alignment=meta["alignment"])
+    return cube
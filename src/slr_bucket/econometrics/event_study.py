@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import re
+from functools import lru_cache
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 
+from .._lazy import LazyModule
+from ..instrument import instrumented
+from ..memo import memoized
 
-@dataclass
+sm = LazyModule("statsmodels.api")
+
+
+@dataclass(slots=True)
 class JumpResult:
     event_date: str
     tenor: str
@@ -23,6 +28,7 @@ class JumpResult:
     n: int
 
 
+@instrumented()
 def add_event_time(df: pd.DataFrame, event_date: str, date_col: str = "date") -> pd.DataFrame:
     """Trading-day event time based on available sample dates."""
     out = df.copy()
@@ -44,6 +50,83 @@ def add_event_time(df: pd.DataFrame, event_date: str, date_col: str = "date") ->
     return out
 
 
+def _days(values) -> np.ndarray:
+    return np.asarray(pd.to_datetime(values), dtype="datetime64[D]").astype(np.int64)
+
+
+def _group_layout(df: pd.DataFrame, group_col: str, date_col: str) -> tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]:
+    """Rows with a date and group, stably sorted by (group, date), plus group codes, labels and start offsets."""
+    out = df.assign(**{date_col: pd.to_datetime(df[date_col], errors="coerce")})
+    out = out[out[date_col].notna() & out[group_col].notna()]
+    codes, labels = pd.factorize(out[group_col], sort=True)
+    order = np.lexsort((out[date_col].to_numpy(dtype="datetime64[ns]"), codes))
+    out, codes = out.iloc[order], codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=np.int64)
+    return out, codes, np.asarray(labels), starts
+
+
+def _anchor_positions(days: np.ndarray, codes: np.ndarray, starts: np.ndarray, events: np.ndarray) -> np.ndarray:
+    """Within-group position of the first date >= each event (last date if none), shape (groups, events).
+
+    One searchsorted over the composite key ``code * span + day`` answers every group/event pair.
+    """
+    lo = days.min()
+    span = int(days.max() - lo) + 2
+    keys = codes.astype(np.int64) * span + (days - lo)
+    q = np.clip(events - lo, 0, span - 1)[None, :] + (np.arange(len(starts), dtype=np.int64) * span)[:, None]
+    ends = np.r_[starts[1:], len(days)]
+    pos = np.searchsorted(keys, q, side="left")
+    return np.minimum(pos, ends[:, None] - 1) - starts[:, None]
+
+
+def event_anchors(
+    df: pd.DataFrame,
+    event_dates: str | Iterable[str],
+    group_col: str = "series",
+    date_col: str = "date",
+) -> pd.DataFrame:
+    """``event_t0_used`` (first own date on/after the event, else the last one) for every group x event."""
+    events = [event_dates] if isinstance(event_dates, str) else list(event_dates)
+    out, codes, labels, starts = _group_layout(df, group_col, date_col)
+    if out.empty:
+        return pd.DataFrame(columns=[group_col, "event", "event_t0_used", "t0_pos", "n_dates"])
+    pos = _anchor_positions(_days(out[date_col]), codes, starts, _days(events))
+    t0 = out[date_col].to_numpy()[starts[:, None] + pos]
+    ends = np.r_[starts[1:], len(out)]
+    return pd.DataFrame({
+        group_col: np.repeat(labels, len(events)),
+        "event": np.tile(np.asarray(events, dtype=object), len(labels)),
+        "event_t0_used": t0.ravel(),
+        "t0_pos": pos.ravel(),
+        "n_dates": np.repeat(ends - starts, len(events)),
+    })
+
+
+@instrumented()
+def add_event_time_by_group(
+    df: pd.DataFrame,
+    event_date: str,
+    group_col: str = "series",
+    date_col: str = "date",
+) -> pd.DataFrame:
+    """Trading-day event time on each group's own dates (holiday calendars differ across series).
+
+    Rows are returned sorted by (group, date); ``event_time`` counts rows from the group's
+    ``event_t0_used``, the first date on/after ``event_date`` (the group's last date if the
+    event is past its sample). Rows without a date or group are dropped.
+    """
+    out, codes, _, starts = _group_layout(df, group_col, date_col)
+    if out.empty:
+        return out.assign(event_t0_used=pd.Series(dtype="datetime64[ns]"), event_time=pd.Series(dtype=int))
+    pos = _anchor_positions(_days(out[date_col]), codes, starts, _days([event_date]))[:, 0]
+    # codes are 0..k-1 in sorted order, so they index the per-group arrays directly
+    within = np.arange(len(out)) - starts[codes]
+    return out.assign(
+        event_t0_used=out[date_col].to_numpy()[(starts + pos)[codes]],
+        event_time=within - pos[codes],
+    )
+
+
 def make_bins(event_time: pd.Series, bins: Iterable[tuple[int, int]]) -> pd.Series:
     labels = [f"[{low},{high}]" for low, high in bins]
     binned = pd.Series(pd.NA, index=event_time.index, dtype="object")
@@ -62,6 +145,220 @@ def _param_lookup(robust, name: str, exog_names: list[str]) -> tuple[float, floa
     return float(robust.params[idx]), float(robust.bse[idx])
 
 
+TERM_COLUMNS = ("term", "estimate", "se", "ci_low", "ci_high", "n")
+
+
+def _coef_block(robust, terms: Iterable[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """``(terms, positions, params, bse)`` for the ``terms`` the fitted model kept, in one indexer pass."""
+    terms = np.asarray(list(terms), dtype=object)
+    idx = pd.Index(robust.model.exog_names).get_indexer(terms)
+    keep = idx >= 0
+    idx = idx[keep]
+    return terms[keep], idx, np.asarray(robust.params, dtype=float)[idx], np.asarray(robust.bse, dtype=float)[idx]
+
+
+class TermTable:
+    """Struct-of-arrays estimator output: filled in vectorized blocks, framed once by :meth:`to_frame`.
+
+    Column arrays are allocated (dtype from the first block) with room for ``capacity`` rows and grow by doubling.
+    """
+
+    __slots__ = ("columns", "_data", "_n", "_capacity")
+
+    def __init__(self, columns: Iterable[str] = TERM_COLUMNS, capacity: int = 16) -> None:
+        self.columns = tuple(columns)
+        self._data: dict[str, np.ndarray] = {}
+        self._n = 0
+        self._capacity = max(int(capacity), 1)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def extend(self, **values) -> None:
+        """Append a block with every column; array values share one length, scalars are broadcast."""
+        if set(values) != set(self.columns):
+            raise KeyError(f"TermTable: expected columns {self.columns}, got {sorted(values)}")
+        m = max((len(v) for v in values.values() if np.ndim(v)), default=1)
+        if m == 0:
+            return
+        if not self._data:
+            for c in self.columns:
+                kind = np.asarray(values[c]).dtype.kind
+                self._data[c] = np.empty(max(self._capacity, m), dtype=object if kind in "OUST" else np.asarray(values[c]).dtype)
+        elif self._n + m > len(self._data[self.columns[0]]):
+            size = max(2 * len(self._data[self.columns[0]]), self._n + m)
+            for c, arr in self._data.items():
+                grown = np.empty(size, dtype=arr.dtype)
+                grown[: self._n] = arr[: self._n]
+                self._data[c] = grown
+        for c, v in values.items():
+            self._data[c][self._n : self._n + m] = v
+        self._n += m
+
+    def add_terms(self, term, estimate, se, **extra) -> None:
+        """Append coefficient rows with normal 95% intervals computed as one vector op."""
+        estimate, se = np.asarray(estimate, dtype=float), np.asarray(se, dtype=float)
+        self.extend(term=term, estimate=estimate, se=se, ci_low=estimate - 1.96 * se, ci_high=estimate + 1.96 * se, **extra)
+
+    def to_frame(self) -> pd.DataFrame:
+        if not self._n:
+            return pd.DataFrame(columns=list(self.columns))
+        return pd.DataFrame({c: self._data[c][: self._n] for c in self.columns})
+
+
+def _bin_mids(terms) -> np.ndarray:
+    """Midpoint of the ``[low,high]`` label inside each term (NaN when there is none)."""
+    bounds = pd.Series(terms, dtype=object).astype(str).str.extract(r"\[\s*(-?\d+)\s*,\s*(-?\d+)\s*\]").astype(float)
+    return (0.5 * (bounds[0] + bounds[1])).to_numpy()
+
+
+BAND_COLUMNS = ("sup_t_crit", "band_low", "band_high")
+
+
+@dataclass(frozen=True)
+class SupTBands:
+    """Simultaneous (sup-t) band settings for binned event paths.
+
+    ``share_draws`` reuses one standard-normal matrix per path length (and seed), so every
+    path with the same number of bins, in this call or a later one, sees the same draws.
+    """
+
+    draws: int = 10_000
+    level: float = 0.95
+    seed: int = 0
+    share_draws: bool = True
+
+
+@lru_cache(maxsize=32)
+def _shared_draws(seed: int, draws: int, k: int) -> np.ndarray:
+    z = np.random.default_rng([seed, k]).standard_normal((draws, k))
+    z.flags.writeable = False
+    return z
+
+
+def _batched_chol(corr: np.ndarray) -> np.ndarray:
+    """Cholesky factors of a ``(p, k, k)`` stack; symmetric square roots where one is singular."""
+    try:
+        return np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        w, v = np.linalg.eigh(corr)
+        return v * np.sqrt(np.clip(w, 0.0, None))[:, None, :]
+
+
+def sup_t_critical(covs: list[np.ndarray], bands: SupTBands = SupTBands()) -> np.ndarray:
+    """Sup-t critical value for each path covariance in ``covs``.
+
+    Paths are grouped by length; each group is simulated in one batched draw
+    ``t = z @ L.T`` with ``L`` the Cholesky factor of the path's correlation matrix,
+    and the ``level`` quantile of ``max_j |t_j|`` is taken across draws for all paths at once.
+    """
+    crit = np.full(len(covs), np.nan)
+    by_dim: dict[int, list[int]] = {}
+    for i, c in enumerate(covs):
+        by_dim.setdefault(np.shape(c)[0], []).append(i)
+    rng = np.random.default_rng(bands.seed)
+    for k, idx in sorted(by_dim.items()):
+        if k == 0:
+            continue
+        cov = np.stack([np.asarray(covs[i], dtype=float) for i in idx])
+        sd = np.sqrt(np.clip(np.diagonal(cov, axis1=1, axis2=2), 0.0, None))
+        sd = np.where(sd > 0, sd, 1.0)
+        chol = _batched_chol(cov / (sd[:, :, None] * sd[:, None, :]))
+        if bands.share_draws:
+            t = _shared_draws(bands.seed, bands.draws, k)[None] @ np.swapaxes(chol, 1, 2)
+        else:
+            t = rng.standard_normal((len(idx), bands.draws, k)) @ np.swapaxes(chol, 1, 2)
+        crit[idx] = np.quantile(np.abs(t).max(axis=2), bands.level, axis=1)
+    return crit
+
+
+def _attach_bands(frame: pd.DataFrame, crit: np.ndarray | float) -> pd.DataFrame:
+    frame["sup_t_crit"] = crit
+    frame["band_low"] = frame["estimate"] - frame["sup_t_crit"] * frame["se"]
+    frame["band_high"] = frame["estimate"] + frame["sup_t_crit"] * frame["se"]
+    return frame
+
+
+# Webb six-point weights: better than Rademacher when there are few clusters.
+WEBB_WEIGHTS = np.array([-np.sqrt(1.5), -1.0, -np.sqrt(0.5), np.sqrt(0.5), 1.0, np.sqrt(1.5)])
+
+
+@dataclass(frozen=True)
+class WildBootstrap:
+    """Residual multiplier (wild cluster) bootstrap settings for the pooled regressions.
+
+    Rows are clustered on ``cluster`` (default: date); ``block_size > 1`` groups that many
+    consecutive cluster values into one block (wild block bootstrap). ``weights`` is
+    ``rademacher``, ``webb`` or ``normal``; replicates are drawn ``chunk`` at a time.
+    """
+
+    reps: int = 999
+    cluster: str = "date"
+    block_size: int = 1
+    weights: str = "rademacher"
+    seed: int = 0
+    chunk: int = 2_000
+
+
+def _multiplier_weights(rng: np.random.Generator, shape: tuple[int, int], kind: str) -> np.ndarray:
+    if kind == "rademacher":
+        return rng.integers(0, 2, size=shape) * 2.0 - 1.0
+    if kind == "webb":
+        return WEBB_WEIGHTS[rng.integers(0, 6, size=shape)]
+    if kind == "normal":
+        return rng.standard_normal(shape)
+    raise ValueError(f"Unknown multiplier weights '{kind}'. Expected 'rademacher', 'webb' or 'normal'")
+
+
+def wild_bootstrap(robust, combos: np.ndarray, clusters, spec: WildBootstrap = WildBootstrap()) -> tuple[np.ndarray, np.ndarray]:
+    """Bootstrap s.e. and two-sided p-values (H0: ``combos @ beta = 0``) without refitting.
+
+    With weights ``w`` per cluster each replicate is ``b* - b = (X'X)^-1 X' (w * u)``, so the
+    per-cluster scores of ``combos (X'X)^-1 x_i u_i`` are formed once from the stored
+    residuals and every chunk of replicates is a single ``(reps x clusters) @ (clusters x m)``
+    product. ``combos`` is ``(m, p)`` over the fitted parameters; ``clusters`` labels each row.
+    """
+    combos = np.atleast_2d(np.asarray(combos, dtype=float))
+    codes, _ = pd.factorize(pd.Series(np.asarray(clusters)), sort=True)
+    codes = codes // max(int(spec.block_size), 1)
+    n_clusters = int(codes.max()) + 1 if len(codes) else 0
+    X = np.asarray(robust.model.exog, dtype=float)
+    u = np.asarray(robust.resid, dtype=float)
+    infl = (combos @ np.asarray(robust.normalized_cov_params, dtype=float)) @ (X * u[:, None]).T
+    scores = np.zeros((n_clusters, len(combos)))
+    np.add.at(scores, codes, infl.T)
+    est = np.abs(combos @ np.asarray(robust.params, dtype=float))
+    rng = np.random.default_rng(spec.seed)
+    sumsq, exceed = np.zeros(len(combos)), np.zeros(len(combos))
+    for start in range(0, spec.reps, spec.chunk):
+        delta = _multiplier_weights(rng, (min(spec.chunk, spec.reps - start), n_clusters), spec.weights) @ scores
+        sumsq += (delta**2).sum(axis=0)
+        exceed += (np.abs(delta) >= est).sum(axis=0)
+    reps = max(spec.reps, 1)
+    return np.sqrt(sumsq / reps), (1.0 + exceed) / (1.0 + reps)
+
+
+def _attach_bootstrap(frame: pd.DataFrame, robust, combos: np.ndarray, clusters, spec: WildBootstrap) -> pd.DataFrame:
+    frame["bootstrap_se"], frame["bootstrap_p"] = wild_bootstrap(robust, combos, clusters, spec)
+    return frame
+
+
+def _jump_span(a: dict) -> tuple[int, int]:
+    return -a["window"], a["window"]
+
+
+def _bin_span(a: dict) -> tuple[int, int]:
+    return min(low for low, _ in a["bins"]), max(high for _, high in a["bins"])
+
+
+def _used_columns(a: dict) -> list[str | None]:
+    """Columns an estimator reads besides the date (memo key; see :func:`~slr_bucket.memo.memoized`)."""
+    cluster = getattr(a.get("bootstrap"), "cluster", None)
+    return [a["y_col"], *(a.get("controls") or []), a.get("group_col"), a.get("fe_col"), cluster]
+
+
+@memoized(span=_jump_span, columns=_used_columns)
+@instrumented(rows_out=lambda r: r[2])
 def jump_estimator(
     df: pd.DataFrame,
     y_col: str,
@@ -129,6 +426,8 @@ def jump_estimator(
     return est, se, int(robust.nobs)
 
 
+@memoized(span=_jump_span, columns=_used_columns)
+@instrumented()
 def block_bootstrap_jump(
     df: pd.DataFrame,
     y_col: str,
@@ -151,12 +450,14 @@ def block_bootstrap_jump(
         for s in starts:
             idx.extend(range(s, min(s + block_size, len(work))))
         sample = work.iloc[idx]
-        est, _, _ = jump_estimator(sample, y_col, event_date, window, controls=controls, hac_lags=1)
+        # resamples never repeat, so skip the memo layer
+        est, _, _ = jump_estimator.__wrapped__(sample, y_col, event_date, window, controls=controls, hac_lags=1)
         if np.isfinite(est):
             vals.append(est)
     return float(np.std(vals, ddof=1)) if len(vals) > 1 else np.nan
 
 
+@memoized(span=_bin_span, columns=_used_columns)
 def event_study_regression(
     df: pd.DataFrame,
     y_col: str,
@@ -164,7 +465,9 @@ def event_study_regression(
     bins: list[tuple[int, int]],
     controls: list[str] | None = None,
     hac_lags: int = 5,
+    bands: SupTBands | None = None,
 ) -> pd.DataFrame:
+    """Per-series binned event study; ``bands`` adds sup-t band columns (:data:`BAND_COLUMNS`)."""
     # work = add_event_time(df, event_date)
     # work["bin"] = make_bins(work["event_time"], bins)
     # work = work.dropna(subset=["bin", y_col]).copy()
@@ -274,23 +577,18 @@ def event_study_regression(
     res = sm.OLS(y.astype(float), X).fit()
     robust = _nw_cov_params(res, hac_lags)
 
-    names = list(robust.model.exog_names)  # correct names for fitted model
-
-    out = []
-    for col in dummies.columns:
-        if col not in names:
-            continue
-        coef, se = _param_lookup(robust, col, names)
-        out.append(
-            {"term": col, "estimate": coef, "se": se,
-             "ci_low": coef - 1.96 * se, "ci_high": coef + 1.96 * se,
-             "n": int(robust.nobs)}
-        )
-    return pd.DataFrame(out)
+    terms, pos, coef, se = _coef_block(robust, dummies.columns)
+    out = TermTable(capacity=len(terms))
+    out.add_terms(terms, coef, se, n=int(robust.nobs))
+    if bands is None:
+        return out.to_frame()
+    cov = np.asarray(robust.cov_params(), dtype=float)
+    return _attach_bands(out.to_frame(), sup_t_critical([cov[np.ix_(pos, pos)]], bands)[0])
 
 
 
 
+@memoized(span=_jump_span, columns=_used_columns)
 def pooled_jump_regression(
     df: pd.DataFrame,
     y_col: str,
@@ -300,11 +598,13 @@ def pooled_jump_regression(
     fe_col: str,
     controls: list[str] | None = None,
     hac_lags: int = 5,
+    bootstrap: WildBootstrap | None = None,
 ) -> pd.DataFrame:
     """Pooled jump regression with series fixed effects and a group interaction.
 
     Model: y ~ post + post*group + C(fe_col) + controls, within +/- window trading days.
     Returns coefficients for post and post_x_group (and optionally grouped effects).
+    ``bootstrap`` adds wild-cluster ``bootstrap_se``/``bootstrap_p`` columns (:func:`wild_bootstrap`).
     """
     work = df.copy()
     work = add_event_time(work, event_date)
@@ -351,19 +651,18 @@ def pooled_jump_regression(
 
     res = sm.OLS(y, X).fit()
     robust = _nw_cov_params(res, lags=hac_lags)
-    names = list(robust.model.exog_names)
-
-    out = []
-    for term in ["post", "post_x_g"]:
-        if term in names:
-            coef, se = _param_lookup(robust, term, names)
-            out.append({"term": term, "estimate": coef, "se": se,
-                        "ci_low": coef - 1.96*se, "ci_high": coef + 1.96*se,
-                        "n": int(robust.nobs)})
-
-    return pd.DataFrame(out)
-
-
+    terms, pos, coef, se = _coef_block(robust, ["post", "post_x_g"])
+    out = TermTable(capacity=2)
+    out.add_terms(terms, coef, se, n=int(robust.nobs))
+    if bootstrap is None:
+        return out.to_frame()
+    combos = np.eye(len(robust.params))[pos]
+    return _attach_bootstrap(out.to_frame(), robust, combos, work.loc[y.index, bootstrap.cluster], bootstrap)
+
+
+# the robust results object holds the whole design matrix; the disk tier keeps the table only
+@memoized(span=_bin_span, columns=_used_columns, persist=lambda r: (r[0], None))
+@instrumented()
 def pooled_event_study(
     df: pd.DataFrame,
     y_col: str,
@@ -374,6 +673,8 @@ def pooled_event_study(
     controls: list[str] | None = None,
     hac_lags: int = 5,
     ref_bin: str | None = None,
+    bands: SupTBands | None = None,
+    bootstrap: WildBootstrap | None = None,
 ) -> tuple[pd.DataFrame, object]:
     """Pooled binned event-study with series fixed effects + group interactions.
 
@@ -381,6 +682,9 @@ def pooled_event_study(
     Model:
         y ~ sum_k beta_k * 1[bin=k] + sum_k gamma_k * (group * 1[bin=k]) + FE + controls
     where one bin is omitted as reference.
+    ``bands`` adds sup-t band columns; the four paths (baseline, interaction and both
+    group effects, group 1 as ``b+g``) are simulated in one :func:`sup_t_critical` call.
+    ``bootstrap`` adds wild-cluster ``bootstrap_se``/``bootstrap_p`` for every row.
     Returns (results_df, robust_results_obj).
     """
     work = df.copy()
@@ -443,90 +747,42 @@ def pooled_event_study(
 
     res = sm.OLS(y, X).fit()
     robust = _nw_cov_params(res, lags=hac_lags)
-    names = list(robust.model.exog_names)
-    cov = robust.cov_params()
-
-    def _bin_mid(colname: str) -> float:
-        m = re.search(r"\[\s*(-?\d+)\s*,\s*(-?\d+)\s*\]", colname)
-        if not m:
-            return np.nan
-        a, b = int(m.group(1)), int(m.group(2))
-        return 0.5*(a+b)
-
-    out = []
-    # baseline bin effects (group=0)
-    for col in d.columns:
-        if col not in names:
-            continue
-        coef, se = _param_lookup(robust, col, names)
-        out.append({
-            "term": col,
-            "kind": "baseline_bin",
-            "estimate": coef,
-            "se": se,
-            "ci_low": coef - 1.96*se,
-            "ci_high": coef + 1.96*se,
-            "bin_mid": _bin_mid(col),
-            "ref_bin": ref,
-            "n": int(robust.nobs),
-        })
-    # interaction bin effects (increment for group=1)
-    for col in inter.columns:
-        if col not in names:
-            continue
-        coef, se = _param_lookup(robust, col, names)
-        out.append({
-            "term": col,
-            "kind": "interaction_bin",
-            "estimate": coef,
-            "se": se,
-            "ci_low": coef - 1.96*se,
-            "ci_high": coef + 1.96*se,
-            "bin_mid": _bin_mid(col.replace(":g", "")),
-            "ref_bin": ref,
-            "n": int(robust.nobs),
-        })
-
-    # group-specific bin effects: group0=baseline, group1=baseline+interaction
-    for base in d.columns:
-        base_name = base
-        inter_name = base + ":g"
-        if base_name not in names:
-            continue
-        b = float(robust.params[names.index(base_name)])
-        vb = float(cov.loc[base_name, base_name]) if hasattr(cov, "loc") else float(cov[names.index(base_name), names.index(base_name)])
-        # group 0 effect
-        se0 = float(np.sqrt(max(vb, 0.0)))
-        out.append({
-            "term": base_name,
-            "kind": "group0_effect",
-            "estimate": b,
-            "se": se0,
-            "ci_low": b - 1.96*se0,
-            "ci_high": b + 1.96*se0,
-            "bin_mid": _bin_mid(base_name),
-            "ref_bin": ref,
-            "n": int(robust.nobs),
-        })
-        if inter_name in names:
-            g = float(robust.params[names.index(inter_name)])
-            vg = float(cov.loc[inter_name, inter_name]) if hasattr(cov, "loc") else float(cov[names.index(inter_name), names.index(inter_name)])
-            cbg = float(cov.loc[base_name, inter_name]) if hasattr(cov, "loc") else float(cov[names.index(base_name), names.index(inter_name)])
-            s = b + g
-            vs = vb + vg + 2.0*cbg
-            se1 = float(np.sqrt(max(vs, 0.0)))
-            out.append({
-                "term": base_name,
-                "kind": "group1_effect",
-                "estimate": s,
-                "se": se1,
-                "ci_low": s - 1.96*se1,
-                "ci_high": s + 1.96*se1,
-                "bin_mid": _bin_mid(base_name),
-                "ref_bin": ref,
-                "n": int(robust.nobs),
-            })
-
-    out_df = pd.DataFrame(out)
+    cov = np.asarray(robust.cov_params(), dtype=float)
+    n = int(robust.nobs)
+    out = TermTable((*TERM_COLUMNS[:1], "kind", *TERM_COLUMNS[1:5], "bin_mid", "ref_bin", "n"), capacity=4 * d.shape[1])
+
+    base, ib, b, sb = _coef_block(robust, d.columns)
+    out.add_terms(base, b, sb, kind="baseline_bin", bin_mid=_bin_mids(base), ref_bin=ref, n=n)
+    inter_terms, ii, gcoef, gse = _coef_block(robust, inter.columns)
+    out.add_terms(inter_terms, gcoef, gse, kind="interaction_bin", bin_mid=_bin_mids(inter_terms), ref_bin=ref, n=n)
+
+    # group-specific bin effects: group0 = baseline, group1 = baseline + interaction (Var b + Var g + 2 Cov)
+    ig = pd.Index(robust.model.exog_names).get_indexer([t + ":g" for t in base])
+    has_g = ig >= 0
+    b1, ib1, ig1 = b[has_g], ib[has_g], ig[has_g]
+    est1 = b1 + np.asarray(robust.params, dtype=float)[ig1]
+    se0 = np.sqrt(np.maximum(cov[ib, ib], 0.0))
+    se1 = np.sqrt(np.maximum(cov[ib1, ib1] + cov[ig1, ig1] + 2.0 * cov[ib1, ig1], 0.0))
+    # rows alternate group0/group1 per bin
+    order = np.argsort(np.r_[2 * np.arange(len(base)), 2 * np.flatnonzero(has_g) + 1], kind="stable")
+    est, se = np.r_[b, est1][order], np.r_[se0, se1][order]
+    terms = np.r_[base, base[has_g]][order]
+    kinds = np.r_[np.full(len(base), "group0_effect", dtype=object), np.full(int(has_g.sum()), "group1_effect", dtype=object)][order]
+    out.add_terms(terms, est, se, kind=kinds, bin_mid=_bin_mids(terms), ref_bin=ref, n=n)
+
+    out_df = out.to_frame()
+    if bands is not None:
+        paths = {
+            "baseline_bin": cov[np.ix_(ib, ib)],
+            "interaction_bin": cov[np.ix_(ii, ii)],
+            "group0_effect": cov[np.ix_(ib, ib)],
+            "group1_effect": cov[np.ix_(ib1, ib1)] + cov[np.ix_(ig1, ig1)] + cov[np.ix_(ib1, ig1)] + cov[np.ix_(ig1, ib1)],
+        }
+        crit = dict(zip(paths, sup_t_critical(list(paths.values()), bands)))
+        out_df = _attach_bands(out_df, out_df["kind"].map(crit).to_numpy(dtype=float))
+    if bootstrap is not None:
+        eye = np.eye(len(robust.params))
+        combos = np.r_[eye[ib], eye[ii], np.r_[eye[ib], eye[ib1] + eye[ig1]][order]]
+        out_df = _attach_bootstrap(out_df, robust, combos, work.loc[y.index, bootstrap.cluster], bootstrap)
     out_df["event_date"] = event_date
     return out_df, robust
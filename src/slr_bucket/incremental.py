@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .config import PipelineConfig
+from .runner import _estimate_series, _map, estimate_by_series, estimate_pooled, merge_controls, series_cells
+from .sharing import PanelStore
+from .validation import history_hash, row_hashes
+
+logger = logging.getLogger(__name__)
+
+STATE_TABLES = ("panel", "jumps", "bins", "pooled_jumps", "pooled_es")
+# Result tables and the key columns identifying one re-estimable cell.
+CELL_KEYS = {
+    "jumps": ["series", "event", "window"],
+    "bins": ["series", "event"],
+    "pooled_jumps": ["event", "window"],
+    "pooled_es": ["event_date"],
+}
+
+
+def _reach(dates: np.ndarray, event: str) -> int:
+    """Trading days observed after ``event``'s t0 (``-1`` when the event is past the last date)."""
+    ref = np.searchsorted(dates, np.datetime64(pd.Timestamp(event)), side="left")
+    return len(dates) - 1 - int(ref) if ref < len(dates) else -1
+
+
+def _splice(old: pd.DataFrame, new: pd.DataFrame, keys: list[str], cells: set[tuple]) -> pd.DataFrame:
+    if old.empty or not cells:
+        return pd.concat([old, new], ignore_index=True) if not new.empty else old
+    stale = pd.MultiIndex.from_frame(old[keys].astype(str)).isin([tuple(map(str, c)) for c in cells])
+    return pd.concat([old[~stale], new], ignore_index=True)
+
+
+class IncrementalUpdate:
+    """Reuse the last run's panel and estimates when outcome rows were only appended.
+
+    State lives in ``<cache_root>/incremental/<config hash>/``. A run is ``unchanged`` when no
+    dates are newer than the cached panel, ``append`` when outcomes and the used controls are
+    identical up to the cached max date, and ``full`` otherwise. In append mode only cells
+    whose trading-day window (or widest event bin) reaches past the cached max date, or
+    whose event lies beyond it, are re-estimated.
+    """
+
+    def __init__(self, repo_root: Path, config: PipelineConfig, outcomes: pd.DataFrame, controls: pd.DataFrame) -> None:
+        self.config = config
+        self.root = repo_root / config.cache_root / "incremental" / config.to_hash()
+        self.outcomes = outcomes
+        wanted = list(dict.fromkeys([*config.total_controls, *config.direct_controls]))
+        self.controls = controls[["date", *[c for c in wanted if c in controls.columns]]]
+        self.hashes = {"outcomes": row_hashes(self.outcomes), "controls": row_hashes(self.controls)}
+        self.old: dict[str, pd.DataFrame] = {}
+        manifest_path = self.root / "manifest.json"
+        self.manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else None
+        for name in STATE_TABLES:
+            p = self.root / f"{name}.parquet"
+            if p.exists():
+                self.old[name] = pd.read_parquet(p)
+        self.mode, self.reason = self._plan()
+        self.info: dict[str, Any] = {"mode": self.mode, "reason": self.reason, "state_dir": str(self.root)}
+        logger.info("incremental: %s (%s)", self.mode, self.reason)
+
+    def _history_hash(self, name: str, upto: pd.Timestamp) -> str:
+        frame = self.outcomes if name == "outcomes" else self.controls
+        return history_hash(self.hashes[name], frame["date"], upto)
+
+    def _plan(self) -> tuple[str, str]:
+        if self.manifest is None or "panel" not in self.old:
+            return "full", "no cached state"
+        last = pd.Timestamp(self.manifest["max_date"])
+        if self._history_hash("outcomes", last) != self.manifest["outcomes_hash"]:
+            return "full", "outcome history changed"
+        if self._history_hash("controls", last) != self.manifest["controls_hash"]:
+            return "full", "control history changed"
+        if not (self.outcomes["date"] > last).any():
+            return "unchanged", f"no dates after {last.date()}"
+        return "append", f"new dates after {last.date()}"
+
+    def update_panel(self) -> pd.DataFrame:
+        if self.mode == "full":
+            return merge_controls(self.outcomes, self.controls, self.config)
+        if self.mode == "unchanged":
+            return self.old["panel"]
+        last = pd.Timestamp(self.manifest["max_date"])
+        new = self.outcomes[self.outcomes["date"] > last]
+        # Controls often lag outcomes by a day; the merge-quality check is left to full runs.
+        appended = new.merge(self.controls, on="date", how="left", validate="m:1")
+        self.info["rows_appended"] = len(appended)
+        return pd.concat([self.old["panel"], appended], ignore_index=True)
+
+    def _hits(self) -> tuple[dict[tuple[str, str], list[int]], set[tuple[str, str]], dict[str, tuple[list[int], bool]]]:
+        cfg = self.config
+        widest = max((high for _, high in cfg.event_bins), default=0)
+        windows: dict[tuple[str, str], list[int]] = {}
+        bins: set[tuple[str, str]] = set()
+        min_reach = {e: np.inf for e in cfg.event_dates}
+        old = self.old["panel"]
+        reach_by_series = {
+            str(s): np.unique(g["date"].to_numpy(dtype="datetime64[ns]")) for s, g in old.groupby("series", sort=False)
+        }
+        for series in self.outcomes["series"].astype(str).unique():
+            dates = reach_by_series.get(series, np.array([], dtype="datetime64[ns]"))
+            for e in cfg.event_dates:
+                reach = _reach(dates, e)
+                min_reach[e] = min(min_reach[e], reach)
+                windows[(series, e)] = [w for w in cfg.windows if reach < w]
+                if reach < widest:
+                    bins.add((series, e))
+        pooled = {e: ([w for w in cfg.windows if r < w], r < widest) for e, r in min_reach.items()}
+        return windows, bins, pooled
+
+    def estimate_by_series(
+        self,
+        panel: pd.DataFrame,
+        jobs: int = 1,
+        kinds: Iterable[str] = ("jumps", "event_bins"),
+        store: PanelStore | None = None,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        kinds = frozenset(kinds)
+        if self.mode == "full" or not {"jumps", "bins"} <= set(self.old):
+            return estimate_by_series(panel, self.config, jobs=jobs, kinds=kinds)
+        if self.mode == "unchanged":
+            return self.old["jumps"], self.old["bins"]
+
+        windows, bins, _ = self._hits()
+        tasks, jump_cells, bin_cells = [], set(), set()
+        for data, meta in series_cells(panel, store if jobs > 1 else None):
+            series = str(meta["series"])
+            for e in self.config.event_dates:
+                ws = windows.get((series, e), list(self.config.windows)) if "jumps" in kinds else []
+                do_bins = "event_bins" in kinds and (series, e) in bins
+                if not ws and not do_bins:
+                    continue
+                k = frozenset(({"jumps"} if ws else set()) | ({"event_bins"} if do_bins else set()))
+                tasks.append((data, meta, replace(self.config, event_dates=[e], windows=ws), k))
+                jump_cells.update((series, e, w) for w in ws)
+                if do_bins:
+                    bin_cells.add((series, e))
+        results = _map(_estimate_series, tasks, jobs)
+        new_jumps = pd.DataFrame([r for rows, _ in results for r in rows])
+        frames = [f for _, fs in results for f in fs]
+        new_bins = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        self.info.update(jump_cells_refit=len(jump_cells), bin_cells_refit=len(bin_cells))
+        return (
+            _splice(self.old["jumps"], new_jumps, CELL_KEYS["jumps"], jump_cells),
+            _splice(self.old["bins"], new_bins, CELL_KEYS["bins"], bin_cells),
+        )
+
+    def estimate_pooled(self, panel: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        if self.mode == "full" or not {"pooled_jumps", "pooled_es"} <= set(self.old):
+            return estimate_pooled(panel, self.config)
+        if self.mode == "unchanged":
+            return self.old["pooled_jumps"], self.old["pooled_es"]
+        _, _, pooled = self._hits()
+        jumps, es = self.old["pooled_jumps"], self.old["pooled_es"]
+        for event, (ws, es_hit) in pooled.items():
+            if not ws and not es_hit:
+                continue
+            pj, pes = estimate_pooled(panel, replace(self.config, event_dates=[event], windows=ws))
+            jumps = _splice(jumps, pj, CELL_KEYS["pooled_jumps"], {(event, w) for w in ws})
+            if es_hit:
+                es = _splice(es, pes, CELL_KEYS["pooled_es"], {(event,)})
+        return jumps, es
+
+    def save(self, tables: dict[str, pd.DataFrame | None]) -> None:
+        """Persist this run's tables; a ``None`` table (stage not run) is dropped so the next run refits it."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        for name in STATE_TABLES:
+            p = self.root / f"{name}.parquet"
+            df = tables.get(name)
+            if df is not None:
+                df.to_parquet(p, index=False)
+            elif p.exists():
+                p.unlink()
+        last = tables["panel"]["date"].max()
+        manifest = {
+            "config_hash": self.config.to_hash(),
+            "max_date": str(last),
+            "rows": {s: int(n) for s, n in tables["panel"]["strategy"].value_counts().items()},
+            "outcomes_hash": self._history_hash("outcomes", last),
+            "controls_hash": self._history_hash("controls", last),
+        }
+        (self.root / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import cProfile
+import csv
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:  # POSIX only; RSS high-water mark is skipped elsewhere
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+@dataclass
+class StageRecord:
+    name: str
+    kind: str = "stage"
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_mem_mb: float | None = None
+    rss_max_mb: float | None = None
+    rows_in: int | None = None
+    rows_out: int | None = None
+
+
+class _Frame:
+    __slots__ = ("peak", "base", "rows_out")
+
+    def __init__(self, base: int) -> None:
+        self.peak = base
+        self.base = base
+        self.rows_out: int | None = None
+
+
+def _rss_max_mb() -> float | None:
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _add(a: int | None, b: int | None) -> int | None:
+    if b is None:
+        return a
+    return b if a is None else a + b
+
+
+class Recorder:
+    """Aggregates wall/CPU time, memory and row counts per stage or instrumented function.
+
+    Function-level records only see calls made in this process; estimates run in
+    ``--jobs`` workers show up in the enclosing stage's wall time only.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.trace_memory = False
+        self.profile_dir: Path | None = None
+        self.records: dict[str, StageRecord] = {}
+        self._stack: list[_Frame] = []
+        self._profiling = False
+        self._owns_tracing = False
+
+    def configure(self, enabled: bool = True, trace_memory: bool = False, profile_dir: Path | None = None) -> None:
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.profile_dir = Path(profile_dir) if profile_dir is not None else None
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        elif not trace_memory and self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def reset(self) -> None:
+        self.records.clear()
+        self._stack.clear()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int | None = None, kind: str = "stage") -> Iterator[_Frame]:
+        """Time a block; set ``frame.rows_out`` inside the block to record output rows."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            _, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+        frame = _Frame(tracemalloc.get_traced_memory()[0] if tracing else 0)
+        self._stack.append(frame)
+
+        profiler = None
+        if kind == "stage" and self.profile_dir is not None and not self._profiling:
+            profiler = cProfile.Profile()
+            self._profiling = True
+            profiler.enable()
+        w0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield frame
+        finally:
+            wall, cpu = time.perf_counter() - w0, time.process_time() - c0
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(str(self.profile_dir / f"{name}.prof"))
+            self._stack.pop()
+            peak_mb = None
+            if tracing:
+                peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1].peak = max(self._stack[-1].peak, peak)
+                peak_mb = (peak - frame.base) / 2**20
+
+            rec = self.records.setdefault(name, StageRecord(name=name, kind=kind))
+            rec.calls += 1
+            rec.wall_s += wall
+            rec.cpu_s += cpu
+            if peak_mb is not None:
+                rec.peak_mem_mb = max(rec.peak_mem_mb or 0.0, peak_mb)
+            rec.rss_max_mb = _rss_max_mb()
+            rec.rows_in = _add(rec.rows_in, rows_in)
+            rec.rows_out = _add(rec.rows_out, frame.rows_out)
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        return [asdict(r) for r in self.records.values()]
+
+    def write(self, run_dir: Path, history_csv: Path | None = None, run_id: str | None = None) -> Path:
+        """Write ``tables/stage_timings.csv``, merge into ``run_metadata.json`` and append to a history CSV."""
+        rows = self.to_rows()
+        fields = list(StageRecord.__dataclass_fields__)
+        out = run_dir / "tables" / "stage_timings.csv"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with out.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        meta_path = run_dir / "run_metadata.json"
+        meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+        meta["instrumentation"] = rows
+        if self.profile_dir is not None:
+            meta["profile_dir"] = str(self.profile_dir)
+        meta_path.write_text(json.dumps(meta, indent=2, default=str), encoding="utf-8")
+
+        if history_csv is not None:
+            history_csv.parent.mkdir(parents=True, exist_ok=True)
+            new = not history_csv.exists()
+            with history_csv.open("a", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["run_id", *fields])
+                if new:
+                    writer.writeheader()
+                writer.writerows({"run_id": run_id or run_dir.name, **r} for r in rows)
+        return out
+
+
+RECORDER = Recorder()
+
+
+def count_rows(value: Any) -> int | None:
+    if hasattr(value, "shape") and getattr(value, "ndim", 0) >= 1:
+        return int(value.shape[0])
+    if isinstance(value, tuple) and value and hasattr(value[0], "shape"):
+        return int(value[0].shape[0])
+    return None
+
+
+def instrumented(name: str | None = None, rows_out: Callable[[Any], int | None] | None = None) -> Callable:
+    """Decorator recording calls of a hot function into :data:`RECORDER` when it is enabled.
+
+    Rows in are taken from the first positional argument's length; rows out from the
+    result (or ``rows_out(result)``). Disabled recorders add one attribute check per call.
+    """
+
+    def deco(fn: Callable) -> Callable:
+        label = name or fn.__name__
+        count_out = rows_out or count_rows
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not RECORDER.enabled:
+                return fn(*args, **kwargs)
+            n_in = count_rows(args[0]) if args else None
+            with RECORDER.stage(label, rows_in=n_in, kind="function") as frame:
+                result = fn(*args, **kwargs)
+                frame.rows_out = count_out(result)
+            return result
+
+        return wrapper
+
+    return deco
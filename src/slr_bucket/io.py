@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 
-import pandas as pd
+from ._lazy import LazyModule
+
+# pandas is only needed once a table is actually loaded; path resolution stays import-light.
+pd = LazyModule("pandas")
+np = LazyModule("numpy")
 
 logger = logging.getLogger(__name__)
 
@@ -232,4 +237,113 @@ def keep_controls_with_coverage(
     if len(out) < min_rows and required_cols:
         out = df[required_cols].dropna(subset=required_cols).copy()
 
-    return out
\ No newline at end of file
+    return out
+
+
+@dataclass(frozen=True)
+class CellRows:
+    """Usable panel rows per cell in CSR layout: cell ``i`` owns ``indices[indptr[i]:indptr[i + 1]]``.
+
+    ``indices`` are positions in ``panel`` order, sorted by date within each cell.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+
+def _pattern_counts(notna, patterns, pid, lo, hi):
+    """Per-pattern row-ok matrix and each cell's count of ok rows in ``[lo, hi)``."""
+    ok = np.stack([notna[:, p].all(axis=1) for p in patterns]) if len(patterns) else np.zeros((0, len(notna)), dtype=bool)
+    cum = np.concatenate([np.zeros((len(patterns), 1), dtype=np.int64), np.cumsum(ok, axis=1)], axis=1)
+    return ok, cum[pid, hi] - cum[pid, lo]
+
+
+def select_controls_by_window(
+    panel: pd.DataFrame,
+    cols: list[str],
+    event_dates: list[str],
+    windows: list[int],
+    required_cols: list[str] | None = None,
+    min_coverage: float = 0.80,
+    min_rows: int = 30,
+    series_col: str = "series",
+    date_col: str = "date",
+) -> tuple[pd.DataFrame, CellRows]:
+    """
+    keep_controls_with_coverage for every (series, event, window) cell in one call.
+
+    Windows are trading-day positions around each event within a series (as in
+    add_event_time). Non-missing counts are cumulated once along each series, so a
+    cell's coverage is a difference of two rows; usable-row counts are cumulated once per
+    distinct control selection. Returns one row per cell (selected ``controls``,
+    ``relaxed`` when optionals were dropped for min_rows) and the usable rows of every
+    cell as :class:`CellRows` (memory grows with the window sizes, not cells x panel).
+    """
+    required = [c for c in dict.fromkeys(required_cols or []) if c in panel.columns]
+    optional = [c for c in dict.fromkeys(cols) if c in panel.columns and c not in required]
+    use_cols = required + optional
+
+    dates = pd.to_datetime(panel[date_col], errors="coerce").to_numpy(dtype="datetime64[ns]")
+    codes, labels = pd.factorize(panel[series_col], sort=True)
+    valid = (codes >= 0) & ~np.isnat(dates)
+    order = np.flatnonzero(valid)[np.lexsort((dates[valid], codes[valid]))]
+    d, c = dates[order], codes[order]
+    notna = panel[use_cols].notna().to_numpy()[order] if use_cols else np.ones((len(order), 0), dtype=bool)
+    cum = np.vstack([np.zeros((1, len(use_cols)), dtype=np.int64), np.cumsum(notna, axis=0)])
+
+    starts = np.searchsorted(c, np.arange(len(labels)), side="left")
+    stops = np.searchsorted(c, np.arange(len(labels)), side="right")
+    events = pd.to_datetime(list(event_dates)).to_numpy(dtype="datetime64[ns]")
+    win = np.asarray(list(windows), dtype=np.int64)
+
+    rows, los, his = [], [], []
+    for k, (s0, s1) in enumerate(zip(starts, stops)):
+        if s1 == s0:
+            continue
+        # trading-day position of every row (duplicate dates share a position)
+        uniq, pos = np.unique(d[s0:s1], return_inverse=True)
+        ref = np.minimum(np.searchsorted(uniq, events, side="left"), len(uniq) - 1)
+        lo = s0 + np.searchsorted(pos, ref[:, None] - win[None, :], side="left")
+        hi = s0 + np.searchsorted(pos, ref[:, None] + win[None, :], side="right")
+        for e, event in enumerate(event_dates):
+            for w, window in enumerate(windows):
+                rows.append({series_col: labels[k], "event": event, "window": int(window), "event_t0": pd.Timestamp(uniq[ref[e]])})
+                los.append(lo[e, w])
+                his.append(hi[e, w])
+
+    lo, hi = np.asarray(los, dtype=np.int64), np.asarray(his, dtype=np.int64)
+    n_rows = hi - lo
+    with np.errstate(invalid="ignore", divide="ignore"):
+        coverage = (cum[hi] - cum[lo]) / n_rows[:, None]
+    keep = np.zeros_like(coverage, dtype=bool)
+    keep[:, : len(required)] = True
+    keep[:, len(required):] = coverage[:, len(required):] >= min_coverage
+
+    # cells sharing a control selection share one cumulative usable-row count
+    patterns, pid = np.unique(keep, axis=0, return_inverse=True)
+    _, n_ok = _pattern_counts(notna, patterns, pid.ravel(), lo, hi)
+    relaxed = (n_ok < min_rows) & bool(required)
+    keep[relaxed, len(required):] = False
+    patterns, pid = np.unique(keep, axis=0, return_inverse=True)
+    pid = pid.ravel()
+    ok, n_usable = _pattern_counts(notna, patterns, pid, lo, hi)
+
+    # every cell's window rows laid end to end, filtered by its selection's row-ok mask
+    cell = np.repeat(np.arange(len(lo)), n_rows)
+    at = np.arange(n_rows.sum()) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows) + np.repeat(lo, n_rows)
+    sel = ok[pid[cell], at]
+    indptr = np.r_[0, np.cumsum(np.bincount(cell[sel], minlength=len(lo)))].astype(np.int64)
+
+    controls = [[col for col, k in zip(use_cols, p) if k] for p in patterns]
+    out = pd.DataFrame(rows)
+    if rows:
+        out = out.assign(
+            rows=n_rows, controls=[controls[j] for j in pid], n_usable=n_usable.astype(int), relaxed=relaxed,
+        )
+    return out, CellRows(indptr, order[at[sel]])
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ESTIMATOR_CACHE = "estimators"  # disk tier directory under PipelineConfig.cache_root
+# Bump when an estimator's output changes for the same inputs, so disk entries are not reused.
+MEMO_VERSION = 1
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(v) for v in value)
+    return value
+
+
+class EstimatorCache:
+    """In-process LRU of estimator results with an optional pickle tier on disk.
+
+    Keys are :func:`memoized` fingerprints. ``max_entries`` bounds the in-memory tier;
+    with a ``disk_dir`` every miss is also written to ``<disk_dir>/<key>.pkl`` and a memory
+    miss falls back to it, so a new process (a notebook restart, a sweep re-run) only
+    refits cells whose inputs changed. Counters are per function and per process: calls
+    made in ``--jobs`` workers count in the worker only (the disk tier is shared).
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.max_entries = 256
+        self.disk_dir: Path | None = None
+        self.entries: OrderedDict[str, Any] = OrderedDict()
+        self.counts: dict[str, Counter] = {}
+
+    def configure(self, enabled: bool = True, max_entries: int = 256, disk_dir: Path | None = None) -> None:
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the in-memory entries and counters (and the disk tier's pickles with ``disk=True``)."""
+        self.entries.clear()
+        self.counts.clear()
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.glob("*.pkl"):
+                path.unlink()
+
+    def _count(self, name: str, event: str) -> None:
+        self.counts.setdefault(name, Counter())[event] += 1
+
+    def get(self, name: str, key: str) -> tuple[bool, Any]:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self._count(name, "hits")
+            return True, _copy(self.entries[key])
+        path = self.disk_dir / f"{key}.pkl" if self.disk_dir is not None else None
+        if path is not None and path.exists():
+            try:
+                value = pickle.loads(path.read_bytes())
+            except Exception:  # truncated or written by an incompatible version: refit
+                logger.warning("memo: unreadable cache entry %s, refitting", path.name)
+            else:
+                self._count(name, "disk_hits")
+                self._remember(key, value)
+                return True, _copy(value)
+        self._count(name, "misses")
+        return False, None
+
+    def put(self, name: str, key: str, value: Any, persist: Any = None) -> None:
+        """Store ``value`` in memory; ``persist`` (default ``value``) is what goes to disk."""
+        self._remember(key, _copy(value))
+        if self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        path = self.disk_dir / f"{key}.pkl"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(value if persist is None else persist, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)  # workers may race on the same key; last complete write wins
+        self._count(name, "stores")
+
+    def _remember(self, key: str, value: Any) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self._count("_lru", "evictions")
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """``{function: {hits, disk_hits, misses, stores}}`` plus a ``total`` row."""
+        fields = ("hits", "disk_hits", "misses", "stores")
+        out = {name: {f: int(c[f]) for f in fields} for name, c in self.counts.items() if name != "_lru"}
+        out["total"] = {f: sum(row[f] for row in out.values()) for f in fields}
+        out["total"].update(entries=len(self.entries), evictions=int(self.counts.get("_lru", Counter())["evictions"]))
+        return out
+
+
+MEMO = EstimatorCache()
+
+
+def window_rows(dates: pd.Series, event_date: str, low: int, high: int) -> np.ndarray:
+    """Rows whose trading-day event time lies in ``[low, high]``.
+
+    Same anchor as :func:`~slr_bucket.econometrics.event_study.add_event_time` (first
+    sample date on/after the event, else the last one), without building the column.
+    """
+    d = pd.to_datetime(dates, errors="coerce")
+    valid = d.notna().to_numpy()
+    days = np.unique(d[valid].to_numpy())
+    if len(days) == 0:
+        return np.zeros(len(d), dtype=bool)
+    ref = min(int(np.searchsorted(days, np.datetime64(pd.Timestamp(event_date)), side="left")), len(days) - 1)
+    pos = np.full(len(d), np.iinfo(np.int64).min)
+    pos[valid] = np.searchsorted(days, d[valid].to_numpy(), side="left") - ref
+    return valid & (pos >= low) & (pos <= high)
+
+
+def slice_fingerprint(df: pd.DataFrame, columns: Iterable[str], rows: np.ndarray) -> str:
+    """sha256 over the names and row-ordered values of ``columns`` restricted to ``rows``."""
+    if df.columns.duplicated().any():
+        df = df.loc[:, ~df.columns.duplicated()]
+    cols = [c for c in dict.fromkeys(columns) if c is not None and c in df.columns]
+    h = hashlib.sha256(json.dumps([str(c) for c in cols]).encode())
+    h.update(pd.util.hash_pandas_object(df.loc[rows, cols], index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def memoized(
+    span: Callable[[dict[str, Any]], tuple[int, int]],
+    columns: Callable[[dict[str, Any]], Iterable[str | None]],
+    persist: Callable[[Any], Any] | None = None,
+    data_arg: str = "df",
+    date_col: str = "date",
+) -> Callable:
+    """Decorator caching an event-window estimator in :data:`MEMO` when it is enabled.
+
+    The key hashes every argument except ``data_arg`` (dataclass specs by ``repr``) and
+    only the rows and columns the fit can see: ``columns(args)`` over rows whose event
+    time is within ``span(args)``. Edits outside the window therefore still hit, and any
+    change inside it refits. ``persist`` maps a result to what the disk tier stores.
+    Disabled caches add one attribute check per call.
+    """
+
+    def deco(fn: Callable) -> Callable:
+        name = fn.__name__
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not MEMO.enabled:
+                return fn(*args, **kwargs)
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            a = bound.arguments
+            spec = {k: v for k, v in a.items() if k != data_arg}
+            low, high = span(a)
+            df = a[data_arg]
+            rows = window_rows(df[date_col], a["event_date"], low, high)
+            head = json.dumps([name, MEMO_VERSION, spec], default=repr, sort_keys=True)
+            key = hashlib.sha256((head + slice_fingerprint(df, [date_col, *columns(a)], rows)).encode()).hexdigest()[:32]
+            hit, value = MEMO.get(name, key)
+            if hit:
+                return value
+            result = fn(*args, **kwargs)
+            MEMO.put(name, key, result, persist(result) if persist is not None else None)
+            return result
+
+        return wrapper
+
+    return deco
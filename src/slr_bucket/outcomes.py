@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 
 from .io import load_any_table, as_daily_date
+from .units import UnitManifest
 
 
 @dataclass(frozen=True)
@@ -42,21 +43,33 @@ def _scale_to_bps(x: pd.Series) -> pd.Series:
     return s
 
 
-def load_tips_treasury_arb(path: Path, pattern: str = "arb_") -> pd.DataFrame:
+def _column_bps(
+    values: pd.Series, columns: pd.Series, path: Path, units: UnitManifest | None, wide: pd.DataFrame,
+) -> pd.Series:
+    """Scale each raw column's values to bps with its own recorded (or freshly inferred) unit.
+
+    ``columns`` names the source column of every value; ``wide`` is the loaded file, sketched
+    in place of re-reading ``path`` when a column has no recorded unit yet.
+    """
+    scales = (units or UnitManifest()).scales(path, columns.astype(str).unique(), data=wide)
+    return pd.to_numeric(values, errors="coerce") * columns.astype(str).map(scales).to_numpy()
+
+
+def load_tips_treasury_arb(path: Path, pattern: str = "arb_", units: UnitManifest | None = None) -> pd.DataFrame:
     df = _ensure_date(load_any_table(path))
     cols = [c for c in df.columns if str(c).startswith(pattern)]
     if not cols:
         raise ValueError(f"No columns starting with '{pattern}' in {path.name}")
     long = df[["date", *cols]].melt(id_vars=["date"], var_name="series", value_name="y_raw")
     long["tenor"] = long["series"].str.extract(r"(\d+)").astype(float)
-    long["y_bps"] = _scale_to_bps(long["y_raw"])
+    long["y_bps"] = _column_bps(long["y_raw"], long["series"], path, units, df)
     long["strategy"] = "TIPS_Treasury"
     long["treasury_based"] = 1
     long["series"] = long["series"].astype(str)
     return long[["date","strategy","series","tenor","y_bps","treasury_based"]].dropna(subset=["date","y_bps"])
 
 
-def load_treasury_spot_futures(path: Path) -> pd.DataFrame:
+def load_treasury_spot_futures(path: Path, units: UnitManifest | None = None) -> pd.DataFrame:
     df = _ensure_date(load_any_table(path))
     # columns like Treasury_SF_2Y, Treasury_SF_10Y...
     cols = [c for c in df.columns if str(c).lower().startswith("treasury_sf_") or str(c).lower().startswith("treasury_sf")]
@@ -67,30 +80,30 @@ def load_treasury_spot_futures(path: Path) -> pd.DataFrame:
         raise ValueError(f"No Treasury spot-futures columns found in {path.name}")
     long = df[["date", *cols]].melt(id_vars=["date"], var_name="series", value_name="y_raw")
     long["tenor"] = long["series"].str.extract(r"(\d+)Y").astype(float)
-    long["y_bps"] = _scale_to_bps(long["y_raw"])
+    long["y_bps"] = _column_bps(long["y_raw"], long["series"], path, units, df)
     long["strategy"] = "Treasury_SpotFutures"
     long["treasury_based"] = 1
     long["series"] = long["series"].astype(str)
     return long[["date","strategy","series","tenor","y_bps","treasury_based"]].dropna(subset=["date","y_bps"])
 
 
-def load_cip_basis(path: Path, tenor_years: float = 0.25) -> pd.DataFrame:
+def load_cip_basis(path: Path, tenor_years: float = 0.25, units: UnitManifest | None = None) -> pd.DataFrame:
     df = _ensure_date(load_any_table(path))
     cols = [c for c in df.columns if str(c).startswith("CIP_")]
     if not cols:
         raise ValueError(f"No CIP_* columns found in {path.name}")
     long = df[["date", *cols]].melt(id_vars=["date"], var_name="series", value_name="y_raw")
     long["series"] = long["series"].astype(str)
+    long["y_bps"] = _column_bps(long["y_raw"], long["series"], path, units, df)
     # normalize series name
     long["series"] = long["series"].str.replace("_ln", "", regex=False)
     long["tenor"] = tenor_years
-    long["y_bps"] = _scale_to_bps(long["y_raw"])
     long["strategy"] = "CIP"
     long["treasury_based"] = 0
     return long[["date","strategy","series","tenor","y_bps","treasury_based"]].dropna(subset=["date","y_bps"])
 
 
-def load_equity_spot_futures(path: Path, index_code: str) -> pd.DataFrame:
+def load_equity_spot_futures(path: Path, index_code: str, units: UnitManifest | None = None) -> pd.DataFrame:
     df = _ensure_date(load_any_table(path))
     # prefer filtered if present
     cand1 = f"spread_{index_code}_filtered"
@@ -105,8 +118,7 @@ def load_equity_spot_futures(path: Path, index_code: str) -> pd.DataFrame:
         if not cols:
             raise ValueError(f"No spread column found in {path.name}")
         spread = df[cols[0]]
-        cand2 = cols[0]
-    y_bps = _scale_to_bps(spread)
+    y_bps = _column_bps(spread, pd.Series(str(spread.name), index=spread.index), path, units, df)
     out = pd.DataFrame({
         "date": df["date"],
         "strategy": "Equity_SpotFutures",
@@ -118,24 +130,59 @@ def load_equity_spot_futures(path: Path, index_code: str) -> pd.DataFrame:
     return out.dropna(subset=["date","y_bps"])
 
 
-def stack_outcomes(series_dir: Path) -> pd.DataFrame:
+# Strategy modes understood by the headless runner. EQUITY_<IDX> resolves
+# data/series/equity_spot_spread_<IDX>; SPY is the notebook's name for SPX.
+STRATEGY_MODES = ("TIPS", "UST_SF", "CIP", "EQUITY_SPX", "EQUITY_NDX", "EQUITY_INDU")
+EQUITY_ALIASES = {"SPY": "SPX"}
+
+
+def series_path(series_dir: Path, stem: str) -> Path:
+    """Parquet built by :mod:`slr_bucket.spreads` when present, else the shipped ``<stem>.csv``."""
+    pq = series_dir / f"{stem}.parquet"
+    return pq if pq.exists() else series_dir / f"{stem}.csv"
+
+
+def load_strategy_outcomes(series_dir: Path, mode: str, units: UnitManifest | None = None) -> pd.DataFrame:
+    """Load the long outcome frame for a single strategy mode (e.g. ``TIPS``, ``EQUITY_NDX``).
+
+    ``units`` carries the per-series bps scaling decisions; without one each column's unit
+    is inferred on the fly and not persisted.
+    """
+    key = mode.upper()
+    if key == "TIPS":
+        return load_tips_treasury_arb(series_dir / "tips_treasury_implied_rf_2010.parquet", units=units)
+    if key == "UST_SF":
+        return load_treasury_spot_futures(series_dir / "treasury_sf_output.csv", units=units)
+    if key == "CIP":
+        return load_cip_basis(series_path(series_dir, "cip_spreads_3m_bps"), tenor_years=0.25, units=units)
+    if key.startswith("EQUITY_"):
+        idx = key.split("_", 1)[1]
+        idx = EQUITY_ALIASES.get(idx, idx)
+        p = series_path(series_dir, f"equity_spot_spread_{idx}")
+        if not p.exists():
+            raise FileNotFoundError(f"No equity spread file for {mode}: {p}")
+        return load_equity_spot_futures(p, idx, units=units)
+    raise ValueError(f"Unknown strategy mode '{mode}'. Expected one of {STRATEGY_MODES} or EQUITY_<IDX>.")
+
+
+def stack_outcomes(series_dir: Path, units: UnitManifest | None = None) -> pd.DataFrame:
     """Load all outcomes needed for the multi-strategy pipeline from data/series."""
     parts: list[pd.DataFrame] = []
 
     # TIPS-Treasury (arb_*): parquet
-    parts.append(load_tips_treasury_arb(series_dir / "tips_treasury_implied_rf_2010.parquet"))
+    parts.append(load_tips_treasury_arb(series_dir / "tips_treasury_implied_rf_2010.parquet", units=units))
 
     # Treasury spot-futures
-    parts.append(load_treasury_spot_futures(series_dir / "treasury_sf_output.csv"))
+    parts.append(load_treasury_spot_futures(series_dir / "treasury_sf_output.csv", units=units))
 
     # CIP basis (3m)
-    parts.append(load_cip_basis(series_dir / "cip_spreads_3m_bps.csv", tenor_years=0.25))
+    parts.append(load_cip_basis(series_path(series_dir, "cip_spreads_3m_bps"), tenor_years=0.25, units=units))
 
     # Equity spot-futures (indices)
     for idx in ["SPX", "NDX", "INDU"]:
-        p = series_dir / f"equity_spot_spread_{idx}.csv"
+        p = series_path(series_dir, f"equity_spot_spread_{idx}")
         if p.exists():
-            parts.append(load_equity_spot_futures(p, idx))
+            parts.append(load_equity_spot_futures(p, idx, units=units))
 
     out = pd.concat(parts, ignore_index=True)
     # add magnitude column used for baseline hypothesis (dislocation size)
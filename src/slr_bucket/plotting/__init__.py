@@ -1 +1,2 @@
 from .plots import *
+from .batch import PlotJob, render_jobs
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .plots import _save, draw_binned_event_overlay, draw_event_paths, draw_series_with_events, plt
+
+# Bump when drawing code changes so cached figures are re-rendered.
+RENDER_VERSION = 1
+MANIFEST_NAME = ".figure_manifest.json"
+DRAWERS = {
+    "series_with_events": draw_series_with_events,
+    "event_paths": draw_event_paths,
+    "binned_event_overlay": draw_binned_event_overlay,
+}
+
+
+@dataclass
+class PlotJob:
+    """One figure: ``kind`` selects the drawer, ``options`` are its extra keyword arguments."""
+
+    kind: str
+    data: pd.DataFrame
+    title: str
+    outpath: Path
+    options: dict[str, Any] = field(default_factory=dict)
+    figsize: tuple[float, float] = (10, 5)
+    dpi: int = 160
+
+    def fingerprint(self) -> str:
+        h = hashlib.sha256()
+        h.update(pd.util.hash_pandas_object(self.data, index=False).to_numpy().tobytes())
+        style = {
+            "version": RENDER_VERSION, "kind": self.kind, "title": self.title, "columns": list(map(str, self.data.columns)),
+            "options": self.options, "figsize": list(self.figsize), "dpi": self.dpi,
+        }
+        h.update(json.dumps(style, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()[:16]
+
+
+# Per-process canvases reused across jobs: figsize -> (fig, ax)
+_CANVAS: dict[tuple[float, float], Any] = {}
+
+
+def _render(job: PlotJob) -> None:
+    if job.kind not in DRAWERS:
+        raise ValueError(f"Unknown plot kind '{job.kind}'. Expected one of {sorted(DRAWERS)}")
+    key = tuple(job.figsize)
+    if key not in _CANVAS:
+        _CANVAS[key] = plt.subplots(figsize=job.figsize)
+    fig, ax = _CANVAS[key]
+    ax.clear()
+    DRAWERS[job.kind](ax, job.data, title=job.title, **job.options)
+    _save(fig, Path(job.outpath), dpi=job.dpi)
+
+
+def _render_chunk(jobs: list[PlotJob]) -> int:
+    for job in jobs:
+        _render(job)
+    return len(jobs)
+
+
+def _read_manifest(directory: Path) -> dict[str, str]:
+    p = directory / MANIFEST_NAME
+    return json.loads(p.read_text(encoding="utf-8")) if p.exists() else {}
+
+
+def render_jobs(
+    jobs: list[PlotJob],
+    n_jobs: int = 1,
+    cache_dir: Path | None = None,
+    force: bool = False,
+) -> dict[str, int]:
+    """Render plot jobs, skipping figures whose data and style fingerprint are unchanged.
+
+    A figure is skipped when its output already exists with the same fingerprint in the
+    directory's ``.figure_manifest.json``, or copied from ``cache_dir/<fingerprint>.png``
+    when a previous run rendered it. The rest are split into one chunk per worker so each
+    process reuses a single Agg canvas.
+    """
+    fps = [job.fingerprint() for job in jobs]
+    manifests: dict[Path, dict[str, str]] = {}
+    todo: list[tuple[PlotJob, str]] = []
+    skipped = copied = 0
+    for job, fp in zip(jobs, fps):
+        out = Path(job.outpath)
+        manifest = manifests.setdefault(out.parent, _read_manifest(out.parent))
+        if not force and out.exists() and manifest.get(out.name) == fp:
+            skipped += 1
+            continue
+        cached = cache_dir / f"{fp}{out.suffix}" if cache_dir is not None else None
+        if not force and cached is not None and cached.exists():
+            out.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, out)
+            manifest[out.name] = fp
+            copied += 1
+            continue
+        todo.append((job, fp))
+
+    pending = [job for job, _ in todo]
+    if n_jobs <= 1 or len(pending) <= 1:
+        _render_chunk(pending)
+    else:
+        chunks = [pending[i::n_jobs] for i in range(n_jobs)]
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            list(ex.map(_render_chunk, [c for c in chunks if c]))
+
+    for job, fp in todo:
+        out = Path(job.outpath)
+        manifests[out.parent][out.name] = fp
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(out, cache_dir / f"{fp}{out.suffix}")
+    for directory, manifest in manifests.items():
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    return {"rendered": len(todo), "copied": copied, "skipped": skipped}
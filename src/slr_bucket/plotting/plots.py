@@ -2,50 +2,43 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import pandas as pd
 
+from .._lazy import LazyModule, use_headless_matplotlib
 
-def plot_series_with_events(df: pd.DataFrame, y_col: str, events: list[str], title: str, outpath: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 5))
+plt = LazyModule("matplotlib.pyplot", on_load=use_headless_matplotlib)
+
+
+def _save(fig, outpath: Path, dpi: int = 160) -> None:
+    fig.tight_layout()
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(outpath, dpi=dpi)
+
+
+def draw_series_with_events(ax, df: pd.DataFrame, y_col: str, events: list[str], title: str) -> None:
     ax.plot(df["date"], df[y_col], lw=1.2)
     for e in events:
         ax.axvline(pd.Timestamp(e), color="red", linestyle="--", alpha=0.6)
     ax.set_title(title)
     ax.set_ylabel(y_col)
     ax.grid(alpha=0.2)
-    fig.tight_layout()
-    outpath.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(outpath, dpi=160)
-    plt.close(fig)
 
 
-def plot_event_paths(df: pd.DataFrame, title: str, outpath: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 5))
+def draw_event_paths(ax, df: pd.DataFrame, title: str) -> None:
     ax.errorbar(df["term"], df["estimate"], yerr=1.96 * df["se"], fmt="o-")
     ax.axhline(0, color="black", lw=1)
     ax.set_xticklabels(df["term"], rotation=45, ha="right")
     ax.set_title(title)
     ax.grid(alpha=0.2)
-    fig.tight_layout()
-    outpath.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(outpath, dpi=160)
-    plt.close(fig)
 
 
-def plot_binned_event_overlay(
+def draw_binned_event_overlay(
+    ax,
     df: pd.DataFrame,
     title: str,
-    outpath: Path,
     x_col: str = "bin_mid",
     kind_col: str = "kind",
 ) -> None:
-    """Plot binned event-study paths.
-
-    Expects rows for at least one of: baseline_bin, interaction_bin, group0_effect, group1_effect.
-    Uses x_col as numeric x (bin midpoint).
-    """
-    fig, ax = plt.subplots(figsize=(10, 5))
     dfp = df.copy()
     dfp = dfp[pd.to_numeric(dfp[x_col], errors="coerce").notna()].copy()
     dfp[x_col] = pd.to_numeric(dfp[x_col], errors="coerce")
@@ -53,8 +46,12 @@ def plot_binned_event_overlay(
         sub = dfp[dfp[kind_col] == kind].sort_values(x_col)
         if sub.empty:
             continue
-        ax.plot(sub[x_col], sub["estimate"], marker="o", label=kind)
+        line, = ax.plot(sub[x_col], sub["estimate"], marker="o", label=kind)
         ax.fill_between(sub[x_col], sub["ci_low"], sub["ci_high"], alpha=0.15)
+        if {"band_low", "band_high"}.issubset(sub.columns) and sub["band_low"].notna().any():
+            # simultaneous band: outline only, so the pointwise interval stays readable
+            ax.plot(sub[x_col], sub["band_low"], ls=":", lw=1, color=line.get_color())
+            ax.plot(sub[x_col], sub["band_high"], ls=":", lw=1, color=line.get_color())
     ax.axhline(0, color="black", lw=1)
     ax.axvline(0, color="black", lw=1, ls="--")
     ax.set_xlabel("Event time (bin midpoint)")
@@ -62,7 +59,35 @@ def plot_binned_event_overlay(
     ax.set_title(title)
     ax.grid(alpha=0.2)
     ax.legend()
-    fig.tight_layout()
-    outpath.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(outpath, dpi=160)
+
+
+def plot_series_with_events(df: pd.DataFrame, y_col: str, events: list[str], title: str, outpath: Path) -> None:
+    fig, ax = plt.subplots(figsize=(10, 5))
+    draw_series_with_events(ax, df, y_col, events, title)
+    _save(fig, outpath)
+    plt.close(fig)
+
+
+def plot_event_paths(df: pd.DataFrame, title: str, outpath: Path) -> None:
+    fig, ax = plt.subplots(figsize=(10, 5))
+    draw_event_paths(ax, df, title)
+    _save(fig, outpath)
+    plt.close(fig)
+
+
+def plot_binned_event_overlay(
+    df: pd.DataFrame,
+    title: str,
+    outpath: Path,
+    x_col: str = "bin_mid",
+    kind_col: str = "kind",
+) -> None:
+    """Plot binned event-study paths.
+
+    Expects rows for at least one of: baseline_bin, interaction_bin, group0_effect, group1_effect.
+    Uses x_col as numeric x (bin midpoint).
+    """
+    fig, ax = plt.subplots(figsize=(10, 5))
+    draw_binned_event_overlay(ax, df, title, x_col=x_col, kind_col=kind_col)
+    _save(fig, outpath)
     plt.close(fig)
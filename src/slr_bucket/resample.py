@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .validation import history_hash, row_hashes
+
+logger = logging.getLogger(__name__)
+
+FREQ_ALIASES = {"weekly": "W-FRI", "monthly": "ME"}
+# resample() alias -> Period alias with the same bins and right-edge label
+_PERIOD_FREQ = {"ME": "M", "M": "M"}
+
+
+@dataclass(frozen=True)
+class ResampleSpec:
+    """Target frequency, per-column aggregation rules and group keys.
+
+    Columns without a rule use ``default`` when numeric and ``"first"`` otherwise.
+    Periods are labelled by their last calendar day, as ``DataFrame.resample`` does.
+    """
+
+    freq: str = "W-FRI"
+    rules: dict[str, str] = field(default_factory=dict)
+    default: str = "mean"
+    by: tuple[str, ...] = ()
+
+    @property
+    def pandas_freq(self) -> str:
+        return FREQ_ALIASES.get(self.freq, self.freq)
+
+    @property
+    def period_freq(self) -> str:
+        return _PERIOD_FREQ.get(self.pandas_freq, self.pandas_freq)
+
+    def to_hash(self) -> str:
+        payload = json.dumps({**asdict(self), "freq": self.pandas_freq}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def period_end(dates: pd.Series, spec: ResampleSpec) -> pd.Series:
+    return dates.dt.to_period(spec.period_freq).dt.end_time.dt.normalize()
+
+
+def _agg_rules(daily: pd.DataFrame, spec: ResampleSpec, date_col: str) -> dict[str, str]:
+    rules = {}
+    for c in daily.columns:
+        if c == date_col or c in spec.by:
+            continue
+        rules[c] = spec.rules.get(c, spec.default if pd.api.types.is_numeric_dtype(daily[c]) else "first")
+    return rules
+
+
+def resample_daily(daily: pd.DataFrame, spec: ResampleSpec, date_col: str = "date") -> pd.DataFrame:
+    """Aggregate a daily frame to ``spec.freq`` (only periods with data, one row per group and period)."""
+    dates = pd.to_datetime(daily[date_col], errors="coerce")
+    work = daily.assign(**{date_col: period_end(dates, spec)}).dropna(subset=[date_col])
+    keys = [*spec.by, date_col]
+    return work.groupby(keys, sort=True, dropna=False).agg(_agg_rules(daily, spec, date_col)).reset_index()
+
+
+def update_resampled(
+    daily: pd.DataFrame,
+    spec: ResampleSpec,
+    store_dir: Path,
+    name: str,
+    date_col: str = "date",
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Resampled aggregates persisted under ``store_dir/<name>_<spec hash>.parquet``.
+
+    If the stored history (all rows up to the last stored date) is unchanged, only the
+    periods from the one containing the first new date onward are recomputed and spliced in;
+    any edit to older rows triggers a full rebuild. Returns ``(aggregates, info)``.
+    """
+    store = Path(store_dir) / f"{name}_{spec.to_hash()}.parquet"
+    meta_path = store.with_suffix(".json")
+    dates = pd.to_datetime(daily[date_col], errors="coerce")
+    max_date = dates.max()
+    hashes = row_hashes(daily)
+
+    meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() and store.exists() else None
+    mode = "full"
+    if meta is not None and list(daily.columns) == meta["columns"]:
+        last = pd.Timestamp(meta["max_date"])
+        if history_hash(hashes, dates, last) == meta["prefix_hash"]:
+            mode = "unchanged" if max_date <= last else "incremental"
+
+    if mode == "unchanged":
+        out = pd.read_parquet(store)
+        n_periods = 0
+    elif mode == "incremental":
+        first_new = dates[dates > pd.Timestamp(meta["max_date"])].min()
+        start = pd.Period(first_new, spec.period_freq).start_time
+        tail = resample_daily(daily[dates >= start], spec, date_col)
+        old = pd.read_parquet(store)
+        out = pd.concat([old[old[date_col] < tail[date_col].min()], tail], ignore_index=True)
+        out = out.sort_values([*spec.by, date_col], kind="stable").reset_index(drop=True)
+        n_periods = tail[date_col].nunique()
+    else:
+        out = resample_daily(daily, spec, date_col)
+        n_periods = out[date_col].nunique()
+
+    if mode != "unchanged":
+        store.parent.mkdir(parents=True, exist_ok=True)
+        out.to_parquet(store, index=False)
+        meta_path.write_text(json.dumps({
+            "spec": asdict(spec), "columns": list(daily.columns), "rows": len(daily),
+            "max_date": str(max_date), "prefix_hash": history_hash(hashes, dates, max_date),
+        }, indent=2, default=str), encoding="utf-8")
+    info = {"mode": mode, "periods_recomputed": int(n_periods), "path": str(store)}
+    logger.info("resample %s (%s): %s, %d periods recomputed", name, spec.pandas_freq, mode, n_periods)
+    return out, info
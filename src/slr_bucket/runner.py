@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import json
+import logging
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .config import PipelineConfig, as_serializable_dict
+from .controls import load_controls_cube
+from .econometrics.event_study import (
+    SupTBands,
+    WildBootstrap,
+    block_bootstrap_jump,
+    event_study_regression,
+    jump_estimator,
+    pooled_event_study,
+    pooled_jump_regression,
+)
+from .instrument import RECORDER, count_rows
+from .io import build_data_catalog
+from .memo import ESTIMATOR_CACHE, MEMO
+from .outcomes import load_strategy_outcomes
+from .pipeline import prepare_run_dirs, refresh_latest, setup_logging, write_catalog_outputs, write_run_readme
+from .sharing import PanelHandle, PanelSlice, PanelStore, export_panel, write_panel_store
+from .units import UNITS_MANIFEST, UnitManifest
+from .validation import report_merge_quality
+from .warehouse import append_run, query_results, render_jump_table
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("catalog", "outcomes", "controls", "merge", "jumps", "event_bins", "pooled", "figures")
+SERIES_KEYS = ["strategy", "series", "tenor", "treasury_based"]
+
+
+def _tenor_label(t: Any) -> str:
+    if isinstance(t, (int, float, np.floating)) and np.isfinite(t):
+        return f"{float(t):g}"
+    return "" if pd.isna(t) else str(t)
+
+
+def _specs(config: PipelineConfig) -> list[tuple[str, list[str]]]:
+    return [("TOTAL", list(config.total_controls)), ("DIRECT", list(config.direct_controls))]
+
+
+def _map(fn: Callable, tasks: Iterable, jobs: int) -> list:
+    tasks = list(tasks)
+    if jobs <= 1 or len(tasks) <= 1:
+        return [fn(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        return list(ex.map(fn, tasks))
+
+
+def _bands(config: PipelineConfig) -> SupTBands | None:
+    return SupTBands(draws=config.sup_t_draws, seed=config.random_seed) if config.sup_t_draws > 0 else None
+
+
+def _wild(config: PipelineConfig) -> WildBootstrap | None:
+    """Pooled regressions reuse the block-bootstrap settings as a wild block bootstrap over dates."""
+    if config.bootstrap_reps <= 0:
+        return None
+    return WildBootstrap(reps=config.bootstrap_reps, block_size=config.bootstrap_block_size, seed=config.random_seed)
+
+
+def load_outcome_panel(series_dir: Path, config: PipelineConfig, units: UnitManifest | None = None) -> pd.DataFrame:
+    """Stack the configured strategy outcomes and apply series/tenor/sample filters."""
+    parts = [load_strategy_outcomes(series_dir, mode, units=units) for mode in config.strategies]
+    out = pd.concat(parts, ignore_index=True)
+    if config.dependent_series:
+        out = out[out["series"].isin(config.dependent_series)]
+    if config.tenor_subset:
+        out = out[out["tenor"].map(_tenor_label).isin([str(t) for t in config.tenor_subset])]
+    if config.sample_start:
+        out = out[out["date"] >= pd.Timestamp(config.sample_start)]
+    if config.sample_end:
+        out = out[out["date"] <= pd.Timestamp(config.sample_end)]
+    out = out.copy()
+    out["y_abs_bps"] = out["y_bps"].abs()
+    return out.reset_index(drop=True)
+
+
+def load_daily_controls(data_dir: Path, cache_dir: Path | None = None) -> pd.DataFrame:
+    """Daily controls cube (FRED, repo funding in bps, issuance, as-of aligned bank/dealer controls).
+
+    See :func:`~slr_bucket.controls.load_controls_cube`; with ``cache_dir`` the cube is reused
+    across runs, strategies and sweeps until one of its source files changes.
+    """
+    return load_controls_cube(data_dir, cache_dir)
+
+
+def merge_controls(outcomes: pd.DataFrame, controls: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
+    wanted = list(dict.fromkeys([*config.total_controls, *config.direct_controls]))
+    use = [c for c in wanted if c in controls.columns]
+    missing = sorted(set(wanted) - set(use))
+    if missing:
+        logger.warning("controls not available and skipped: %s", missing)
+    panel = outcomes.merge(controls[["date", *use]], on="date", how="left", validate="m:1")
+    if use:
+        report_merge_quality(outcomes, panel.dropna(subset=use, how="all"))
+    return panel
+
+
+def series_cells(panel: pd.DataFrame, handle: PanelHandle | PanelStore | None = None) -> list[tuple[pd.DataFrame | PanelSlice, dict[str, Any]]]:
+    """One ``(data, meta)`` cell per series; with a handle, data is a zero-copy slice selector."""
+    cells = []
+    for series, g in panel.groupby("series", sort=True):
+        meta = g[SERIES_KEYS].iloc[0].to_dict()
+        meta["tenor"] = _tenor_label(meta["tenor"])
+        data = handle.select(str(series)) if handle is not None else g.sort_values("date").reset_index(drop=True)
+        cells.append((data, meta))
+    return cells
+
+
+def _estimate_series(
+    task: tuple[pd.DataFrame | PanelSlice, dict[str, Any], PipelineConfig, frozenset[str]],
+) -> tuple[list[dict], list[pd.DataFrame]]:
+    """Jump and binned event-study estimates for one series (process-pool friendly)."""
+    df, meta, config, kinds = task
+    if isinstance(df, PanelSlice):
+        df = df.load()
+    y = config.outcome_col
+    jump_rows: list[dict] = []
+    bin_frames: list[pd.DataFrame] = []
+    for event in config.event_dates:
+        for spec, controls in _specs(config):
+            for window in (config.windows if "jumps" in kinds else []):
+                est, se, n = jump_estimator(df, y, event, window, controls=controls, hac_lags=config.hac_lags)
+                bse = block_bootstrap_jump(
+                    df, y, event, window, controls=controls,
+                    reps=config.bootstrap_reps, block_size=config.bootstrap_block_size, seed=config.random_seed,
+                ) if config.bootstrap_reps > 0 else np.nan
+                jump_rows.append({
+                    **meta, "event": event, "window": window, "spec": spec,
+                    "estimate": est, "se": se, "ci_low": est - 1.96 * se, "ci_high": est + 1.96 * se,
+                    "N": n, "bootstrap_se": bse,
+                })
+            if "event_bins" not in kinds:
+                continue
+            bins = event_study_regression(
+                df, y, event, config.event_bins, controls=controls, hac_lags=config.hac_lags, bands=_bands(config),
+            )
+            if not bins.empty:
+                bin_frames.append(bins.assign(**meta, event=event, spec=spec))
+    return jump_rows, bin_frames
+
+
+def estimate_by_series(
+    panel: pd.DataFrame,
+    config: PipelineConfig,
+    jobs: int = 1,
+    kinds: Iterable[str] = ("jumps", "event_bins"),
+    store: PanelStore | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Per-series estimates.
+
+    With ``jobs > 1`` workers memory-map an Arrow export of the panel (zero-copy slices);
+    pass ``store`` instead when only a few series are refit from an existing panel store.
+    """
+    kinds = frozenset(kinds)
+    if jobs <= 1:
+        results = [_estimate_series((df, meta, config, kinds)) for df, meta in series_cells(panel)]
+    elif store is not None:
+        results = _map(_estimate_series, [(sl, meta, config, kinds) for sl, meta in series_cells(panel, store)], jobs)
+    else:
+        # Workers reopen a memory-mapped Arrow copy of the panel instead of unpickling frames.
+        with tempfile.TemporaryDirectory() as tmp:
+            handle = export_panel(panel, Path(tmp) / "panel_long.arrow")
+            tasks = [(sl, meta, config, kinds) for sl, meta in series_cells(panel, handle)]
+            results = _map(_estimate_series, tasks, jobs)
+    jumps = pd.DataFrame([r for rows, _ in results for r in rows])
+    frames = [f for _, fs in results for f in fs]
+    bins = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return jumps, bins
+
+
+def estimate_pooled(panel: pd.DataFrame, config: PipelineConfig) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Pooled jump and event-study regressions with series FE and a treasury_based interaction."""
+    if panel["treasury_based"].nunique() < 2:
+        logger.warning(
+            "pooled stage skipped: treasury_based takes a single value in this panel; "
+            "stack a Treasury-based and a non-Treasury strategy (e.g. TIPS + CIP) for pooled results"
+        )
+        return pd.DataFrame(), pd.DataFrame()
+    y = config.outcome_col
+    jump_frames, es_frames = [], []
+    for event in config.event_dates:
+        for spec, controls in _specs(config):
+            for window in config.windows:
+                res = pooled_jump_regression(
+                    panel, y, event, window, group_col="treasury_based", fe_col="series",
+                    controls=controls, hac_lags=config.hac_lags, bootstrap=_wild(config),
+                )
+                jump_frames.append(res.assign(event=event, window=window, spec=spec))
+            es, _ = pooled_event_study(
+                panel, y, event, config.event_bins, group_col="treasury_based", fe_col="series",
+                controls=controls, hac_lags=config.hac_lags, bands=_bands(config), bootstrap=_wild(config),
+            )
+            es_frames.append(es.assign(spec=spec))
+    jumps = pd.concat(jump_frames, ignore_index=True) if jump_frames else pd.DataFrame()
+    return jumps, pd.concat(es_frames, ignore_index=True)
+
+
+def render_figures(
+    panel: pd.DataFrame,
+    bins: pd.DataFrame,
+    pooled_es: pd.DataFrame,
+    config: PipelineConfig,
+    fig_dir: Path,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+) -> dict[str, int]:
+    from .plotting.batch import PlotJob, render_jobs
+
+    y = config.outcome_col
+    plot_jobs = [
+        PlotJob("series_with_events", g.sort_values("date")[["date", y]], f"{series} ({y})", fig_dir / f"series_{series}.png",
+                options={"y_col": y, "events": list(config.event_dates)})
+        for series, g in panel.groupby("series", sort=True)
+    ]
+    if not bins.empty:
+        for (series, event, spec), g in bins.groupby(["series", "event", "spec"], sort=True):
+            title = f"{series}: event path around {event} ({spec})"
+            plot_jobs.append(PlotJob("event_paths", g, title, fig_dir / f"event_path_{series}_{event}_{spec.lower()}.png"))
+    if not pooled_es.empty:
+        for (event, spec), g in pooled_es.groupby(["event_date", "spec"], sort=True):
+            sub = g[g["kind"].isin(["group0_effect", "group1_effect"])]
+            title = f"Pooled binned event study around {event} ({spec})"
+            plot_jobs.append(PlotJob("binned_event_overlay", sub, title, fig_dir / f"event_path_pooled_{event}_{spec.lower()}.png"))
+    return {"n_figures": len(plot_jobs), **render_jobs(plot_jobs, n_jobs=jobs, cache_dir=cache_dir)}
+
+
+def write_result_tables(warehouse: Path, config_hash: str, run_id: str, table_dir: Path) -> dict[str, str]:
+    """Render the event-window jump table (HTML and LaTeX) for one run from the results warehouse."""
+    jumps = query_results(warehouse, "jumps", config_hash=config_hash, run_id=run_id)
+    if jumps.empty:
+        return {}
+    title = "Event-window jump estimates (HAC)"
+    paths = {}
+    for fmt, ext in (("html", "html"), ("latex", "tex")):
+        path = table_dir / f"table2_eventwindow_jumps.{ext}"
+        path.write_text(render_jump_table(jumps, fmt=fmt, title=title), encoding="utf-8")
+        paths[f"table2_{ext}"] = str(path)
+    return paths
+
+
+def run_pipeline(
+    repo_root: Path,
+    config: PipelineConfig,
+    jobs: int = 1,
+    stages: Iterable[str] | None = None,
+    update_latest: bool = True,
+    trace_memory: bool = False,
+    profile: bool = False,
+    incremental: bool = False,
+    memoize: bool = False,
+) -> dict[str, Any]:
+    """Run the summary pipeline in-process and return the run metadata (incl. per-stage timings).
+
+    Stage and estimator instrumentation goes to ``tables/stage_timings.csv``, the
+    ``instrumentation`` key of ``run_metadata.json`` and ``<output_root>/stage_history.csv``;
+    ``profile=True`` also dumps one cProfile file per stage under ``logs/profile``.
+    ``incremental=True`` reuses the cached panel and estimates of the previous run with the
+    same config and refits only cells touched by appended dates
+    (see :class:`~slr_bucket.incremental.IncrementalUpdate`).
+    ``memoize=True`` serves estimator calls whose event-window inputs are unchanged from
+    :data:`~slr_bucket.memo.MEMO` (disk tier under ``<cache_root>/estimators``).
+    """
+    selected = list(stages) if stages is not None else list(STAGES)
+    unknown = sorted(set(selected) - set(STAGES))
+    if unknown:
+        raise ValueError(f"Unknown stages: {unknown}. Expected a subset of {STAGES}")
+
+    data_dir = repo_root / "data"
+    dirs = prepare_run_dirs(repo_root, config)
+    setup_logging(dirs["logs"] / "pipeline.log")
+    timings: dict[str, float] = {}
+    outputs: dict[str, str] = {}
+    t_start = time.perf_counter()
+    RECORDER.reset()
+    RECORDER.configure(
+        enabled=True, trace_memory=trace_memory, profile_dir=dirs["logs"] / "profile" if profile else None
+    )
+    if memoize:
+        MEMO.configure(enabled=True, max_entries=MEMO.max_entries, disk_dir=repo_root / config.cache_root / ESTIMATOR_CACHE)
+    try:
+        def _timed(name: str, fn: Callable[[], Any], rows_in: int | None = None) -> Any:
+            t0 = time.perf_counter()
+            with RECORDER.stage(name, rows_in=rows_in) as frame:
+                result = fn()
+                frame.rows_out = count_rows(result)
+            timings[name] = round(time.perf_counter() - t0, 4)
+            logger.info("stage %s finished in %.2fs", name, timings[name])
+            return result
+
+        if "catalog" in selected:
+            catalog = _timed("catalog", lambda: build_data_catalog(data_dir))
+            write_catalog_outputs(catalog, dirs["data"])
+
+        units = UnitManifest(repo_root / config.cache_root / UNITS_MANIFEST)
+        outcomes = _timed("outcomes", lambda: load_outcome_panel(data_dir / "series", config, units))
+        outputs["units"] = str(units.path)
+        controls = _timed("controls", lambda: load_daily_controls(data_dir, repo_root / config.cache_root))
+        if controls.attrs.get("alignment"):
+            pd.DataFrame(controls.attrs["alignment"]).to_csv(dirs["tables"] / "control_alignment.csv", index=False)
+            outputs["control_alignment"] = str(dirs["tables"] / "control_alignment.csv")
+        pd.DataFrame(controls.attrs["provenance"]).to_csv(dirs["data"] / "controls_provenance.csv", index=False)
+        outputs["controls_cube"] = controls.attrs["cube_key"]
+        inc = None
+        if incremental:
+            from .incremental import IncrementalUpdate
+
+            inc = IncrementalUpdate(repo_root, config, outcomes, controls)
+            panel = _timed("merge", inc.update_panel, rows_in=len(outcomes))
+        else:
+            panel = _timed("merge", lambda: merge_controls(outcomes, controls, config), rows_in=len(outcomes))
+        panel.to_parquet(dirs["data"] / "panel_long.parquet", index=False)
+        store = None
+        if jobs > 1 or inc is not None:
+            # pruned per-series reads for incremental refits and downstream tools; not needed at jobs=1
+            store = write_panel_store(panel, dirs["data"] / "panel_store")
+            outputs["panel_store"] = store.root
+
+        jumps = bins = pooled_jumps = pooled_es = pd.DataFrame()
+        kinds = [k for k in ("jumps", "event_bins") if k in selected]
+        if kinds:
+            if inc is not None:
+                by_series = partial(inc.estimate_by_series, panel, jobs=jobs, kinds=kinds, store=store)
+            else:
+                by_series = partial(estimate_by_series, panel, config, jobs=jobs, kinds=kinds)
+            jumps, bins = _timed("+".join(kinds), by_series, len(panel))
+            jumps.to_csv(dirs["tables"] / "jump_results.csv", index=False)
+            bins.to_csv(dirs["tables"] / "eventstudy_bins.csv", index=False)
+            outputs.update(jump_results=str(dirs["tables"] / "jump_results.csv"), eventstudy_bins=str(dirs["tables"] / "eventstudy_bins.csv"))
+        if "pooled" in selected:
+            pooled = partial(inc.estimate_pooled, panel) if inc is not None else partial(estimate_pooled, panel, config)
+            pooled_jumps, pooled_es = _timed("pooled", pooled, len(panel))
+            if not pooled_jumps.empty:
+                pooled_jumps.to_csv(dirs["tables"] / "pooled_jump_results.csv", index=False)
+                pooled_es.to_csv(dirs["tables"] / "eventstudy_pooled.csv", index=False)
+        if "figures" in selected:
+            figures = _timed(
+                "figures",
+                lambda: render_figures(
+                    panel, bins, pooled_es, config, dirs["figures"], jobs=jobs, cache_dir=repo_root / config.cache_root / "figures"
+                ),
+                len(panel),
+            )
+            outputs.update(figures)
+        warehouse = repo_root / config.output_root / "warehouse"
+        results = {"jumps": jumps, "bins": bins, "pooled_jumps": pooled_jumps, "pooled_es": pooled_es}
+        if append_run(warehouse, config.to_hash(), dirs["run"].name, results):
+            outputs["warehouse"] = str(warehouse)
+            outputs.update(write_result_tables(warehouse, config.to_hash(), dirs["run"].name, dirs["tables"]))
+        if inc is not None:
+            inc.save({
+                "panel": panel,
+                "jumps": jumps if "jumps" in kinds else None,
+                "bins": bins if "event_bins" in kinds else None,
+                "pooled_jumps": pooled_jumps if "pooled" in selected else None,
+                "pooled_es": pooled_es if "pooled" in selected else None,
+            })
+
+        timings["total"] = round(time.perf_counter() - t_start, 4)
+        metadata = {
+            "utc_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "run_dir": str(dirs["run"]),
+            "config_hash": config.to_hash(),
+            "config": as_serializable_dict(config),
+            "strategies": list(config.strategies),
+            "stages": selected,
+            "jobs": jobs,
+            "rows": {"outcomes": len(outcomes), "panel": len(panel), "jumps": len(jumps), "event_bins": len(bins)},
+            "timings": timings,
+            "outputs": outputs,
+        }
+        if inc is not None:
+            metadata["incremental"] = inc.info
+        if memoize:
+            # counters of this process only; --jobs workers share the disk tier but count separately
+            metadata["memo"] = MEMO.stats()
+        (dirs["run"] / "run_metadata.json").write_text(json.dumps(metadata, indent=2, default=str), encoding="utf-8")
+        RECORDER.write(dirs["run"], history_csv=repo_root / config.output_root / "stage_history.csv")
+        metadata["instrumentation"] = RECORDER.to_rows()
+    finally:
+        # process-global state: a failed run must not leave recording or memoization on
+        RECORDER.configure(enabled=False)
+        if memoize:
+            MEMO.configure(enabled=False, max_entries=MEMO.max_entries, disk_dir=MEMO.disk_dir)
+    write_run_readme(dirs["run"], config, f"Headless run of stages {selected} with jobs={jobs}.")
+    if update_latest:
+        refresh_latest(repo_root, config, dirs["run"])
+    return metadata
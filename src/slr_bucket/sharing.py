@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "Panel handles need `pyarrow` (Arrow IPC + memory map). Install it, or run with jobs=1."
+        ) from exc
+    return pa, ipc
+
+
+@dataclass(frozen=True)
+class PanelHandle:
+    """Picklable pointer to a panel exported as an uncompressed Arrow IPC file.
+
+    Rows are sorted by ``key`` so each key value is one contiguous ``(start, stop)`` range;
+    workers memory-map the file and slice it without copying the other series.
+    """
+
+    path: str
+    key: str
+    offsets: dict[str, tuple[int, int]] = field(default_factory=dict)
+    columns: tuple[str, ...] = ()
+
+    def table(self, keys: list[str] | None = None, columns: list[str] | None = None):
+        pa, ipc = _require_pyarrow()
+        source = pa.memory_map(self.path, "r")
+        table = ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select([c for c in columns if c in self.columns])
+        if keys is None:
+            return table
+        parts = []
+        for k in keys:
+            if k in self.offsets:
+                start, stop = self.offsets[k]
+                parts.append(table.slice(start, stop - start))
+        return pa.concat_tables(parts) if parts else table.slice(0, 0)
+
+    def read(self, keys: list[str] | None = None, columns: list[str] | None = None) -> pd.DataFrame:
+        return self.table(keys, columns).to_pandas()
+
+    def select(self, key: str, columns: list[str] | None = None) -> "PanelSlice":
+        return PanelSlice(self, key, tuple(columns) if columns is not None else None)
+
+
+@dataclass(frozen=True)
+class PanelSlice:
+    """Row (one key value) and column selector over a :class:`PanelHandle` or :class:`PanelStore`."""
+
+    handle: PanelHandle | PanelStore
+    key: str
+    columns: tuple[str, ...] | None = None
+
+    def load(self) -> pd.DataFrame:
+        return self.handle.read([self.key], list(self.columns) if self.columns is not None else None)
+
+
+def export_panel(panel: pd.DataFrame, path: Path, key: str = "series", sort_cols: list[str] | None = None) -> PanelHandle:
+    """Write ``panel`` sorted by ``key`` (then ``sort_cols``) to an Arrow IPC file and return its handle."""
+    pa, ipc = _require_pyarrow()
+    order = [key, *(sort_cols if sort_cols is not None else ["date"] if "date" in panel.columns else [])]
+    out = panel.sort_values(order, kind="mergesort").reset_index(drop=True)
+    table = pa.Table.from_pandas(out, preserve_index=False)
+
+    keys = out[key].astype(str).to_numpy()
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=int)
+    stops = np.r_[starts[1:], len(keys)] if len(keys) else starts
+    offsets = {str(keys[s]): (int(s), int(e)) for s, e in zip(starts, stops)}
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pa.OSFile(str(path), "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return PanelHandle(str(path), key, offsets, tuple(table.column_names))
+
+
+STORE_MANIFEST = "_store.json"
+PART_COL = "part"  # factorized key code; the partition directory name
+
+
+def _require_dataset():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError("The partitioned panel store needs `pyarrow`. Install it, or read panel_long.parquet.") from exc
+    return pa, ds
+
+
+@dataclass(frozen=True)
+class PanelStore:
+    """Hive-partitioned Parquet copy of a panel, one ``part=<code>/`` directory per ``key`` value.
+
+    Partition directories use a factorized code (``codes`` maps label -> code) rather than
+    the raw label, so series names with path or quoting characters are safe. Each
+    partition holds its rows sorted by date in row groups of at most ``rows_per_group``
+    rows, so :meth:`read` prunes whole partitions on ``key`` and row groups on the date
+    min/max statistics. Picklable; workers open the dataset lazily.
+    """
+
+    root: str
+    key: str = "series"
+    columns: tuple[str, ...] = ()
+    rows: dict[str, int] = field(default_factory=dict)
+    codes: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def open(cls, root: Path) -> "PanelStore":
+        meta = json.loads((Path(root) / STORE_MANIFEST).read_text(encoding="utf-8"))
+        return cls(str(root), meta["key"], tuple(meta["columns"]), meta["rows"], meta["codes"])
+
+    def dataset(self):
+        pa, ds = _require_dataset()
+        schema = pa.schema([(PART_COL, pa.int32())])
+        return ds.dataset(self.root, format="parquet", partitioning=ds.partitioning(schema, flavor="hive"))
+
+    def read(
+        self,
+        series: list[str] | None = None,
+        columns: list[str] | None = None,
+        date_range: tuple[Any, Any] | None = None,
+    ) -> pd.DataFrame:
+        """Rows of ``series`` (all when ``None``) with ``date_range[0] <= date <= date_range[1]`` (either end may be ``None``)."""
+        pa, ds = _require_dataset()
+        data = self.dataset()
+        cond = None
+        if series is not None:
+            cond = ds.field(PART_COL).isin([self.codes[str(s)] for s in series if str(s) in self.codes])
+        if date_range is not None:
+            dtype = data.schema.field("date").type
+            lo, hi = date_range
+            for op, bound in (("__ge__", lo), ("__le__", hi)):
+                if bound is not None:
+                    term = getattr(ds.field("date"), op)(pa.scalar(pd.Timestamp(bound), type=dtype))
+                    cond = term if cond is None else cond & term
+        cols = [c for c in (columns if columns is not None else self.columns) if c in self.columns]
+        out = data.to_table(columns=cols, filter=cond).to_pandas()
+        order = [c for c in (self.key, "date") if c in out.columns]
+        return out.sort_values(order, kind="mergesort").reset_index(drop=True) if order else out
+
+    def select(self, key: str, columns: list[str] | None = None) -> PanelSlice:
+        return PanelSlice(self, key, tuple(columns) if columns is not None else None)
+
+
+def write_panel_store(panel: pd.DataFrame, root: Path, key: str = "series", rows_per_group: int = 4096) -> PanelStore:
+    """Write ``panel`` as a partitioned Parquet dataset under ``root`` (replacing an earlier store there)."""
+    pa, ds = _require_dataset()
+    root = Path(root)
+    if (root / STORE_MANIFEST).exists():
+        shutil.rmtree(root)
+    elif root.exists() and any(root.iterdir()):
+        raise FileExistsError(f"{root} exists and is not a panel store")
+    codes, labels = pd.factorize(panel[key].astype(str), sort=True)
+    out = panel.assign(**{PART_COL: codes.astype(np.int32)})
+    out = out.sort_values([PART_COL, *(["date"] if "date" in out.columns else [])], kind="mergesort")
+    table = pa.Table.from_pandas(out, preserve_index=False)
+    ds.write_dataset(
+        table, root, format="parquet",
+        partitioning=ds.partitioning(pa.schema([(PART_COL, pa.int32())]), flavor="hive"),
+        basename_template="part-{i}.parquet",
+        max_rows_per_group=rows_per_group,
+        min_rows_per_group=min(rows_per_group, 1024),
+    )
+    rows = {str(k): int(n) for k, n in out[key].astype(str).value_counts(sort=False).items()}
+    code_map = {str(label): i for i, label in enumerate(labels)}
+    meta = {"key": key, "columns": list(panel.columns), "rows": rows, "codes": code_map}
+    (root / STORE_MANIFEST).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return PanelStore(str(root), key, tuple(panel.columns), rows, code_map)
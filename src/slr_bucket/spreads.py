@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Index -> Bloomberg generic futures root (front and second contract are <root>1/<root>2).
+EQUITY_FUTURES = {"SPX": "ES", "NDX": "NQ", "INDU": "DM"}
+OIS_TICKER = "USSOC CMPN Curncy"  # 3m USD OIS, percent
+DAY_COUNT = 360.0
+
+# FX quoting for the CIP builder: these are quoted USD per unit of currency (others per USD),
+# and forward points are in 1/10000 of the spot quote unless listed here.
+USD_PER_FCY = frozenset({"AUD", "EUR", "GBP", "NZD"})
+FORWARD_POINT_SCALE = {"JPY": 100.0}
+# Last date of the shipped cip_spreads_3m_bps.csv; the CLI trims builds here by default so the
+# parquet (which the loaders prefer) covers the same sample.
+CIP_CSV_END = "2025-01-01"
+BUILD_META_KEY = b"slr_bucket.build"
+
+
+def _require_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError("Streaming the raw Bloomberg parquet needs `pyarrow`. Install it, then re-run.") from exc
+    return pa, pq
+
+
+def bbg_column(ticker: str, field: str) -> str:
+    """Flattened parquet name of a ``(ticker, field)`` column from the Bloomberg pull."""
+    return str((ticker, field))
+
+
+def _date_column(pf) -> str:
+    meta = pf.schema_arrow.pandas_metadata or {}
+    index_cols = [c for c in meta.get("index_columns", []) if isinstance(c, str)]
+    if index_cols:
+        return index_cols[0]
+    names = pf.schema_arrow.names
+    for cand in ("date", "Date", "timestamp"):
+        if cand in names:
+            return cand
+    raise KeyError(f"No date/index column in raw parquet. Columns={names[:8]}...")
+
+
+def iter_daily(path: Path, columns: list[str], batch_rows: int = 65_536) -> Iterator[pd.DataFrame]:
+    """Stream ``columns`` of a raw parquet as daily frames (last non-null quote per day).
+
+    Reads one record batch at a time; rows of the batch's last day are held back and
+    merged with the next batch, so a day split across batches is aggregated once.
+    Memory is bounded by ``batch_rows`` plus one day of quotes.
+    """
+    _, pq = _require_parquet()
+    pf = pq.ParquetFile(path)
+    date_col = _date_column(pf)
+    missing = sorted(set(columns) - set(pf.schema_arrow.names))
+    if missing:
+        raise KeyError(f"Raw parquet {Path(path).name} lacks columns {missing}")
+    pending: pd.DataFrame | None = None
+    for batch in pf.iter_batches(batch_size=batch_rows, columns=[date_col, *columns]):
+        df = batch.to_pandas(ignore_metadata=True)  # keep the flattened column names
+        df.index = pd.to_datetime(df.pop(date_col)).dt.normalize().to_numpy()
+        if pending is not None:
+            df = pd.concat([pending, df])
+        last = df.index.max()
+        pending = df[df.index == last]
+        done = df[df.index < last]
+        if len(done):
+            yield done.groupby(level=0, sort=True).last()
+    if pending is not None and len(pending):
+        yield pending.groupby(level=0, sort=True).last()
+
+
+def third_friday(spec: pd.Series) -> pd.Series:
+    """Settlement date of a quarterly index future from its ``"MAR 10"`` contract month."""
+    first = pd.to_datetime(spec, format="%b %y", errors="coerce")
+    return first + pd.to_timedelta((4 - first.dt.weekday) % 7 + 14, unit="D")
+
+
+def dividend_calendar(path: Path, indices: list[str], batch_rows: int = 65_536) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Daily dates and cumulative gross dividend points per index (first streaming pass).
+
+    The dividend leg needs the cumulative dividend at each contract's settlement date,
+    i.e. up to two quarters ahead of the row being priced; this pass keeps just one
+    float per day and index so the second pass can look it up.
+    """
+    cols = {idx: bbg_column(f"{idx} Index", "INDX_GROSS_DAILY_DIV") for idx in indices}
+    dates, cums, carry = [], {idx: [] for idx in indices}, dict.fromkeys(indices, 0.0)
+    for day in iter_daily(path, list(cols.values()), batch_rows):
+        dates.append(day.index.to_numpy(dtype="datetime64[ns]"))
+        for idx, col in cols.items():
+            cum = carry[idx] + np.cumsum(day[col].fillna(0.0).to_numpy(dtype=float))
+            cums[idx].append(cum)
+            carry[idx] = float(cum[-1]) if len(cum) else carry[idx]
+    if not dates:
+        return np.array([], dtype="datetime64[ns]"), {idx: np.array([]) for idx in indices}
+    return np.concatenate(dates), {idx: np.concatenate(c) for idx, c in cums.items()}
+
+
+def _cum_asof(cal_dates: np.ndarray, cum: np.ndarray, when: pd.Series) -> np.ndarray:
+    pos = np.searchsorted(cal_dates, when.to_numpy(dtype="datetime64[ns]"), side="right") - 1
+    out = cum[np.clip(pos, 0, None)] if len(cum) else np.full(len(when), np.nan)
+    return np.where(when.notna().to_numpy() & (pos >= 0), out, np.nan)
+
+
+def _rolling_z(values: np.ndarray, history: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Robust z of each value against the ``window`` spreads before it (median/MAD).
+
+    ``history`` holds the tail of earlier batches; returns the z-scores and the new tail.
+    The tail keeps NaN rows (rolling windows count them) and spans ``2 * window`` values,
+    since the MAD of the first new value reaches back over the medians of ``window`` rows.
+    """
+    ext = pd.Series(np.concatenate([history, values]))
+    prior = ext.shift(1)
+    med = prior.rolling(window, min_periods=max(window // 3, 2)).median()
+    mad = (prior - med).abs().rolling(window, min_periods=max(window // 3, 2)).median() * 1.4826
+    z = ((ext - med).abs() / mad.where(mad > 0)).to_numpy()[len(history):]
+    tail = ext.to_numpy()[-2 * window:]
+    return z, tail
+
+
+def spread_block(
+    day: pd.DataFrame,
+    idx: str,
+    cal_dates: np.ndarray,
+    cum: np.ndarray,
+    ois: pd.Series,
+) -> pd.DataFrame:
+    """Calendar-spread implied rate minus OIS forward for one index on a block of days.
+
+    Futures are dividend-adjusted with the cumulative dividends to settlement,
+    compounded at OIS for half the time to maturity; the implied Term1->Term2 forward is
+    annualised (ACT/360, percent) and compared with the OIS forward over the same span.
+    ``spread_<idx>`` is in bps. Days without both futures and contract months are dropped.
+    """
+    fut = EQUITY_FUTURES[idx]
+    dates = pd.Series(day.index, index=day.index)
+    cum_now = _cum_asof(cal_dates, cum, dates)
+    out = pd.DataFrame(index=day.index)
+    out["Index"] = idx
+    out["OIS"] = ois
+    for k in (1, 2):
+        ticker = f"{fut}{k} Index"
+        settle = third_friday(day[bbg_column(ticker, "CURRENT_CONTRACT_MONTH_YR")])
+        ttm = (settle - dates).dt.days.astype(float)
+        div_sum = _cum_asof(cal_dates, cum, settle) - cum_now
+        out[f"Term{k}_Futures_Price"] = day[bbg_column(ticker, "PX_LAST")]
+        out[f"Term{k}_Volume"] = day[bbg_column(ticker, "PX_VOLUME")]
+        out[f"Term{k}_OpenInterest"] = day[bbg_column(ticker, "OPEN_INT")]
+        out[f"Term{k}_ContractSpec"] = day[bbg_column(ticker, "CURRENT_CONTRACT_MONTH_YR")].astype("string")
+        out[f"Term{k}_SettlementDate"] = settle
+        out[f"Term{k}_TTM"] = ttm
+        out[f"Div_Sum{k}"] = div_sum
+        out[f"Div_Sum{k}_Comp"] = div_sum * (1 + ois * ttm / 2 / DAY_COUNT)
+    span = out["Term2_TTM"] - out["Term1_TTM"]
+    out["implied_forward_raw"] = (
+        (out["Term2_Futures_Price"] + out["Div_Sum2_Comp"]) / (out["Term1_Futures_Price"] + out["Div_Sum1_Comp"]) - 1
+    )
+    out[f"cal_{idx}_rf"] = out["implied_forward_raw"] * DAY_COUNT / span * 100
+    out["ois_fwd_raw"] = (1 + ois * out["Term2_TTM"] / DAY_COUNT) / (1 + ois * out["Term1_TTM"] / DAY_COUNT) - 1
+    out[f"ois_fwd_{idx}"] = out["ois_fwd_raw"] * DAY_COUNT / span * 100
+    out[f"spread_{idx}"] = (out[f"cal_{idx}_rf"] - out[f"ois_fwd_{idx}"]) * 100
+    keep = out[["Term1_Futures_Price", "Term2_Futures_Price", "Term1_TTM", "Term2_TTM"]].notna().all(axis=1)
+    return out[keep].rename_axis("Date").reset_index()
+
+
+def build_equity_spreads(
+    raw_path: Path,
+    out_dir: Path,
+    indices: list[str] | tuple[str, ...] = tuple(EQUITY_FUTURES),
+    batch_rows: int = 65_536,
+    window: int = 60,
+    z_max: float = 4.0,
+) -> dict[str, Path]:
+    """Stream the raw equity spot/futures parquet into ``equity_spot_spread_<IDX>.parquet``.
+
+    Two passes over the raw file, one record batch at a time: the first builds the daily
+    cumulative-dividend calendar, the second prices every index on each daily block and
+    appends it to one Parquet writer per index. ``spread_<idx>_filtered`` (percent, as the
+    loaders expect) drops roll days (front contract expiring) whose spread is more than
+    ``z_max`` robust z-scores from the trailing ``window``-day median.
+    """
+    pa, pq = _require_parquet()
+    indices = [i.upper() for i in indices]
+    unknown = sorted(set(indices) - set(EQUITY_FUTURES))
+    if unknown:
+        raise ValueError(f"No futures mapping for {unknown}. Known: {sorted(EQUITY_FUTURES)}")
+    cal_dates, cums = dividend_calendar(raw_path, indices, batch_rows)
+
+    ois_col = bbg_column(OIS_TICKER, "PX_LAST")
+    fields = ("PX_LAST", "PX_VOLUME", "OPEN_INT", "CURRENT_CONTRACT_MONTH_YR")
+    columns = [ois_col, *(bbg_column(f"{EQUITY_FUTURES[i]}{k} Index", f) for i in indices for k in (1, 2) for f in fields)]
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {idx: out_dir / f"equity_spot_spread_{idx}.parquet" for idx in indices}
+    writers: dict[str, object] = {}
+    tails = {idx: np.array([]) for idx in indices}
+    last_ois = np.nan
+    rows = dict.fromkeys(indices, 0)
+    try:
+        for day in iter_daily(raw_path, columns, batch_rows):
+            ois = day[ois_col].div(100).ffill().fillna(last_ois)
+            if ois.notna().any():
+                last_ois = float(ois.dropna().iloc[-1])
+            for idx in indices:
+                block = spread_block(day, idx, cal_dates, cums[idx], ois)
+                z, tails[idx] = _rolling_z(block[f"spread_{idx}"].to_numpy(dtype=float), tails[idx], window)
+                outlier = (block["Term1_TTM"].to_numpy() <= 0) & (z > z_max)
+                block[f"spread_{idx}_filtered"] = (block[f"spread_{idx}"] / 100).mask(outlier)
+                table = pa.Table.from_pandas(block, preserve_index=False)
+                if idx not in writers:
+                    writers[idx] = pq.ParquetWriter(paths[idx], table.schema)
+                writers[idx].write_table(table.cast(writers[idx].schema))
+                rows[idx] += len(block)
+    finally:
+        for w in writers.values():
+            w.close()
+    logger.info("equity spreads: wrote %s", rows)
+    return {idx: p for idx, p in paths.items() if idx in writers}
+
+
+def _ccy_frame(df: pd.DataFrame, suffix: str = "") -> pd.DataFrame:
+    """Bloomberg sheet (``Date`` + ``"AUD3M CMPN Curncy"``-style headers) keyed by currency code."""
+    out = df.set_index(pd.to_datetime(df["Date"])).drop(columns="Date")
+    codes = {c: str(c).split()[0] for c in out.columns}
+    if suffix:
+        codes = {c: code[: -len(suffix)] for c, code in codes.items() if code.endswith(suffix)}
+    return out[list(codes)].rename(columns=codes).apply(pd.to_numeric, errors="coerce")
+
+
+def cip_basis(spot: pd.DataFrame, points: pd.DataFrame, rates: pd.DataFrame, tenor_months: int = 3) -> pd.DataFrame:
+    """Log CIP basis in bps for every currency at once on a date x currency matrix.
+
+    ``basis = foreign OIS - 12/m * ln(F/S) - USD OIS`` with ``F/S`` oriented as currency per
+    USD, ``F = S + points / scale`` and OIS in percent. Columns are ``CIP_<CCY>_ln``.
+    """
+    ccys = [c for c in spot.columns if c in points.columns and c in rates.columns and c != "USD"]
+    dates = spot.index.intersection(points.index).intersection(rates.index)
+    s = spot.loc[dates, ccys].to_numpy(dtype=float)
+    f = s + points.loc[dates, ccys].to_numpy(dtype=float) / np.array([FORWARD_POINT_SCALE.get(c, 1e4) for c in ccys])
+    sign = np.where(np.isin(ccys, list(USD_PER_FCY)), -1.0, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        premium = sign * (np.log(f) - np.log(s)) * (12.0 / tenor_months) * 100
+    basis = (rates.loc[dates, ccys].to_numpy(dtype=float) - premium - rates.loc[dates, ["USD"]].to_numpy(dtype=float)) * 100
+    return pd.DataFrame(basis, index=dates.rename("Date"), columns=[f"CIP_{c}_ln" for c in ccys]).sort_index()
+
+
+def _build_params(path: Path) -> dict | None:
+    """Build parameters recorded in a cached output's Parquet metadata (``None`` if absent)."""
+    _, pq = _require_parquet()
+    meta = pq.read_schema(path).metadata or {}
+    raw = meta.get(BUILD_META_KEY)
+    return json.loads(raw) if raw is not None else None
+
+
+def build_cip_basis(
+    raw_path: Path,
+    out_dir: Path,
+    tenor: str = "3M",
+    start: str | None = None,
+    end: str | None = None,
+    force: bool = False,
+) -> Path:
+    """Parquet cache of :func:`cip_basis` from ``cip_bloomberg.xlsx`` (Spot/Forward/OIS sheets).
+
+    Writes ``cip_spreads_<tenor>_bps.parquet`` with ``tenor``/``start``/``end`` in its metadata;
+    an output newer than the workbook and built with the same parameters is reused unless
+    ``force``. ``start``/``end`` trim the sample (the shipped CSV ends :data:`CIP_CSV_END`).
+    """
+    pa, pq = _require_parquet()
+    out = Path(out_dir) / f"cip_spreads_{tenor.lower()}_bps.parquet"
+    params = {"tenor": tenor.upper(), "start": start, "end": end}
+    if (
+        out.exists() and not force and out.stat().st_mtime >= Path(raw_path).stat().st_mtime
+        and _build_params(out) == params
+    ):
+        return out
+    sheets = pd.read_excel(raw_path, sheet_name=["Spot", "Forward", "OIS"])
+    months = int(tenor.upper().rstrip("M"))
+    basis = cip_basis(
+        _ccy_frame(sheets["Spot"]), _ccy_frame(sheets["Forward"], suffix=tenor.upper()), _ccy_frame(sheets["OIS"]), months,
+    )
+    basis = basis.loc[start:end]
+    out.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(basis.reset_index(), preserve_index=False)
+    pq.write_table(table.replace_schema_metadata({**(table.schema.metadata or {}), BUILD_META_KEY: json.dumps(params)}), out)
+    logger.info("cip basis: %d dates x %d currencies -> %s", *basis.shape, out)
+    return out
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# Table 1 regimes (inclusive bounds)
+DEFAULT_REGIMES = {
+    "pre": ("2019-01-01", "2020-03-31"),
+    "relief": ("2020-04-01", "2021-03-31"),
+    "post": ("2021-04-01", "2021-12-31"),
+}
+
+
+def assign_regimes(dates, regimes: dict[str, tuple[str, str]]) -> np.ndarray:
+    """Regime code per date (index into ``regimes``, ``-1`` outside every regime) via one searchsorted."""
+    bounds = [(pd.Timestamp(a), pd.Timestamp(b)) for a, b in regimes.values()]
+    order = np.argsort([a for a, _ in bounds], kind="stable")
+    starts = np.array([bounds[i][0] for i in order], dtype="datetime64[ns]")
+    ends = np.array([bounds[i][1] for i in order], dtype="datetime64[ns]")
+    if (starts[1:] <= ends[:-1]).any():
+        raise ValueError("regimes must not overlap")
+    d = pd.to_datetime(dates).to_numpy(dtype="datetime64[ns]")
+    pos = np.searchsorted(starts, d, side="right") - 1
+    inside = (pos >= 0) & (d <= ends[np.maximum(pos, 0)])
+    return np.where(inside, order[np.maximum(pos, 0)], -1)
+
+
+def regime_summary(
+    panel: pd.DataFrame,
+    regimes: dict[str, tuple[str, str]] | None = None,
+    deltas: list[float] = (5.0, 10.0),
+    series_col: str = "series",
+    y_col: str = "y_bps",
+    abs_col: str = "y_abs_bps",
+    quantiles: tuple[float, ...] = (0.05, 0.95),
+) -> pd.DataFrame:
+    """Table 1: level stats and near-zero shares for every series x regime in one grouped pass.
+
+    Columns follow the notebook table (N_days, mean_W, median_W, p5_W, p95_W, mean_absW,
+    share_absW_le_<delta>) plus sd_W and vol_dW (std of day-over-day changes within a series).
+    Near-zero shares use all rows of the cell as denominator; cells without any |y| are dropped.
+    """
+    regimes = DEFAULT_REGIMES if regimes is None else regimes
+    names = list(regimes)
+    dates = pd.to_datetime(panel["date"], errors="coerce")
+    codes, labels = pd.factorize(panel[series_col], sort=True, use_na_sentinel=False)
+    order = np.lexsort((dates.to_numpy(dtype="datetime64[ns]"), codes))
+
+    y = pd.to_numeric(panel[y_col], errors="coerce").to_numpy(dtype=float)[order]
+    ya = pd.to_numeric(panel[abs_col], errors="coerce").to_numpy(dtype=float)[order]
+    sc = codes[order]
+    dy = np.r_[np.nan, np.diff(y)]
+    dy[np.r_[True, sc[1:] != sc[:-1]]] = np.nan
+    work = pd.DataFrame({"s": sc, "r": assign_regimes(dates.to_numpy()[order], regimes), "y": y, "ya": ya, "dy": dy})
+    share_cols = [f"share_absW_le_{int(d)}" for d in deltas]
+    work[share_cols] = ya[:, None] <= np.asarray(deltas, dtype=float)[None, :]
+    work = work[work["r"] >= 0]
+
+    g = work.groupby(["s", "r"], sort=True)
+    out = g.agg(
+        N_days=("ya", "count"),
+        mean_W=("y", "mean"),
+        median_W=("y", "median"),
+        sd_W=("y", "std"),
+        vol_dW=("dy", "std"),
+        mean_absW=("ya", "mean"),
+        rows=("ya", "size"),
+        **{c: (c, "sum") for c in share_cols},
+    )
+    qs = g["y"].quantile(list(quantiles)).unstack()
+    for q in quantiles:
+        out[f"p{q * 100:g}_W"] = qs[q]
+    out[share_cols] = out[share_cols].div(out["rows"], axis=0)
+    out = out[out["N_days"] > 0].reset_index()
+
+    first = pd.DataFrame({"s": sc, "strategy": panel["strategy"].to_numpy()[order], "tenor": panel["tenor"].to_numpy()[order]})
+    ident = first.groupby("s").first()
+    out[series_col] = [str(labels[s]) for s in out["s"]]
+    out["strategy"] = out["s"].map(ident["strategy"]).fillna("unknown").astype(str)
+    out["tenor"] = out["s"].map(ident["tenor"]).map(lambda t: "NA" if pd.isna(t) else str(t))
+    out["regime"] = [names[r] for r in out["r"]]
+    cols = ["strategy", series_col, "tenor", "regime", "N_days", "mean_W", "median_W",
+            *[f"p{q * 100:g}_W" for q in quantiles], "mean_absW", "sd_W", "vol_dW", *share_cols]
+    return out[cols].sort_values(["strategy", series_col, "tenor", "regime"]).reset_index(drop=True)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .config import PipelineConfig, as_serializable_dict, config_from_dict
+from .memo import ESTIMATOR_CACHE, MEMO
+from .runner import _estimate_series, load_daily_controls, load_outcome_panel, merge_controls, series_cells
+from .sharing import export_panel
+from .units import UNITS_MANIFEST, UnitManifest
+
+logger = logging.getLogger(__name__)
+
+# Overrides that change which rows/columns are loaded cannot share one panel.
+PANEL_KEYS = {"strategies", "dependent_series", "tenor_subset", "sample_start", "sample_end"}
+
+
+def expand_grid(base: PipelineConfig, grid: dict[str, list[Any]]) -> list[PipelineConfig]:
+    """Cartesian product of override lists applied to ``base`` (deduplicated by ``to_hash``)."""
+    clash = sorted(PANEL_KEYS & set(grid))
+    if clash:
+        raise ValueError(f"Sweep grid cannot vary panel-shaping fields {clash}; run separate sweeps instead.")
+    keys = list(grid)
+    payload = as_serializable_dict(base)
+    variants: dict[str, PipelineConfig] = {}
+    for values in itertools.product(*(grid[k] for k in keys)):
+        cfg = config_from_dict({**payload, **dict(zip(keys, values))})
+        variants.setdefault(cfg.to_hash(), cfg)
+    return list(variants.values())
+
+
+def prepare_shared_panel(repo_root: Path, base: PipelineConfig, variants: list[PipelineConfig]) -> pd.DataFrame:
+    """Load outcomes once and merge the union of every variant's controls."""
+    data_dir = repo_root / "data"
+    wanted = list(dict.fromkeys(c for v in variants for c in [*v.total_controls, *v.direct_controls]))
+    union = replace(base, total_controls=wanted, direct_controls=[])
+    outcomes = load_outcome_panel(data_dir / "series", base, UnitManifest(repo_root / base.cache_root / UNITS_MANIFEST))
+    return merge_controls(outcomes, load_daily_controls(data_dir, repo_root / base.cache_root), union)
+
+
+def _cell_frame(config: PipelineConfig, jump_rows: list[dict], bin_frames: list[pd.DataFrame]) -> pd.DataFrame:
+    parts = []
+    if jump_rows:
+        parts.append(pd.DataFrame(jump_rows).assign(kind="jump", term="post"))
+    if bin_frames:
+        parts.append(pd.concat(bin_frames, ignore_index=True).rename(columns={"n": "N"}).assign(kind="event_bin"))
+    out = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    return out.assign(config_hash=config.to_hash())
+
+
+def series_code(series: str) -> str:
+    """Filesystem-safe, stable file stem for one series' cell."""
+    return hashlib.sha1(str(series).encode("utf-8")).hexdigest()[:12]
+
+
+def _combine_variant(cell_dir: Path, h: str, series: list[str]) -> None:
+    """Merge a finished variant's per-series cells into ``cells/<h>.parquet`` (jumps first)."""
+    parts = [pd.read_parquet(cell_dir / h / f"{series_code(s)}.parquet") for s in series]
+    out = pd.concat(parts, ignore_index=True)
+    if "kind" in out.columns:
+        out = out.sort_values("kind", key=lambda k: k.ne("jump"), kind="stable").reset_index(drop=True)
+    out.to_parquet(cell_dir / f"{h}.parquet", index=False)
+    shutil.rmtree(cell_dir / h)
+    logger.info("sweep: variant %s complete", h)
+
+
+def run_sweep(
+    repo_root: Path,
+    base: PipelineConfig,
+    grid: dict[str, list[Any]],
+    jobs: int = 1,
+    out_dir: Path | None = None,
+    memoize: bool = False,
+) -> pd.DataFrame:
+    """Estimate every grid variant on one shared panel; finished cells are skipped on restart.
+
+    Each (variant, series) cell is written to ``out_dir/cells/<to_hash()>/<series_code>.parquet``
+    as soon as it finishes; once all series of a variant are done they are merged into
+    ``out_dir/cells/<to_hash()>.parquet`` and the combined table (indexed by ``config_hash``)
+    is written to ``out_dir/sweep_results.parquet``.
+    ``memoize=True`` lets variants share estimator fits whose spec and window inputs agree
+    (e.g. jumps across ``bootstrap_reps``), in memory and under ``<cache_root>/estimators``.
+    """
+    variants = expand_grid(base, grid)
+    out_dir = out_dir or repo_root / base.output_root / "sweeps" / base.to_hash()
+    cell_dir = out_dir / "cells"
+    cell_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "variants.json").write_text(
+        json.dumps({v.to_hash(): as_serializable_dict(v) for v in variants}, indent=2, default=str), encoding="utf-8"
+    )
+
+    todo = [v for v in variants if not (cell_dir / f"{v.to_hash()}.parquet").exists()]
+    logger.info("sweep: %d variants, %d already complete", len(variants), len(variants) - len(todo))
+    if todo and memoize:
+        MEMO.configure(enabled=True, max_entries=MEMO.max_entries, disk_dir=repo_root / base.cache_root / ESTIMATOR_CACHE)
+    try:
+        if todo:
+            panel = prepare_shared_panel(repo_root, base, variants)
+            kinds = frozenset({"jumps", "event_bins"})
+            by_hash = {v.to_hash(): v for v in todo}
+            with tempfile.TemporaryDirectory() as tmp:
+                # Workers reopen a memory-mapped Arrow copy of the panel instead of unpickling frames.
+                handle = export_panel(panel, Path(tmp) / "panel_long.arrow") if jobs > 1 else None
+                groups = series_cells(panel, handle)
+                if not groups:
+                    raise ValueError("sweep: shared panel has no series to estimate")
+                series = [str(meta["series"]) for _, meta in groups]
+                tasks = [
+                    (h, str(meta["series"]), (data, meta, v, kinds))
+                    for h, v in by_hash.items() for data, meta in groups
+                    if not (cell_dir / h / f"{series_code(str(meta['series']))}.parquet").exists()
+                ]
+                pending = {h: sum(1 for t in tasks if t[0] == h) for h in by_hash}
+                logger.info("sweep: %d of %d cells to estimate", len(tasks), len(by_hash) * len(groups))
+
+                def _collect(h: str, name: str, result: tuple[list[dict], list[pd.DataFrame]]) -> None:
+                    (cell_dir / h).mkdir(exist_ok=True)
+                    _cell_frame(by_hash[h], *result).to_parquet(cell_dir / h / f"{series_code(name)}.parquet", index=False)
+                    pending[h] -= 1
+                    if pending[h] == 0:
+                        _combine_variant(cell_dir, h, series)
+
+                for h in [h for h, n in pending.items() if n == 0]:
+                    _combine_variant(cell_dir, h, series)  # interrupted after its last cell, before merging
+                if jobs <= 1:
+                    for h, name, task in tasks:
+                        _collect(h, name, _estimate_series(task))
+                else:
+                    with ProcessPoolExecutor(max_workers=jobs) as ex:
+                        futures = {ex.submit(_estimate_series, task): (h, name) for h, name, task in tasks}
+                        for fut in as_completed(futures):
+                            _collect(*futures[fut], fut.result())
+    finally:
+        if todo and memoize:
+            logger.info("sweep: estimator memo %s", MEMO.stats()["total"])
+            MEMO.configure(enabled=False, max_entries=MEMO.max_entries, disk_dir=MEMO.disk_dir)
+
+    frames = [pd.read_parquet(cell_dir / f"{v.to_hash()}.parquet") for v in variants]
+    combined = pd.concat(frames, ignore_index=True).set_index("config_hash")
+    combined.to_parquet(out_dir / "sweep_results.parquet")
+    return combined
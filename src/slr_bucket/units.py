@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+UNITS_MANIFEST = "units.json"  # under PipelineConfig.cache_root
+UNIT_SCALE = {"bps": 1.0, "percent": 100.0, "decimal": 10_000.0}
+# Median |x| below this reads as percent (0.40 == 40 bps); the rule _scale_to_bps applied pooled.
+PERCENT_BELOW = 5.0
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch of ``|x|`` on log-spaced buckets (fixed memory).
+
+    Bucket edges are ``per_decade`` per power of ten between ``10**lo_exp`` and
+    ``10**hi_exp`` (relative error ~``ln(10)/per_decade``); zeros and values outside the
+    range land in the end buckets. Enough to place a median against unit thresholds
+    that are a factor of 100 apart.
+    """
+
+    __slots__ = ("lo_exp", "per_decade", "counts")
+
+    def __init__(self, lo_exp: int = -9, hi_exp: int = 9, per_decade: int = 50) -> None:
+        self.lo_exp = lo_exp
+        self.per_decade = per_decade
+        self.counts = np.zeros((hi_exp - lo_exp) * per_decade + 2, dtype=np.int64)
+
+    @property
+    def n(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values) -> "QuantileSketch":
+        x = np.abs(pd.to_numeric(pd.Series(np.asarray(values).ravel()), errors="coerce").to_numpy(dtype=float))
+        x = x[np.isfinite(x)]
+        with np.errstate(divide="ignore"):
+            pos = np.floor((np.log10(x) - self.lo_exp) * self.per_decade) + 1
+        idx = np.clip(np.nan_to_num(pos, neginf=0), 0, len(self.counts) - 1).astype(np.int64)
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        self.counts += other.counts
+        return self
+
+    def quantile(self, q: float) -> float:
+        n = self.n
+        if n == 0:
+            return np.nan
+        b = int(np.searchsorted(np.cumsum(self.counts), q * n, side="left"))
+        if b == 0:
+            return 0.0
+        # geometric midpoint of the bucket
+        return float(10 ** (self.lo_exp + (b - 0.5) / self.per_decade))
+
+
+def infer_unit(median_abs: float) -> str:
+    if np.isfinite(median_abs) and median_abs < PERCENT_BELOW:
+        return "percent"
+    return "bps"
+
+
+def _chunks(path: Path, columns: list[str], chunk_rows: int, data: pd.DataFrame | None = None) -> Iterator[pd.DataFrame]:
+    suffix = path.suffix.lower()
+    if data is not None:
+        for start in range(0, len(data), chunk_rows):
+            yield data.iloc[start:start + chunk_rows]
+        return
+    if suffix in {".parquet", ".pq"}:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas(ignore_metadata=True)
+    elif suffix == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_rows)
+    else:
+        from .io import load_any_table
+
+        df = load_any_table(path)[columns]
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+
+
+def scan_sketches(
+    path: Path, columns: Iterable[str], chunk_rows: int = 100_000, data: pd.DataFrame | None = None,
+) -> dict[str, QuantileSketch]:
+    """One :class:`QuantileSketch` per column, reading ``path`` (or an already loaded ``data``) in chunks."""
+    columns = list(columns)
+    sketches = {c: QuantileSketch() for c in columns}
+    for chunk in _chunks(Path(path), columns, chunk_rows, data):
+        for c in columns:
+            sketches[c].update(chunk[c].to_numpy())
+    return sketches
+
+
+class UnitManifest:
+    """Per-series unit decisions, inferred once and then applied as recorded scale factors.
+
+    Entries are keyed ``<file name>:<column>`` with the inferred unit, its bps scale, the
+    sketch median and the source's size/mtime; a source rebuilt in place (``build-spreads``)
+    no longer matches and its columns are re-inferred. With a ``path`` the manifest is JSON
+    (``<cache_root>/units.json``) and new decisions are written back; edit or delete an
+    entry to override or re-infer.
+    """
+
+    def __init__(self, path: Path | None = None, chunk_rows: int = 100_000) -> None:
+        self.path = Path(path) if path is not None else None
+        self.chunk_rows = chunk_rows
+        self.entries: dict[str, dict] = {}
+        if self.path is not None and self.path.exists():
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def key(source: Path, column: str) -> str:
+        return f"{Path(source).name}:{column}"
+
+    @staticmethod
+    def stamp(source: Path) -> dict[str, int] | None:
+        """Cheap fingerprint of ``source`` (size and mtime); ``None`` when it is not a file on disk."""
+        try:
+            st = Path(source).stat()
+        except OSError:
+            return None
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def scales(self, source: Path, columns: Iterable[str], data: pd.DataFrame | None = None) -> dict[str, float]:
+        """bps scale factor per column of ``source``; only unrecorded or outdated columns are scanned.
+
+        Pass ``data`` when the caller already holds the columns to sketch them from memory.
+        """
+        columns = [str(c) for c in columns]
+        stamp = self.stamp(source)
+        missing = [
+            c for c in columns
+            if self.key(source, c) not in self.entries or self.entries[self.key(source, c)].get("source") != stamp
+        ]
+        if missing:
+            for col, sketch in scan_sketches(source, missing, self.chunk_rows, data).items():
+                median = sketch.quantile(0.5)
+                unit = infer_unit(median)
+                self.entries[self.key(source, col)] = {
+                    "unit": unit, "scale": UNIT_SCALE[unit], "median_abs": median, "n": sketch.n, "source": stamp,
+                }
+            logger.info("units: inferred %d columns of %s", len(missing), Path(source).name)
+            self.save()
+        return {c: float(self.entries[self.key(source, c)]["scale"]) for c in columns}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding="utf-8")
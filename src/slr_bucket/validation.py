@@ -1,24 +1,141 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+DAILY_LONG_REQUIRED = ("date", "tenor", "series", "value")
+DAILY_LONG_KEY = ["series", "tenor", "date"]
+# Rows failing several checks are counted under the first reason listed here.
+DROP_REASONS = ("bad_date", "missing_tenor", "missing_series", "missing_value")
 
-def validate_daily_long(df: pd.DataFrame) -> pd.DataFrame:
-    req = {"date", "tenor", "series", "value"}
-    missing = req - set(df.columns)
+
+@dataclass
+class ValidationReport:
+    rows_in: int = 0
+    rows_out: int = 0
+    chunks: int = 0
+    dropped: dict[str, int] = field(default_factory=lambda: dict.fromkeys((*DROP_REASONS, "duplicate"), 0))
+    duplicates_by_series: dict[str, int] = field(default_factory=dict)
+    input_sorted: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _check_chunk(chunk: pd.DataFrame, report: ValidationReport) -> pd.DataFrame:
+    missing = set(DAILY_LONG_REQUIRED) - set(chunk.columns)
     if missing:
         raise ValueError(f"daily_long missing required columns: {sorted(missing)}")
-    out = df.copy()
-    out["date"] = pd.to_datetime(out["date"], errors="coerce").dt.tz_localize(None)
-    out = out.dropna(subset=["date", "tenor", "series", "value"]) 
-    out = out.sort_values(["series", "tenor", "date"]).drop_duplicates(["date", "tenor", "series"], keep="last")
+    dates = raw = chunk["date"]
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    elif not pd.api.types.is_datetime64_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_localize(None)
+
+    bad = np.zeros(len(chunk), dtype=bool)
+    for reason, isna in zip(DROP_REASONS, (dates.isna(), chunk["tenor"].isna(), chunk["series"].isna(), chunk["value"].isna())):
+        new = isna.to_numpy() & ~bad
+        report.dropped[reason] += int(new.sum())
+        bad |= new
+
+    out = chunk.loc[~bad] if bad.any() else chunk
+    if dates is not raw:
+        out = out.assign(date=dates[~bad])
+    report.rows_in += len(chunk)
+    report.chunks += 1
     return out
 
 
+def _key_hashes(frame: pd.DataFrame) -> np.ndarray:
+    """64-bit hash of ``(series, tenor, date)`` with the key dtypes normalized.
+
+    Chunks may disagree on dtypes (an int tenor batch next to a float one with a null), so
+    numeric tenors hash as float64, dates as datetime64[ns] and series as str.
+    """
+    tenor = frame["tenor"]
+    key = pd.DataFrame({
+        "series": frame["series"].astype(str),
+        "tenor": tenor.astype("float64") if pd.api.types.is_numeric_dtype(tenor) else tenor.astype(str),
+        "date": frame["date"].astype("datetime64[ns]"),
+    })
+    return pd.util.hash_pandas_object(key, index=False).to_numpy()
+
+
+def _is_lex_sorted(frame: pd.DataFrame, cols: list[str]) -> bool:
+    if len(frame) < 2:
+        return True
+    tied = np.ones(len(frame) - 1, dtype=bool)
+    try:
+        for col in cols:
+            a = frame[col].to_numpy()
+            if (tied & (a[1:] < a[:-1])).any():
+                return False
+            tied &= ~(a[1:] > a[:-1])
+    except TypeError:  # mixed, non-comparable key values
+        return False
+    return True
+
+
+def validate_daily_long_report(
+    data: pd.DataFrame | Iterable[Any],
+) -> tuple[pd.DataFrame, ValidationReport]:
+    """Validate a daily long panel in one pass and report what was removed.
+
+    ``data`` is a frame or an iterable of chunks (frames or Arrow record batches, e.g.
+    ``pq.ParquetFile(path).iter_batches()``). Each chunk is parsed and filtered once; exact
+    duplicates of ``(series, tenor, date)``, also across chunks, are found from 64-bit hashes
+    of the concatenated key (last row wins), and the final sort is skipped when the
+    surviving rows are already ordered.
+    """
+    report = ValidationReport()
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    parts = [_check_chunk(chunk.to_pandas() if hasattr(chunk, "to_pandas") else chunk, report) for chunk in chunks]
+    if not parts:
+        raise ValueError("daily_long: no input chunks")
+    out = parts[0] if len(parts) == 1 else pd.concat(parts)
+
+    dup = pd.Index(_key_hashes(out)).duplicated(keep="last")
+    if dup.any():
+        report.dropped["duplicate"] = int(dup.sum())
+        report.duplicates_by_series = {str(k): int(v) for k, v in out["series"][dup].value_counts().sort_index().items()}
+        out = out[~dup]
+
+    report.input_sorted = _is_lex_sorted(out, DAILY_LONG_KEY)
+    if not report.input_sorted:
+        out = out.sort_values(DAILY_LONG_KEY, kind="stable")
+    report.rows_out = len(out)
+    logger.info("daily_long validation: %d -> %d rows, dropped %s", report.rows_in, report.rows_out, report.dropped)
+    return out, report
+
+
+def validate_daily_long(df: pd.DataFrame) -> pd.DataFrame:
+    return validate_daily_long_report(df)[0]
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """64-bit content hash per row, computed once per run and reused by :func:`history_hash`."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def history_hash(hashes: np.ndarray, dates: pd.Series, upto: pd.Timestamp) -> str:
+    """Order-insensitive digest of the rows dated on or before ``upto`` (detects edits to history).
+
+    The digest is the row count and the wrapping sum of the rows' :func:`row_hashes`, so
+    it is a masked sum over hashes already in hand rather than a re-hash and sort of history.
+    """
+    keep = (dates <= upto).to_numpy()
+    total = np.add.reduce(hashes[keep], dtype=np.uint64)  # wraps modulo 2**64
+    return f"{int(keep.sum()):x}-{int(total):016x}"
+
+
 def report_merge_quality(base: pd.DataFrame, merged: pd.DataFrame, key: str = "date") -> dict[str, float]:
     if key not in base.columns or key not in merged.columns:
         return {"match_rate": 0.0}
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import logging
+import re
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TABLES = ("jumps", "bins", "pooled_jumps", "pooled_es")
+PARTITION_COLS = ("config_hash", "run_id")
+QUERY_COLS = ("strategy", "series", "event", "event_date", "window", "spec", "term", "kind")
+STRING_COLS = {"strategy", "series", "tenor", "event", "event_date", "spec", "term", "kind", "ref_bin"}
+INT_COLS = {"window", "N", "n", "treasury_based"}
+FLOAT_COLS = {"estimate", "se", "ci_low", "ci_high", "bootstrap_se", "bootstrap_p", "bin_mid", "sup_t_crit", "band_low", "band_high"}
+# Two-sided normal critical values for the *, **, *** markers.
+STARS = ((2.576, "***"), (1.96, "**"), (1.645, "*"))
+
+
+def _require_dataset():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError("The results warehouse needs `pyarrow`. Install it, or read the per-run CSV tables.") from exc
+    return pa, ds
+
+
+def _typed(df: pd.DataFrame) -> pd.DataFrame:
+    """Fixed dtypes for the shared columns so every run appends the same schema."""
+    out = df.copy()
+    for c in out.columns:
+        if c in STRING_COLS:
+            out[c] = out[c].map(lambda v: None if pd.isna(v) else str(v)).astype("string")
+        elif c in INT_COLS:
+            out[c] = pd.to_numeric(out[c], errors="coerce").astype("Int64")
+        elif c in FLOAT_COLS:
+            out[c] = pd.to_numeric(out[c], errors="coerce").astype("float64")
+    return out
+
+
+def _partitioning(ds, pa):
+    return ds.partitioning(pa.schema([(c, pa.string()) for c in PARTITION_COLS]), flavor="hive")
+
+
+def _dataset(base: Path, ds, pa):
+    """Dataset over every run's files with the union of their columns.
+
+    Without an explicit schema Arrow takes the first fragment's, so columns added by later
+    runs (bootstrap, sup-t bands) would be dropped; older runs read them as nulls.
+    """
+    data = ds.dataset(base, format="parquet", partitioning=_partitioning(ds, pa))
+    schemas = [f.physical_schema for f in data.get_fragments()]
+    if len(schemas) < 2:
+        return data
+    unified = pa.unify_schemas(schemas, promote_options="permissive")
+    for col in PARTITION_COLS:
+        if col not in unified.names:
+            unified = unified.append(pa.field(col, pa.string()))
+    return ds.dataset(base, schema=unified, format="parquet", partitioning=_partitioning(ds, pa))
+
+
+def append_run(root: Path, config_hash: str, run_id: str, tables: dict[str, pd.DataFrame]) -> dict[str, int]:
+    """Append one run's result tables under ``root/<table>/config_hash=<h>/run_id=<id>/``.
+
+    Re-appending the same run id replaces that run's partition. Empty tables are skipped.
+    Returns rows written per table.
+    """
+    pa, ds = _require_dataset()
+    written = {}
+    for name, df in tables.items():
+        if name not in TABLES:
+            raise ValueError(f"Unknown warehouse table '{name}'. Expected one of {TABLES}")
+        if df is None or df.empty:
+            continue
+        table = pa.Table.from_pandas(_typed(df).assign(config_hash=config_hash, run_id=run_id), preserve_index=False)
+        ds.write_dataset(
+            table, Path(root) / name, format="parquet", partitioning=_partitioning(ds, pa),
+            basename_template="part-{i}.parquet", existing_data_behavior="delete_matching",
+        )
+        written[name] = len(df)
+    logger.info("warehouse: run %s (%s) appended %s", run_id, config_hash, written)
+    return written
+
+
+def list_runs(root: Path, table: str = "jumps") -> pd.DataFrame:
+    """``config_hash``/``run_id`` pairs present for ``table`` (read from the directory layout only)."""
+    rows = []
+    base = Path(root) / table
+    for run_dir in sorted(base.glob("config_hash=*/run_id=*")) if base.exists() else []:
+        rows.append({"config_hash": run_dir.parent.name.split("=", 1)[1], "run_id": run_dir.name.split("=", 1)[1]})
+    return pd.DataFrame(rows, columns=list(PARTITION_COLS))
+
+
+def query_results(
+    root: Path,
+    table: str = "jumps",
+    config_hash: str | list[str] | None = None,
+    run_id: str | list[str] | None = None,
+    latest: bool = False,
+    columns: list[str] | None = None,
+    **filters: Any,
+) -> pd.DataFrame:
+    """Filter a warehouse table; partition filters skip other runs' files entirely.
+
+    ``filters`` are column -> value (or list of values) on :data:`QUERY_COLS`; filtering
+    ``table`` by a column it does not have raises ``ValueError``.
+    ``latest=True`` keeps only the most recent run id of each config hash.
+    """
+    pa, ds = _require_dataset()
+    unknown = sorted(set(filters) - set(QUERY_COLS))
+    if unknown:
+        raise ValueError(f"Unknown query columns: {unknown}. Expected a subset of {QUERY_COLS}")
+    base = Path(root) / table
+    if not base.exists():
+        return pd.DataFrame()
+    if latest:
+        runs = list_runs(root, table)
+        if config_hash is not None:
+            runs = runs[runs["config_hash"].isin(np.atleast_1d(config_hash))]
+        run_id = runs.groupby("config_hash")["run_id"].max().tolist()
+        if not run_id:
+            return pd.DataFrame()
+
+    data = _dataset(base, ds, pa)
+    cond = None
+    for col, value in {"config_hash": config_hash, "run_id": run_id, **filters}.items():
+        if value is None:
+            continue
+        if col not in data.schema.names:
+            if col in PARTITION_COLS:
+                continue
+            raise ValueError(f"Table {table!r} has no column {col!r}; columns: {data.schema.names}")
+        values = [v.item() if isinstance(v, np.generic) else v for v in np.atleast_1d(value).tolist()]
+        if col not in INT_COLS:
+            values = [str(v) for v in values]
+        term = ds.field(col).isin(values)
+        cond = term if cond is None else cond & term
+    out = data.to_table(columns=columns, filter=cond).to_pandas()
+    return out.sort_values([c for c in ("config_hash", "run_id") if c in out.columns], kind="mergesort").reset_index(drop=True)
+
+
+def _stars(est: float, se: float) -> str:
+    z = abs(est / se) if np.isfinite(se) and se > 0 else 0.0
+    return next((s for crit, s in STARS if z >= crit), "")
+
+
+def jump_table(jumps: pd.DataFrame, row_keys: tuple[str, ...] = ("series", "window"), digits: int = 3) -> pd.DataFrame:
+    """Stacked ``estimate***`` / ``(se)`` text rows per ``row_keys`` with one column per event x spec."""
+    cols = sorted(jumps[["event", "spec"]].drop_duplicates().itertuples(index=False, name=None))
+    lines = []
+    for key, g in jumps.groupby(list(row_keys), sort=True):
+        cells = {(r.event, r.spec): (float(r.estimate), float(r.se)) for r in g.itertuples(index=False)}
+        est_row, se_row = {}, {}
+        for c in cols:
+            est, se = cells.get(c, (np.nan, np.nan))
+            est_row[c] = f"{est:.{digits}f}{_stars(est, se)}" if np.isfinite(est) else ""
+            se_row[c] = f"({se:.{digits}f})" if np.isfinite(est) and np.isfinite(se) else ""
+        lines += [[" / ".join(str(k) for k in np.atleast_1d(key)), *est_row.values()], ["", *se_row.values()]]
+    return pd.DataFrame(lines, columns=["", *[f"{e} {s}" for e, s in cols]])
+
+
+def render_jump_table(jumps: pd.DataFrame, fmt: str = "html", title: str = "", digits: int = 3) -> str:
+    """Event-window jump table (Table 2 layout) as HTML or LaTeX, rendered from warehouse rows."""
+    body = jump_table(jumps, digits=digits)
+    ncol = body.shape[1]
+    note = "HAC s.e. in parentheses; * p<0.1, ** p<0.05, *** p<0.01"
+    if fmt == "html":
+        def cell(v: str) -> str:
+            v = v.replace("&", "&amp;").replace("<", "&lt;")
+            return re.sub(r"(\*+)$", r"<sup>\1</sup>", v)
+
+        head = "".join(f"<td>{cell(c)}</td>" for c in body.columns)
+        rows = "".join("<tr>" + "".join(f"<td>{cell(v)}</td>" for v in r) + "</tr>\n" for r in body.itertuples(index=False))
+        rule = f'<tr><td colspan="{ncol}" style="border-bottom: 1px solid black"></td></tr>\n'
+        return (f"{title}<br>" if title else "") + (
+            f'<table style="text-align:center">{rule}<tr>{head}</tr>\n{rule}{rows}{rule}'
+            f'<tr><td colspan="{ncol}" style="text-align:left"><em>{cell(note)}</em></td></tr></table>\n'
+        )
+    if fmt == "latex":
+        def cell(v: str) -> str:
+            v = v.replace("\\", r"\textbackslash{}").replace("_", r"\_").replace("&", r"\&").replace("%", r"\%")
+            return re.sub(r"(\*+)$", r"$^{\1}$", v)
+
+        lines = [r"\begin{table}[!htbp] \centering", *([f"\\caption{{{cell(title)}}}"] if title else []),
+                 r"\begin{tabular}{l" + "c" * (ncol - 1) + "}", r"\hline",
+                 " & ".join(cell(c) for c in body.columns) + r" \\", r"\hline"]
+        lines += [" & ".join(cell(v) for v in r) + r" \\" for r in body.itertuples(index=False)]
+        lines += [r"\hline", f"\\multicolumn{{{ncol}}}{{l}}{{\\footnotesize {note.replace('<', '$<$')}}} \\\\",
+                  r"\end{tabular}", r"\end{table}"]
+        return "\n".join(lines) + "\n"
+    raise ValueError(f"Unknown table format '{fmt}'. Expected 'html' or 'latex'")
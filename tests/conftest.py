@@ -3,7 +3,39 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+def make_synthetic_repo(root: Path, n: int = 160) -> Path:
+    """Minimal data/ tree (two TIPS arb series + FRED/repo controls) for runner tests."""
+    dates = pd.bdate_range("2020-01-01", periods=n)
+    rng = np.random.default_rng(0)
+    post = (dates >= "2020-04-01").astype(float)
+    series_dir = root / "data" / "series"
+    event_dir = root / "data" / "raw" / "event_inputs"
+    series_dir.mkdir(parents=True)
+    event_dir.mkdir(parents=True)
+    pd.DataFrame({
+        "date": dates,
+        "arb_2": 20 + 5 * post + rng.normal(size=n),
+        "arb_5": 30 + 5 * post + rng.normal(size=n),
+    }).to_parquet(series_dir / "tips_treasury_implied_rf_2010.parquet", index=False)
+    pd.DataFrame({"date": dates, "VIX": rng.normal(20, 2, n), "HY_OAS": 5.0, "BAA10Y": 2.0}).to_csv(
+        event_dir / "controls_vix_creditspreads_fred.csv", index=False
+    )
+    pd.DataFrame({"date": dates, "SOFR": 1.5, "TGCR": 1.45, "BGCR": 1.45}).to_csv(
+        event_dir / "repo_rates_combined.csv", index=False
+    )
+    return root
+
+
+@pytest.fixture
+def synthetic_repo(tmp_path: Path) -> Path:
+    return make_synthetic_repo(tmp_path)
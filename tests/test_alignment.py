@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from slr_bucket.alignment import ASOF_SOURCES, align_asof, asof_indexer, to_day_ints
+
+
+def test_asof_indexer_directions_and_staleness():
+    right = to_day_ints(["2020-01-01", "2020-01-10"])
+    left = to_day_ints(["2019-12-31", "2020-01-01", "2020-01-04", "2020-01-09", "2020-01-20"])
+    idx, gap = asof_indexer(left, right, "backward", max_staleness=5)
+    assert idx.tolist() == [-1, 0, 0, -1, -1]
+    assert gap.tolist() == [-1, 0, 3, 8, 10]
+    assert asof_indexer(left, right, "forward")[0].tolist() == [0, 0, 1, 1, -1]
+    assert asof_indexer(left, right, "nearest")[0].tolist() == [0, 0, 0, 1, 1]
+
+
+def test_align_asof_matches_merge_asof_per_control():
+    quarterly = pd.DataFrame({
+        "date": pd.to_datetime(["2020-03-31", "2020-06-30", "2020-09-30"]),
+        "share": [0.1, np.nan, 0.3],
+    })
+    calendar = pd.bdate_range("2020-03-01", "2020-10-30")
+    out, stats = align_asof(calendar, quarterly, max_staleness_days=100, name="bank")
+    expected = pd.merge_asof(
+        pd.DataFrame({"date": calendar}), quarterly.dropna(), on="date", tolerance=pd.Timedelta(days=100)
+    )
+    np.testing.assert_array_equal(out["share"].to_numpy(), expected["share"].to_numpy())
+    assert stats[0]["stale_dropped"] == int(((calendar > "2020-07-09") & (calendar < "2020-09-30")).sum())
+    assert stats[0]["exact"] == 2
+
+
+def test_bank_exposure_waits_for_the_filing():
+    src = ASOF_SOURCES["bank_exposure"]
+    quarterly = pd.DataFrame({"date": pd.to_datetime(["2019-12-31", "2020-03-31", "2020-06-30"]), "share": [0.1, 0.2, 0.3]})
+    calendar = pd.to_datetime(["2020-04-01", "2020-05-14", "2020-05-15", "2020-08-13", "2020-08-14"])
+    out, _ = align_asof(calendar, quarterly, src.direction, src.max_staleness_days, src.lag_days)
+    # the Q1 value is not public the day after quarter-end; Q4 2019 is still the latest filing
+    assert out["share"].tolist() == [0.1, 0.1, 0.2, 0.2, 0.3]
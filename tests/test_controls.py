@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from slr_bucket.controls import load_controls_cube
+
+
+def test_controls_cube_is_cached_until_a_source_changes(synthetic_repo):
+    data_dir, cache = synthetic_repo / "data", synthetic_repo / "cache"
+    cube = load_controls_cube(data_dir, cache)
+    assert cube["date"].is_unique and cube["date"].is_monotonic_increasing
+    assert cube["sofr"].iloc[0] == 150.0 and abs(cube["spr_tgcr"].iloc[0] + 5.0) < 1e-9
+    prov = pd.DataFrame(cube.attrs["provenance"]).set_index("column")
+    assert prov.loc["sofr", "unit"] == "bps" and prov.loc["VIX", "source"] == "controls_vix_creditspreads_fred"
+
+    again = load_controls_cube(data_dir, cache)
+    assert again.attrs["cube_key"] == cube.attrs["cube_key"]
+    pd.testing.assert_frame_equal(again, cube)
+
+    fred_path = data_dir / "raw" / "event_inputs" / "controls_vix_creditspreads_fred.csv"
+    fred = pd.read_csv(fred_path)
+    fred.loc[0, "VIX"] = 99.0
+    fred.to_csv(fred_path, index=False)
+    rebuilt = load_controls_cube(data_dir, cache)
+    assert rebuilt.attrs["cube_key"] != cube.attrs["cube_key"]
+    assert rebuilt["VIX"].iloc[0] == 99.0
+    assert len(list((cache / "controls_cube").glob("*.parquet"))) == 2
@@ -3,7 +3,21 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from slr_bucket.econometrics.event_study import add_event_time, block_bootstrap_jump, event_study_regression, jump_estimator, make_bins
+from slr_bucket.econometrics.event_study import (
+    SupTBands,
+    TermTable,
+    WildBootstrap,
+    add_event_time,
+    add_event_time_by_group,
+    block_bootstrap_jump,
+    event_anchors,
+    event_study_regression,
+    jump_estimator,
+    make_bins,
+    pooled_event_study,
+    pooled_jump_regression,
+    sup_t_critical,
+)
 
 
 def synthetic_df(n=180):
@@ -51,3 +65,83 @@ def test_event_study_regression_output():
     out = event_study_regression(df, "y", "2020-03-15", bins=[(-20, -1), (0, 0), (1, 20)], controls=["x"], hac_lags=2)
     assert not out.empty
     assert {"term", "estimate", "se", "ci_low", "ci_high", "n"}.issubset(out.columns)
+
+
+def test_term_table_grows_and_frames_once():
+    table = TermTable(capacity=2)
+    table.add_terms(["a", "b"], [1.0, 2.0], [0.5, 0.5], n=10)
+    table.add_terms(np.array(["c", "d", "e"], dtype=object), np.arange(3.0), np.ones(3), n=np.array([1, 2, 3]))
+    out = table.to_frame()
+    assert list(out.columns) == ["term", "estimate", "se", "ci_low", "ci_high", "n"]
+    assert out["term"].tolist() == ["a", "b", "c", "d", "e"]
+    assert out["n"].tolist() == [10, 10, 1, 2, 3]
+    assert np.allclose(out["ci_high"] - out["ci_low"], 2 * 1.96 * out["se"])
+    assert TermTable().to_frame().empty
+
+
+def test_pooled_event_study_group1_is_baseline_plus_interaction():
+    rng = np.random.default_rng(3)
+    frames = []
+    for series, group in [("a", 0), ("b", 1), ("c", 1)]:
+        df = synthetic_df(120).assign(series=series, g=group)
+        df["y"] = df["y"] * (1 + group) + rng.normal(scale=0.1, size=len(df))
+        frames.append(df)
+    out, robust = pooled_event_study(pd.concat(frames), "y", "2020-03-15", [(-20, -1), (0, 0), (1, 20)], "g", "series")
+    names = list(robust.model.exog_names)
+    params, cov = np.asarray(robust.params), np.asarray(robust.cov_params())
+    g1 = out[out["kind"] == "group1_effect"].set_index("term")
+    for term, row in g1.iterrows():
+        i, j = names.index(term), names.index(term + ":g")
+        b, g = params[i], params[j]
+        se = np.sqrt(cov[i, i] + cov[j, j] + 2 * cov[i, j])
+        assert np.isclose(row["estimate"], b + g) and np.isclose(row["se"], se)
+
+
+def test_sup_t_bands_match_sidak_for_independent_bins_and_cover_pointwise():
+    # independent bins: the sup-t value is the Sidak critical value; perfectly correlated: 1.96
+    crit = sup_t_critical([np.eye(7) * 4.0, np.ones((7, 7)), np.eye(3)], SupTBands(draws=40_000))
+    assert abs(crit[0] - 2.683) < 0.03 and abs(crit[1] - 1.96) < 0.03 and abs(crit[2] - 2.388) < 0.03
+
+    frames = [synthetic_df(120).assign(series=s, g=g) for s, g in [("a", 0), ("b", 1), ("c", 1)]]
+    bins = [(-40, -21), (-20, -1), (0, 0), (1, 20), (21, 40)]
+    out, _ = pooled_event_study(pd.concat(frames), "y", "2020-03-15", bins, "g", "series", bands=SupTBands(draws=5_000))
+    assert out.groupby("kind")["sup_t_crit"].nunique().eq(1).all()
+    assert (out["sup_t_crit"] > 1.96).all() and (out["band_low"] <= out["ci_low"]).all()
+    single = event_study_regression(synthetic_df(), "y", "2020-03-15", bins, bands=SupTBands(draws=5_000))
+    assert np.allclose(single["band_high"] - single["estimate"], single["sup_t_crit"] * single["se"])
+
+
+def test_wild_bootstrap_without_refits_matches_cluster_robust_variance():
+    rng = np.random.default_rng(5)
+    frames = [synthetic_df(120).assign(series=s, g=g) for s, g in [("a", 0), ("b", 1), ("c", 1), ("d", 0)]]
+    panel = pd.concat(frames, ignore_index=True)
+    panel["y"] += rng.normal(size=len(panel))
+    spec = WildBootstrap(reps=20_000, chunk=3_000, seed=1)
+    out = pooled_jump_regression(panel, "y", "2020-03-15", 30, "g", "series", bootstrap=spec)
+
+    # E[(b* - b)^2] under Rademacher weights is the CR0 date-clustered variance
+    sub = add_event_time(panel, "2020-03-15")
+    sub = sub[sub["event_time"].between(-30, 30)]
+    X = np.column_stack([np.ones(len(sub)), sub["event_time"] >= 0, (sub["event_time"] >= 0) * sub["g"],
+                         *(sub["series"] == s for s in ["b", "c", "d"])]).astype(float)
+    bread = np.linalg.inv(X.T @ X)
+    u = sub["y"].to_numpy() - X @ (bread @ X.T @ sub["y"].to_numpy())
+    scores = pd.DataFrame(X * u[:, None]).groupby(sub["date"].to_numpy()).sum().to_numpy()
+    cr0 = np.sqrt(np.diag(bread @ scores.T @ scores @ bread))[1:3]
+    assert np.allclose(out["bootstrap_se"], cr0, rtol=0.03)
+    # common jump of 0.8 in every series; no group difference
+    assert out["bootstrap_p"].iloc[0] < 0.01 < out["bootstrap_p"].iloc[1]
+
+
+def test_event_time_by_group_uses_each_series_calendar():
+    a = pd.DataFrame({"date": pd.bdate_range("2020-03-25", periods=10), "series": "a"})
+    b = a.iloc[[0, 2, 4, 6, 8]].assign(series="b")  # sparser calendar, no 2020-04-01 row
+    panel = pd.concat([b, a]).sample(frac=1.0, random_state=0)
+    out = add_event_time_by_group(panel, "2020-04-01")
+    assert out["series"].tolist() == ["a"] * 10 + ["b"] * 5
+    assert out.loc[out["series"] == "a", "event_time"].tolist() == list(range(-5, 5))
+    assert out.loc[out["series"] == "b", "event_time"].tolist() == [-3, -2, -1, 0, 1]
+
+    anchors = event_anchors(panel, ["2020-04-01", "2021-01-01"]).set_index(["series", "event"])["event_t0_used"]
+    assert anchors[("b", "2020-04-01")] == pd.Timestamp("2020-04-02")
+    assert anchors[("a", "2021-01-01")] == pd.Timestamp("2020-04-07")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HEAVY = ["pandas", "statsmodels", "matplotlib", "pyarrow"]
+
+# Generous enough for a cold CI box; a regression to eager pandas/statsmodels blows past it.
+IMPORT_BUDGET_S = 0.5
+
+
+def _probe(code: str) -> dict:
+    script = (
+        "import json, sys, time\n"
+        f"sys.path.insert(0, {str(SRC)!r})\n"
+        "t0 = time.perf_counter()\n"
+        f"{code}\n"
+        "elapsed = time.perf_counter() - t0\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {HEAVY!r} if m in sys.modules]}}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_config_and_io_import_within_budget():
+    res = _probe("import slr_bucket.config, slr_bucket.io")
+    assert res["loaded"] == []
+    assert res["elapsed"] < IMPORT_BUDGET_S
+
+
+def test_estimators_and_plots_defer_statsmodels_and_matplotlib():
+    res = _probe("import slr_bucket.econometrics, slr_bucket.plotting")
+    assert "statsmodels" not in res["loaded"]
+    assert "matplotlib" not in res["loaded"]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from slr_bucket.instrument import RECORDER, Recorder, instrumented
+
+
+def test_recorder_aggregates_calls_and_rows(tmp_path: Path):
+    rec = Recorder()
+    rec.configure(enabled=True, trace_memory=True)
+    for _ in range(2):
+        with rec.stage("load", rows_in=10) as frame:
+            frame.rows_out = 4
+    r = rec.records["load"]
+    assert (r.calls, r.rows_in, r.rows_out) == (2, 20, 8)
+    assert r.peak_mem_mb is not None and r.wall_s >= 0
+    rec.configure(enabled=False)
+
+    rec.write(tmp_path, history_csv=tmp_path / "history.csv", run_id="r1")
+    assert pd.read_csv(tmp_path / "tables" / "stage_timings.csv")["name"].tolist() == ["load"]
+    assert json.loads((tmp_path / "run_metadata.json").read_text())["instrumentation"][0]["calls"] == 2
+    assert pd.read_csv(tmp_path / "history.csv")["run_id"].tolist() == ["r1"]
+
+
+def test_instrumented_is_passthrough_when_disabled():
+    @instrumented()
+    def head(df: pd.DataFrame) -> pd.DataFrame:
+        return df.head(2)
+
+    df = pd.DataFrame({"x": range(5)})
+    RECORDER.reset()
+    head(df)
+    assert "head" not in RECORDER.records
+    RECORDER.configure(enabled=True)
+    try:
+        head(df)
+    finally:
+        RECORDER.configure(enabled=False)
+    assert (RECORDER.records["head"].rows_in, RECORDER.records["head"].rows_out) == (5, 2)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from slr_bucket.io import build_data_catalog, resolve_dataset_path
@@ -26,3 +27,30 @@ def test_build_data_catalog_has_join_hints(tmp_path: Path):
     row = catalog.iloc[0]
     assert "join_hints" in catalog.columns
     assert "date" in str(row["key_columns"])
+
+
+def test_select_controls_by_window_matches_keep_controls_with_coverage():
+    from slr_bucket.econometrics.event_study import add_event_time
+    from slr_bucket.io import keep_controls_with_coverage, select_controls_by_window
+
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range("2020-01-01", periods=120)
+    frames = []
+    for s in ["a", "b"]:
+        g = pd.DataFrame({"date": dates, "series": s, "req": rng.normal(size=120), "x": rng.normal(size=120), "z": 1.0})
+        g.loc[rng.random(120) < (0.1 if s == "a" else 0.4), "x"] = np.nan
+        g.loc[g["date"] < "2020-03-01", "z"] = np.nan
+        frames.append(g)
+    panel = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=0)
+
+    cells, usable = select_controls_by_window(
+        panel, ["x", "z"], ["2020-03-02", "2020-05-01"], [10, 40], required_cols=["req"], min_rows=18
+    )
+    assert len(cells) == 8 and len(usable) == 8
+    for i, cell in cells.iterrows():
+        g = add_event_time(panel[panel["series"] == cell["series"]], cell["event"])
+        g = g[g["event_time"].between(-cell["window"], cell["window"])]
+        expected = keep_controls_with_coverage(g, ["x", "z"], required_cols=["req"], min_rows=18)
+        assert sorted(cell["controls"]) == sorted(expected.columns)
+        assert sorted(panel.index[usable[i]]) == sorted(expected.index) and cell["n_usable"] == len(expected)
+    assert cells["relaxed"].sum() == 1
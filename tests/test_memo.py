@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slr_bucket.econometrics.event_study import add_event_time, event_study_regression, jump_estimator
+from slr_bucket.memo import MEMO, window_rows
+
+
+def _panel(n=200):
+    rng = np.random.default_rng(3)
+    date = pd.bdate_range("2020-01-01", periods=n)
+    post = (date >= "2020-05-01").astype(int)
+    return pd.DataFrame({"date": date, "y": 0.8 * post + rng.normal(scale=0.2, size=n), "x": rng.normal(size=n)})
+
+
+def test_window_rows_matches_add_event_time():
+    df = _panel().sample(frac=1.0, random_state=1)
+    df.loc[df.index[:5], "date"] = pd.NaT
+    for event in ("2020-05-01", "2020-05-02", "2030-01-01"):
+        et = add_event_time(df, event)["event_time"]
+        assert (window_rows(df["date"], event, -20, 5) == et.between(-20, 5).to_numpy()).all()
+
+
+def test_memo_keys_on_window_slice_and_spills_to_disk(tmp_path: Path):
+    df = _panel()
+    bins = [(-20, -1), (0, 0), (1, 20)]
+    MEMO.configure(enabled=True, max_entries=8, disk_dir=tmp_path / "estimators")
+    try:
+        first = jump_estimator(df, "y", "2020-05-01", 20, controls=["x"])
+        es = event_study_regression(df, "y", "2020-05-01", bins, controls=["x"])
+        es.loc[0, "estimate"] = 99.0  # callers may mutate what they get back
+        outside = df.copy()
+        outside.loc[0, "y"] += 5.0  # 80 trading days before the event
+        assert jump_estimator(outside, "y", "2020-05-01", 20, controls=["x"]) == first
+        assert event_study_regression(outside, "y", "2020-05-01", bins, controls=["x"])["estimate"].iloc[0] != 99.0
+        assert MEMO.stats()["total"]["hits"] == 2
+
+        inside = df.copy()
+        inside.loc[inside["date"] == "2020-05-04", "y"] += 5.0
+        assert jump_estimator(inside, "y", "2020-05-01", 20, controls=["x"]) != first
+        jump_estimator(df, "y", "2020-05-01", 20, controls=["x"], hac_lags=2)  # spec change
+        assert MEMO.stats()["jump_estimator"]["misses"] == 3
+
+        MEMO.clear()  # a fresh process: only the disk tier survives
+        assert jump_estimator(df, "y", "2020-05-01", 20, controls=["x"]) == first
+        assert MEMO.stats()["total"] == {"hits": 0, "disk_hits": 1, "misses": 0, "stores": 0, "entries": 1, "evictions": 0}
+    finally:
+        MEMO.configure(enabled=False)
+        MEMO.clear()
+
+
+def test_failed_run_turns_memo_and_recorder_off(tmp_path: Path):
+    from slr_bucket.config import PipelineConfig
+    from slr_bucket.instrument import RECORDER
+    from slr_bucket.runner import run_pipeline
+
+    with pytest.raises(FileNotFoundError):
+        run_pipeline(tmp_path, PipelineConfig(strategies=["TIPS"]), stages=["jumps"], update_latest=False, memoize=True)
+    assert not MEMO.enabled and not RECORDER.enabled
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from slr_bucket.plotting.batch import MANIFEST_NAME, PlotJob, render_jobs
+
+
+def _jobs(out_dir, shift=0.0):
+    df = pd.DataFrame({"date": pd.bdate_range("2020-01-01", periods=30), "y": [float(i) + shift for i in range(30)]})
+    opts = {"y_col": "y", "events": ["2020-01-15"]}
+    return [
+        PlotJob("series_with_events", df, "a", out_dir / "a.png", options=opts),
+        PlotJob("series_with_events", df.iloc[:20], "b", out_dir / "b.png", options=opts),
+    ]
+
+
+def test_render_jobs_skips_unchanged_and_reuses_cache(tmp_path):
+    out, cache = tmp_path / "figs", tmp_path / "cache"
+    assert render_jobs(_jobs(out), cache_dir=cache) == {"rendered": 2, "copied": 0, "skipped": 0}
+    assert (out / "a.png").exists() and (out / MANIFEST_NAME).exists()
+    assert render_jobs(_jobs(out), cache_dir=cache)["skipped"] == 2
+
+    changed = _jobs(out, shift=1.0)
+    assert render_jobs(changed, cache_dir=cache)["rendered"] == 2
+    # Back to the original data: outputs differ from the manifest but are in the cache.
+    assert render_jobs(_jobs(out), cache_dir=cache) == {"rendered": 0, "copied": 2, "skipped": 0}
+    assert render_jobs(_jobs(tmp_path / "parallel", shift=2.0), n_jobs=2)["rendered"] == 2
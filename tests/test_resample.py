@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from slr_bucket.resample import ResampleSpec, resample_daily, update_resampled
+
+
+def _daily(end: str) -> pd.DataFrame:
+    dates = pd.bdate_range("2020-01-01", end)
+    t = np.arange(len(dates), dtype=float)
+    frames = [pd.DataFrame({"date": dates, "series": s, "y": np.sin(t + k), "vix": t}) for k, s in enumerate(["a", "b"])]
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_resample_daily_matches_pandas_resample():
+    daily = _daily("2020-06-30")
+    spec = ResampleSpec("weekly", rules={"vix": "last"}, by=("series",))
+    out = resample_daily(daily, spec).set_index(["series", "date"])
+    weekly = daily.set_index("date").groupby("series").resample("W-FRI")
+    pd.testing.assert_series_equal(out["y"], weekly["y"].mean(), check_names=False)
+    pd.testing.assert_series_equal(out["vix"], weekly["vix"].last(), check_names=False)
+
+    monthly = resample_daily(daily[daily["series"] == "a"].drop(columns="series"), ResampleSpec("monthly"))
+    assert monthly["date"].dt.is_month_end.all() and len(monthly) == 6
+
+
+def test_update_resampled_recomputes_only_trailing_periods(tmp_path):
+    spec = ResampleSpec("weekly", by=("series",))
+    first, info = update_resampled(_daily("2020-06-30"), spec, tmp_path, "panel")
+    assert info["mode"] == "full"
+    assert update_resampled(_daily("2020-06-30"), spec, tmp_path, "panel")[1]["mode"] == "unchanged"
+
+    grown = _daily("2020-07-15")
+    out, info = update_resampled(grown, spec, tmp_path, "panel")
+    assert info["mode"] == "incremental" and info["periods_recomputed"] == 3
+    pd.testing.assert_frame_equal(out, resample_daily(grown, spec))
+
+    revised = grown.copy()
+    revised.loc[0, "y"] = 100.0
+    assert update_resampled(revised, spec, tmp_path, "panel")[1]["mode"] == "full"
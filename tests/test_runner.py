@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from slr_bucket.config import PipelineConfig, load_config
+from slr_bucket.runner import run_pipeline
+
+
+def test_load_config_roundtrip(tmp_path: Path):
+    p = tmp_path / "config.json"
+    p.write_text(json.dumps({"windows": [5], "event_bins": [[-5, -1], [0, 0]], "strategies": ["CIP"]}), encoding="utf-8")
+    cfg = load_config(p)
+    assert cfg.event_bins == [(-5, -1), (0, 0)]
+    assert cfg.strategies == ["CIP"]
+    assert cfg.to_hash() == load_config(p).to_hash()
+
+
+def test_opt_in_fields_keep_existing_hashes():
+    # hash of the TIPS-only default before strategies/outcome_col/sample_*/sup_t_draws existed
+    assert PipelineConfig(strategies=["TIPS"]).to_hash() == "f562fdf488e4"
+    assert PipelineConfig(strategies=["TIPS"], sup_t_draws=100).to_hash() != "f562fdf488e4"
+    assert PipelineConfig().to_hash() != "f562fdf488e4"  # TIPS + CIP is a different sample
+
+
+def test_run_pipeline_writes_tables_and_timings(synthetic_repo: Path):
+    root = synthetic_repo
+    cfg = PipelineConfig(
+        strategies=["TIPS"],
+        event_dates=["2020-04-01"], windows=[10], event_bins=[(-20, -1), (0, 0), (1, 20)],
+        total_controls=["VIX"], bootstrap_reps=0, sample_start=None, sample_end=None,
+    )
+    meta = run_pipeline(root, cfg, stages=["jumps", "event_bins"], update_latest=False)
+    run_dir = Path(meta["run_dir"])
+    jumps = pd.read_csv(run_dir / "tables" / "jump_results.csv")
+    assert set(jumps["series"]) == {"arb_2", "arb_5"}
+    assert (jumps["estimate"] > 2).all()
+    assert {"outcomes", "merge", "jumps+event_bins", "total"}.issubset(meta["timings"])
+    assert "jump_estimator" in {r["name"] for r in meta["instrumentation"]}
+    assert json.loads((run_dir / "run_metadata.json").read_text())["config_hash"] == cfg.to_hash()
+
+
+def _append_days(root: Path, n: int) -> None:
+    series = root / "data" / "series" / "tips_treasury_implied_rf_2010.parquet"
+    event_dir = root / "data" / "raw" / "event_inputs"
+    tips = pd.read_parquet(series)
+    new_dates = pd.bdate_range(tips["date"].max() + pd.offsets.BDay(1), periods=n)
+    extra = pd.DataFrame({"date": new_dates, "arb_2": 25.0 + 0.1 * np.arange(n), "arb_5": 35.0 - 0.1 * np.arange(n)})
+    pd.concat([tips, extra], ignore_index=True).to_parquet(series, index=False)
+    for name, values in [("controls_vix_creditspreads_fred", {"VIX": 20.0, "HY_OAS": 5.0, "BAA10Y": 2.0}),
+                         ("repo_rates_combined", {"SOFR": 1.5, "TGCR": 1.45, "BGCR": 1.45})]:
+        add = pd.DataFrame({"date": new_dates.strftime("%Y-%m-%d"), **values})
+        add.to_csv(event_dir / f"{name}.csv", mode="a", header=False, index=False)
+
+
+def test_incremental_run_refits_only_cells_touching_new_dates(synthetic_repo: Path):
+    cfg = PipelineConfig(
+        strategies=["TIPS"],
+        event_dates=["2020-04-01", "2020-08-03"], windows=[5, 10], event_bins=[(-10, -1), (0, 0), (1, 10)],
+        total_controls=["VIX"], bootstrap_reps=0, sample_start=None, sample_end=None,
+    )
+    stages = ["jumps", "event_bins"]
+    first = run_pipeline(synthetic_repo, cfg, stages=stages, update_latest=False, incremental=True)
+    assert first["incremental"]["mode"] == "full"
+    again = run_pipeline(synthetic_repo, cfg, stages=stages, update_latest=False, incremental=True)
+    assert again["incremental"]["mode"] == "unchanged"
+
+    _append_days(synthetic_repo, 8)
+    inc = run_pipeline(synthetic_repo, cfg, stages=stages, update_latest=False, incremental=True)
+    assert inc["incremental"]["mode"] == "append"
+    # sample ends 6 trading days after 2020-08-03: only its 10-day window and bins reach the new days
+    assert inc["incremental"]["jump_cells_refit"] == 2 and inc["incremental"]["bin_cells_refit"] == 2
+
+    full = run_pipeline(synthetic_repo, cfg, stages=stages, update_latest=False)
+    keys = ["series", "event", "window", "spec"]
+    got = pd.read_csv(Path(inc["run_dir"]) / "tables" / "jump_results.csv").sort_values(keys).reset_index(drop=True)
+    want = pd.read_csv(Path(full["run_dir"]) / "tables" / "jump_results.csv").sort_values(keys).reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, want)
+
+
+def test_runs_accumulate_in_results_warehouse(synthetic_repo: Path):
+    from slr_bucket.warehouse import list_runs, query_results
+
+    base = PipelineConfig(
+        strategies=["TIPS"],
+        event_dates=["2020-04-01"], windows=[5, 10], event_bins=[(-10, -1), (0, 0), (1, 10)],
+        total_controls=["VIX"], bootstrap_reps=0, sample_start=None, sample_end=None,
+    )
+    metas = [run_pipeline(synthetic_repo, cfg, stages=["jumps"], update_latest=False)
+             for cfg in (base, replace(base, hac_lags=2))]
+    warehouse = synthetic_repo / base.output_root / "warehouse"
+    assert len(list_runs(warehouse)) == 2
+
+    rows = query_results(warehouse, "jumps", config_hash=base.to_hash(), series="arb_2", window=10)
+    assert set(rows["spec"]) == {"TOTAL", "DIRECT"} and rows["window"].dtype == "Int64"
+    csv = pd.read_csv(Path(metas[0]["run_dir"]) / "tables" / "jump_results.csv")
+    expected = csv[(csv["series"] == "arb_2") & (csv["window"] == 10)]["estimate"].sort_values().to_numpy()
+    assert np.allclose(rows["estimate"].sort_values().to_numpy(), expected)
+    assert len(query_results(warehouse, "jumps", series=["arb_2", "arb_5"], spec="TOTAL", latest=True)) == 8
+    assert "<sup>" in (Path(metas[1]["run_dir"]) / "tables" / "table2_eventwindow_jumps.html").read_text()
+
+
+def test_warehouse_query_keeps_columns_added_by_later_runs(tmp_path: Path):
+    from slr_bucket.warehouse import append_run, query_results
+
+    row = {"term": "post", "estimate": 1.0, "se": 0.5, "ci_low": 0.0, "ci_high": 2.0, "n": 10}
+    append_run(tmp_path, "aaa", "run1", {"pooled_jumps": pd.DataFrame([row])})
+    append_run(tmp_path, "bbb", "run2", {"pooled_jumps": pd.DataFrame([{**row, "bootstrap_se": 0.6, "bootstrap_p": 0.1}])})
+    every = query_results(tmp_path, "pooled_jumps")
+    assert {"bootstrap_se", "bootstrap_p"} <= set(every.columns) and every["bootstrap_se"].isna().tolist() == [True, False]
+    assert query_results(tmp_path, "pooled_jumps", config_hash="bbb")["bootstrap_p"].tolist() == [0.1]
+    for filters in ({"event": "2099-01-01"}, {"window": 5}):  # pooled_jumps has neither column
+        with pytest.raises(ValueError, match="no column"):
+            query_results(tmp_path, "pooled_jumps", **filters)
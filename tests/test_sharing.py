@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pandas as pd
+from pyarrow.dataset import field as pc_field
+
+from slr_bucket.sharing import PanelStore, export_panel, write_panel_store
+
+
+def test_panel_handle_slices_by_series(tmp_path: Path):
+    panel = pd.DataFrame({
+        "date": pd.to_datetime(["2020-01-02", "2020-01-01", "2020-01-01", "2020-01-02", "2020-01-03"]),
+        "series": ["b", "a", "b", "a", "b"],
+        "y": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    handle = export_panel(panel, tmp_path / "panel.arrow")
+    assert handle.offsets == {"a": (0, 2), "b": (2, 5)}
+
+    sl = pickle.loads(pickle.dumps(handle.select("b", columns=["date", "y"])))
+    out = sl.load()
+    assert list(out.columns) == ["date", "y"]
+    assert out["y"].tolist() == [3.0, 1.0, 5.0]
+    assert handle.read(["a"])["series"].unique().tolist() == ["a"]
+
+
+def test_panel_store_prunes_by_series_and_date(tmp_path: Path):
+    dates = pd.bdate_range("2020-01-01", periods=40)
+    panel = pd.DataFrame({
+        "date": list(dates) * 3,
+        "strategy": ["tips"] * 80 + ["cip"] * 40,
+        "series": ["t1"] * 40 + ["t2/x y"] * 40 + ["c1"] * 40,
+        "y": range(120),
+    }).sample(frac=1.0, random_state=0)
+    store = write_panel_store(panel, tmp_path / "store", rows_per_group=10)
+    assert (tmp_path / "store" / f"part={store.codes['t2/x y']}").is_dir()
+
+    reopened = pickle.loads(pickle.dumps(PanelStore.open(tmp_path / "store")))
+    out = reopened.read(series=["t2/x y"], date_range=("2020-01-10", None))
+    expected = panel[(panel["series"] == "t2/x y") & (panel["date"] >= "2020-01-10")].sort_values("date")
+    assert list(out.columns) == list(panel.columns)
+    assert out["y"].tolist() == expected["y"].tolist()
+
+    fragment = next(iter(store.dataset().get_fragments(filter=pc_field("part") == store.codes["t2/x y"])))
+    assert fragment.metadata.num_row_groups == 4
+    assert store.select("c1", columns=["date", "y"]).load().shape == (40, 2)
+    assert len(store.read()) == 120
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from slr_bucket.outcomes import load_strategy_outcomes
+from slr_bucket.spreads import _rolling_z, build_cip_basis, build_equity_spreads
+
+
+def _raw_quotes(path: Path) -> pd.DataFrame:
+    """Three quotes a day in the Bloomberg pull layout; dividends only on the close row."""
+    days = pd.bdate_range("2020-01-02", "2020-05-29")
+    stamps = pd.DatetimeIndex([d + pd.Timedelta(hours=h) for d in days for h in (10, 13, 16)])
+    close = stamps.hour == 16
+    n = len(stamps)
+    first_ois = stamps.normalize() >= "2020-01-24"  # no rate (so no spread) for the first three weeks
+    front = np.where(stamps.normalize() <= "2020-03-20", "MAR 20", "JUN 20")
+    back = np.where(stamps.normalize() <= "2020-03-20", "JUN 20", "SEP 20")
+    cols = {
+        ("SPX Index", "PX_LAST"): 3000.0 + np.arange(n),
+        ("SPX Index", "INDX_GROSS_DAILY_DIV"): np.where(close, 0.1, np.nan),
+        ("USSOC CMPN Curncy", "PX_LAST"): np.where(close & first_ois, 1.5, np.nan),
+    }
+    for k, spec in ((1, front), (2, back)):
+        cols[(f"ES{k} Index", "PX_LAST")] = 3000.0 + 5 * k + np.arange(n) + np.where(close, 0.5, 0.0)
+        cols[(f"ES{k} Index", "PX_VOLUME")] = 1000.0
+        cols[(f"ES{k} Index", "OPEN_INT")] = 5000.0
+        cols[(f"ES{k} Index", "CURRENT_CONTRACT_MONTH_YR")] = spec
+    raw = pd.DataFrame(cols, index=stamps)
+    raw.columns = pd.MultiIndex.from_tuples(raw.columns)
+    raw.to_parquet(path)
+    return raw
+
+
+def test_streamed_spreads_are_daily_and_batch_size_invariant(tmp_path: Path):
+    raw_path = tmp_path / "equity_spot_bloomberg.parquet"
+    raw = _raw_quotes(raw_path)
+    small = build_equity_spreads(raw_path, tmp_path / "small", indices=["SPX"], batch_rows=7)
+    big = build_equity_spreads(raw_path, tmp_path / "big", indices=["SPX"], batch_rows=10_000)
+    got = pd.read_parquet(small["SPX"])
+    pd.testing.assert_frame_equal(got, pd.read_parquet(big["SPX"]))
+
+    closes = raw[raw.index.hour == 16]
+    assert got["Date"].tolist() == closes.index.normalize().tolist()
+    assert np.allclose(got["Term1_Futures_Price"], closes[("ES1 Index", "PX_LAST")])
+    assert (got["Term1_SettlementDate"].iloc[0] == pd.Timestamp("2020-03-20")) and (got["OIS"].dropna() == 0.015).all()
+    # dividends still to come before the front contract settles: one 0.1 point per business day
+    first = got.iloc[0]
+    assert np.isclose(first["Div_Sum1"], 0.1 * (len(pd.bdate_range(first["Date"], "2020-03-20")) - 1))
+
+    assert got["spread_SPX"].iloc[:16].isna().all() and got["spread_SPX"].iloc[16:].notna().all()
+
+    roll = got["Term1_TTM"] == 0
+    assert roll.any()
+    assert np.allclose(got.loc[~roll, "spread_SPX_filtered"], got.loc[~roll, "spread_SPX"] / 100, equal_nan=True)
+
+    (tmp_path / "small" / "equity_spot_spread_SPX.csv").write_text("Date,spread_SPX\n2020-01-02,1.0\n")
+    loaded = load_strategy_outcomes(tmp_path / "small", "EQUITY_SPX")
+    assert len(loaded) == got["spread_SPX_filtered"].notna().sum()
+
+
+def test_rolling_z_carries_nan_rows_across_batches():
+    values = np.random.default_rng(0).normal(size=300)
+    values[:20] = values[100:110] = np.nan
+    whole, _ = _rolling_z(values, np.array([]), 60)
+    parts, tail = [], np.array([])
+    for i in range(0, len(values), 7):
+        z, tail = _rolling_z(values[i : i + 7], tail, 60)
+        parts.append(z)
+    assert np.allclose(np.concatenate(parts), whole, equal_nan=True)
+
+
+def test_cip_basis_orients_quotes_and_scales_points(tmp_path: Path):
+    dates = pd.to_datetime(["2020-01-02", "2020-01-03"])
+    sheets = {
+        "Spot": pd.DataFrame({"Date": dates, "EUR CMPN Curncy": [1.10, 1.10], "JPY CMPN Curncy": [100.0, 100.0]}),
+        "Forward": pd.DataFrame({"Date": dates, "EUR3M CMPN Curncy": [20.0, 20.0], "JPY3M CMPN Curncy": [-50.0, -50.0]}),
+        "OIS": pd.DataFrame({"Date": dates, "EUR": [0.5, 0.5], "JPY": [-0.1, -0.1], "USD": [2.0, 2.1]}),
+    }
+    raw = tmp_path / "cip_bloomberg.xlsx"
+    with pd.ExcelWriter(raw) as xl:
+        for name, df in sheets.items():
+            df.to_excel(xl, sheet_name=name, index=False)
+    out = pd.read_parquet(build_cip_basis(raw, tmp_path, end="2020-01-02"))
+    assert list(out.columns) == ["Date", "CIP_EUR_ln", "CIP_JPY_ln"] and len(out) == 1
+    # EUR is quoted USD per EUR, so its forward premium flips sign; JPY points are in 1/100 yen
+    assert np.isclose(out["CIP_EUR_ln"].iloc[0], (0.5 + 400 * np.log(1.102 / 1.10) - 2.0) * 100)
+    assert np.isclose(out["CIP_JPY_ln"].iloc[0], (-0.1 - 400 * np.log(99.5 / 100.0) - 2.0) * 100)
+    assert load_strategy_outcomes(tmp_path, "CIP")["series"].tolist() == ["CIP_EUR", "CIP_JPY"]
+    # a different sample is a different build, even though the cache is newer than the workbook
+    assert len(pd.read_parquet(build_cip_basis(raw, tmp_path))) == 2
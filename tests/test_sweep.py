@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from slr_bucket.config import PipelineConfig
+from slr_bucket.sweep import expand_grid, run_sweep
+
+
+def test_expand_grid_rejects_panel_keys():
+    with pytest.raises(ValueError):
+        expand_grid(PipelineConfig(), {"strategies": [["TIPS"], ["CIP"]]})
+
+
+def test_run_sweep_resumes_completed_cells(synthetic_repo: Path, tmp_path: Path):
+    root = synthetic_repo
+    base = PipelineConfig(
+        strategies=["TIPS"],
+        event_dates=["2020-04-01"], windows=[10], event_bins=[(-20, -1), (0, 0), (1, 20)],
+        bootstrap_reps=0, sample_start=None, sample_end=None,
+    )
+    grid = {"hac_lags": [1, 3], "total_controls": [[], ["VIX"]]}
+    out = run_sweep(root, base, grid, out_dir=tmp_path / "sweep")
+    hashes = {v.to_hash() for v in expand_grid(base, grid)}
+    assert set(out.index) == hashes
+    assert set(out["kind"]) == {"jump", "event_bin"}
+
+    cells = sorted((tmp_path / "sweep" / "cells").glob("*.parquet"))
+    mtimes = [p.stat().st_mtime_ns for p in cells]
+    again = run_sweep(root, base, grid, out_dir=tmp_path / "sweep")
+    assert [p.stat().st_mtime_ns for p in cells] == mtimes
+    assert len(again) == len(out)
+
+
+def test_run_sweep_resumes_inside_a_variant(synthetic_repo: Path, tmp_path: Path, monkeypatch):
+    import slr_bucket.sweep as sweep
+
+    base = PipelineConfig(
+        strategies=["TIPS"],
+        event_dates=["2020-04-01"], windows=[10], event_bins=[(-20, -1), (0, 0), (1, 20)],
+        bootstrap_reps=0, sample_start=None, sample_end=None,
+    )
+    grid = {"hac_lags": [1, 3]}
+    full = run_sweep(synthetic_repo, base, grid, out_dir=tmp_path / "full")
+
+    calls = []
+    real = sweep._estimate_series
+
+    def flaky(task):
+        calls.append(task[1]["series"])
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return real(task)
+
+    monkeypatch.setattr(sweep, "_estimate_series", flaky)
+    with pytest.raises(KeyboardInterrupt):
+        run_sweep(synthetic_repo, base, grid, out_dir=tmp_path / "resumed")
+    assert len(list((tmp_path / "resumed" / "cells").glob("*/*.parquet"))) == 1
+
+    calls.clear()
+    monkeypatch.setattr(sweep, "_estimate_series", lambda task: calls.append(task[1]["series"]) or real(task))
+    again = run_sweep(synthetic_repo, base, grid, out_dir=tmp_path / "resumed")
+    assert len(calls) == 3  # 2 variants x 2 series, one cell already on disk
+    assert not list((tmp_path / "resumed" / "cells").glob("*/"))
+    keys = ["config_hash", "series", "kind", "spec", "term"]
+    pd.testing.assert_frame_equal(
+        again.reset_index().sort_values(keys, ignore_index=True), full.reset_index().sort_values(keys, ignore_index=True)
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from slr_bucket.outcomes import load_tips_treasury_arb
+from slr_bucket.units import QuantileSketch, UnitManifest
+
+
+def test_sketch_median_tracks_exact_median_across_chunks():
+    x = np.random.default_rng(0).lognormal(mean=1.0, sigma=2.0, size=50_000) * np.sign(np.arange(50_000) % 3 - 1)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(x, 17):
+        sketch.update(chunk)
+    assert sketch.n == np.count_nonzero(np.isfinite(x))
+    assert abs(np.log(sketch.quantile(0.5) / np.median(np.abs(x)))) < 0.05
+
+
+def test_units_are_per_series_and_reused_from_manifest(tmp_path: Path):
+    dates = pd.bdate_range("2020-01-01", periods=40)
+    path = tmp_path / "tips.csv"
+    # arb_2 is in percent, arb_5 already in bps; pooled, their median would flip arb_5 to percent
+    pd.DataFrame({"date": dates, "arb_2": 0.3, "arb_5": np.r_[np.full(15, 1.0), np.full(25, 30.0)]}).to_csv(path, index=False)
+    units = UnitManifest(tmp_path / "cache" / "units.json", chunk_rows=8)
+    first = load_tips_treasury_arb(path, units=units).groupby("series")["y_bps"].first()
+    assert first["arb_2"] == 30.0 and first["arb_5"] == 1.0
+
+    # recorded decisions (including hand edits) are applied as-is while the file is unchanged
+    manifest = UnitManifest(tmp_path / "cache" / "units.json")
+    manifest.entries[UnitManifest.key(path, "arb_2")].update(unit="bps", scale=1.0)
+    manifest.save()
+    kept = load_tips_treasury_arb(path, units=UnitManifest(tmp_path / "cache" / "units.json"))
+    assert (kept.loc[kept["series"] == "arb_2", "y_bps"] == 0.3).all()
+
+    # a file rebuilt in place is re-inferred instead of reusing the stale scale
+    pd.DataFrame({"date": dates, "arb_2": 0.3, "arb_5": 2.0}).to_csv(path, index=False)
+    again = load_tips_treasury_arb(path, units=UnitManifest(tmp_path / "cache" / "units.json"))
+    assert (again.loc[again["series"] == "arb_5", "y_bps"] == 200.0).all()
+    assert (again.loc[again["series"] == "arb_2", "y_bps"] == 30.0).all()
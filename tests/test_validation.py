@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow as pa
+
+from slr_bucket.validation import history_hash, row_hashes, validate_daily_long, validate_daily_long_report
+
+
+def _legacy(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    out["date"] = pd.to_datetime(out["date"], errors="coerce")
+    out = out.dropna(subset=["date", "tenor", "series", "value"])
+    return out.sort_values(["series", "tenor", "date"]).drop_duplicates(["date", "tenor", "series"], keep="last")
+
+
+def _raw() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": ["2020-01-03", "2020-01-02", "not a date", "2020-01-02", "2020-01-02", "2020-01-06"],
+            "tenor": [2, 2, 2, 2, None, 5],
+            "series": ["b", "a", "a", "a", "a", "b"],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0, None],
+        }
+    )
+
+
+def test_validate_daily_long_matches_legacy_and_reports_drops():
+    df = _raw()
+    out, report = validate_daily_long_report(df)
+    pd.testing.assert_frame_equal(out, _legacy(df))
+    assert report.dropped == {"bad_date": 1, "missing_tenor": 1, "missing_series": 0, "missing_value": 1, "duplicate": 1}
+    assert report.duplicates_by_series == {"a": 1}
+    assert not report.input_sorted and report.rows_out == 2
+
+    chunks = [pa.RecordBatch.from_pandas(df.iloc[:3]), df.iloc[3:]]
+    streamed, chunk_report = validate_daily_long_report(chunks)
+    assert chunk_report.chunks == 2 and chunk_report.dropped == report.dropped
+    assert streamed["value"].tolist() == [4.0, 1.0]
+    assert validate_daily_long_report(out)[1].input_sorted
+    assert validate_daily_long(df).shape == (2, 4)
+
+
+def test_chunked_duplicates_match_across_int_and_float_tenors():
+    first = pd.DataFrame({"date": ["2020-01-02"], "tenor": [2], "series": ["a"], "value": [1.0]})
+    second = pd.DataFrame({"date": ["2020-01-02", "2020-01-03"], "tenor": [2.0, None], "series": ["a", "a"], "value": [2.0, 3.0]})
+    out, report = validate_daily_long_report([pa.RecordBatch.from_pandas(first), second])
+    assert report.dropped["duplicate"] == 1 and out["value"].tolist() == [2.0]
+    pd.testing.assert_frame_equal(out.reset_index(drop=True), validate_daily_long(pd.concat([first, second])).reset_index(drop=True))
+
+
+def test_history_hash_sees_edits_up_to_the_cutoff_only():
+    df = _raw().assign(date=lambda d: pd.to_datetime(d["date"], errors="coerce"))
+    cut = pd.Timestamp("2020-01-03")
+    base = history_hash(row_hashes(df), df["date"], cut)
+    shuffled = df.iloc[::-1]
+    assert history_hash(row_hashes(shuffled), shuffled["date"], cut) == base
+    later = df.copy()
+    later.loc[5, "value"] = 9.0  # 2020-01-06 is after the cutoff
+    assert history_hash(row_hashes(later), later["date"], cut) == base
+    edited = df.copy()
+    edited.loc[1, "value"] = 9.0
+    assert history_hash(row_hashes(edited), edited["date"], cut) != base